@@ -2,54 +2,29 @@
 
 This script demonstrates how to programmatically create a complete
 knowledge graph with skills, scripts, knowledge, and environments.
+
+Nodes are upserted by name with one bulk call per node type and
+relationships are merged in bulk, so the script can be re-run safely and
+costs a handful of round-trips instead of one per node and relationship.
 """
 
 import asyncio
+import sys
 
 from mcp_kg_skills.config import load_config
 from mcp_kg_skills.database.neo4j import Neo4jDatabase
 from mcp_kg_skills.security.secrets import SecretDetector
 from mcp_kg_skills.tools.nodes import NodesTool
-from mcp_kg_skills.tools.relationships import RelationshipsTool
 from mcp_kg_skills.utils.env_file import EnvFileManager
 
-
-async def load_example_data():
-    """Load example data into the knowledge graph."""
-    # Load configuration
-    config = load_config()
-
-    # Initialize database
-    db = Neo4jDatabase(
-        uri=config.database.uri,
-        username=config.database.username,
-        password=config.database.password,
-        database=config.database.database,
-    )
-
-    await db.connect()
-    await db.initialize_schema()
-
-    # Initialize tools
-    env_manager = EnvFileManager(config.execution.env_dir)
-    secret_detector = SecretDetector(config.security.secret_patterns)
-    nodes_tool = NodesTool(db, env_manager, secret_detector)
-    relationships_tool = RelationshipsTool(db)
-
-    print("🚀 Loading example data into MCP Knowledge Graph Skills...")
-
-    # ==========================================================================
-    # Example 1: Web Scraper Skill
-    # ==========================================================================
-    print("\n📦 Creating Web Scraper Skill...")
-
-    web_scraper_skill = await nodes_tool.handle(
-        operation="create",
-        node_type="SKILL",
-        data={
-            "name": "web-scraper",
-            "description": "Web scraping utilities with rate limiting and error handling",
-            "body": """# Web Scraper Skill
+# ==========================================================================
+# Skills
+# ==========================================================================
+SKILLS = [
+    {
+        "name": "web-scraper",
+        "description": "Web scraping utilities with rate limiting and error handling",
+        "body": """# Web Scraper Skill
 
 This skill provides utilities for web scraping with built-in
 rate limiting and error handling.
@@ -64,26 +39,64 @@ rate limiting and error handling.
 - `fetch_html`: Fetch HTML content from a URL
 - `parse_links`: Extract all links from HTML
 """,
-        },
+    },
+    {
+        "name": "data-processing",
+        "description": "Data analysis and processing utilities",
+        "body": """# Data Processing Skill
+
+Utilities for data analysis, transformation, and visualization.
+
+## Features
+- CSV/JSON data loading
+- Data transformation
+- Statistical analysis
+- Basic visualizations
+
+## Scripts
+- `load_csv`: Load CSV data
+- `analyze_data`: Perform statistical analysis
+""",
+    },
+    {
+        "name": "api-client",
+        "description": "REST API client utilities with authentication",
+        "body": """# API Client Skill
+
+Generic REST API client with authentication support.
+
+## Features
+- GET/POST/PUT/DELETE requests
+- Bearer token authentication
+- Request/response logging
+- Error handling
+
+## Scripts
+- `api_get`: Make GET request
+- `api_post`: Make POST request
+""",
+    },
+]
+
+# ==========================================================================
+# Scripts
+# ==========================================================================
+
+
+def _pep723(deps: list[str]) -> str:
+    """Build the PEP 723 metadata header shared by all example scripts."""
+    dep_lines = "\n".join(f'#   "{dep}",' for dep in deps)
+    return (
+        "# /// script\n"
+        '# requires-python = ">=3.12"\n'
+        "# dependencies = [\n"
+        f"{dep_lines}\n"
+        "# ]\n"
+        "# ///\n\n"
     )
-    web_scraper_id = web_scraper_skill["node"]["id"]
-
-    # Create fetch_html script
-    fetch_html_script = await nodes_tool.handle(
-        operation="create",
-        node_type="SCRIPT",
-        data={
-            "name": "fetch_html",
-            "description": "Fetch HTML content from a URL with error handling",
-            "function_signature": "fetch_html(url: str, timeout: int = 30) -> str",
-            "body": """# /// script
-# requires-python = ">=3.12"
-# dependencies = [
-#   "requests>=2.31.0",
-# ]
-# ///
-
-import os
+
+
+FETCH_HTML_SRC = """import os
 import requests
 from time import sleep
 
@@ -107,27 +120,9 @@ def fetch_html(url: str, timeout: int = 30) -> str:
     response.raise_for_status()
 
     return response.text
-""",
-        },
-    )
-    fetch_html_id = fetch_html_script["node"]["id"]
-
-    # Create parse_links script
-    parse_links_script = await nodes_tool.handle(
-        operation="create",
-        node_type="SCRIPT",
-        data={
-            "name": "parse_links",
-            "description": "Extract all links from HTML content",
-            "function_signature": "parse_links(html: str) -> list[str]",
-            "body": """# /// script
-# requires-python = ">=3.12"
-# dependencies = [
-#   "beautifulsoup4>=4.12.0",
-# ]
-# ///
-
-from bs4 import BeautifulSoup
+"""
+
+PARSE_LINKS_SRC = """from bs4 import BeautifulSoup
 
 def parse_links(html: str) -> list[str]:
     \"\"\"Extract all links from HTML.
@@ -145,96 +140,9 @@ def parse_links(html: str) -> list[str]:
         links.append(link['href'])
 
     return links
-""",
-        },
-    )
-    parse_links_id = parse_links_script["node"]["id"]
-
-    # Create scraper environment
-    scraper_env = await nodes_tool.handle(
-        operation="create",
-        node_type="ENV",
-        data={
-            "name": "scraper-config",
-            "description": "Web scraper configuration",
-            "variables": {
-                "USER_AGENT": "MCP-KG-Skills/1.0",
-                "RATE_LIMIT_SECONDS": "1",
-                "TIMEOUT_SECONDS": "30",
-            },
-        },
-    )
-    scraper_env_id = scraper_env["node"]["id"]
-
-    # Link scripts to skill
-    await relationships_tool.handle(
-        operation="create",
-        relationship_type="CONTAINS",
-        source_id=web_scraper_id,
-        target_id=fetch_html_id,
-    )
-    await relationships_tool.handle(
-        operation="create",
-        relationship_type="CONTAINS",
-        source_id=web_scraper_id,
-        target_id=parse_links_id,
-    )
-
-    # Link environment to scripts
-    await relationships_tool.handle(
-        operation="create",
-        relationship_type="CONTAINS",
-        source_id=fetch_html_id,
-        target_id=scraper_env_id,
-    )
-
-    print(f"✅ Created Web Scraper Skill (ID: {web_scraper_id})")
-
-    # ==========================================================================
-    # Example 2: Data Processing Skill
-    # ==========================================================================
-    print("\n📊 Creating Data Processing Skill...")
-
-    data_skill = await nodes_tool.handle(
-        operation="create",
-        node_type="SKILL",
-        data={
-            "name": "data-processing",
-            "description": "Data analysis and processing utilities",
-            "body": """# Data Processing Skill
-
-Utilities for data analysis, transformation, and visualization.
-
-## Features
-- CSV/JSON data loading
-- Data transformation
-- Statistical analysis
-- Basic visualizations
+"""
 
-## Scripts
-- `load_csv`: Load CSV data
-- `analyze_data`: Perform statistical analysis
-""",
-        },
-    )
-    data_skill_id = data_skill["node"]["id"]
-
-    # Create load_csv script
-    load_csv_script = await nodes_tool.handle(
-        operation="create",
-        node_type="SCRIPT",
-        data={
-            "name": "load_csv",
-            "description": "Load CSV file into a pandas DataFrame",
-            "function_signature": "load_csv(filepath: str) -> dict",
-            "body": """# /// script
-# requires-python = ">=3.12"
-# dependencies = [
-#   "pandas>=2.0.0",
-# ]
-# ///
-
-import pandas as pd
+LOAD_CSV_SRC = """import pandas as pd
 
 def load_csv(filepath: str) -> dict:
     \"\"\"Load CSV file and return basic info.
@@ -253,66 +161,9 @@ def load_csv(filepath: str) -> dict:
         'dtypes': df.dtypes.to_dict(),
         'head': df.head().to_dict(),
     }
-""",
-        },
-    )
-    load_csv_id = load_csv_script["node"]["id"]
-
-    # Link script to skill
-    await relationships_tool.handle(
-        operation="create",
-        relationship_type="CONTAINS",
-        source_id=data_skill_id,
-        target_id=load_csv_id,
-    )
-
-    print(f"✅ Created Data Processing Skill (ID: {data_skill_id})")
-
-    # ==========================================================================
-    # Example 3: API Client Skill
-    # ==========================================================================
-    print("\n🌐 Creating API Client Skill...")
-
-    api_skill = await nodes_tool.handle(
-        operation="create",
-        node_type="SKILL",
-        data={
-            "name": "api-client",
-            "description": "REST API client utilities with authentication",
-            "body": """# API Client Skill
-
-Generic REST API client with authentication support.
-
-## Features
-- GET/POST/PUT/DELETE requests
-- Bearer token authentication
-- Request/response logging
-- Error handling
+"""
 
-## Scripts
-- `api_get`: Make GET request
-- `api_post`: Make POST request
-""",
-        },
-    )
-    api_skill_id = api_skill["node"]["id"]
-
-    # Create api_get script
-    api_get_script = await nodes_tool.handle(
-        operation="create",
-        node_type="SCRIPT",
-        data={
-            "name": "api_get",
-            "description": "Make authenticated GET request to API",
-            "function_signature": "api_get(endpoint: str, params: dict = None) -> dict",
-            "body": """# /// script
-# requires-python = ">=3.12"
-# dependencies = [
-#   "requests>=2.31.0",
-# ]
-# ///
-
-import os
+API_GET_SRC = """import os
 import requests
 
 def api_get(endpoint: str, params: dict = None) -> dict:
@@ -337,54 +188,66 @@ def api_get(endpoint: str, params: dict = None) -> dict:
     response.raise_for_status()
 
     return response.json()
-""",
+"""
+
+SCRIPTS = [
+    {
+        "name": "fetch_html",
+        "description": "Fetch HTML content from a URL with error handling",
+        "function_signature": "fetch_html(url: str, timeout: int = 30) -> str",
+        "body": _pep723(["requests>=2.31.0"]) + FETCH_HTML_SRC,
+    },
+    {
+        "name": "parse_links",
+        "description": "Extract all links from HTML content",
+        "function_signature": "parse_links(html: str) -> list[str]",
+        "body": _pep723(["beautifulsoup4>=4.12.0"]) + PARSE_LINKS_SRC,
+    },
+    {
+        "name": "load_csv",
+        "description": "Load CSV file into a pandas DataFrame",
+        "function_signature": "load_csv(filepath: str) -> dict",
+        "body": _pep723(["pandas>=2.0.0"]) + LOAD_CSV_SRC,
+    },
+    {
+        "name": "api_get",
+        "description": "Make authenticated GET request to API",
+        "function_signature": "api_get(endpoint: str, params: dict = None) -> dict",
+        "body": _pep723(["requests>=2.31.0"]) + API_GET_SRC,
+    },
+]
+
+# ==========================================================================
+# Environments
+# ==========================================================================
+ENVS = [
+    {
+        "name": "scraper-config",
+        "description": "Web scraper configuration",
+        "variables": {
+            "USER_AGENT": "MCP-KG-Skills/1.0",
+            "RATE_LIMIT_SECONDS": "1",
+            "TIMEOUT_SECONDS": "30",
         },
-    )
-    api_get_id = api_get_script["node"]["id"]
-
-    # Create API environment (with secret)
-    api_env = await nodes_tool.handle(
-        operation="create",
-        node_type="ENV",
-        data={
-            "name": "api-credentials",
-            "description": "API authentication credentials",
-            "variables": {
-                "API_BASE_URL": "https://api.example.com",
-                "API_KEY": "your-api-key-here",  # Will be marked as secret
-            },
+    },
+    {
+        "name": "api-credentials",
+        "description": "API authentication credentials",
+        "variables": {
+            "API_BASE_URL": "https://api.example.com",
+            "API_KEY": "your-api-key-here",  # Will be marked as secret
         },
-    )
-    api_env_id = api_env["node"]["id"]
-
-    # Link everything
-    await relationships_tool.handle(
-        operation="create",
-        relationship_type="CONTAINS",
-        source_id=api_skill_id,
-        target_id=api_get_id,
-    )
-    await relationships_tool.handle(
-        operation="create",
-        relationship_type="CONTAINS",
-        source_id=api_get_id,
-        target_id=api_env_id,
-    )
-
-    print(f"✅ Created API Client Skill (ID: {api_skill_id})")
-
-    # ==========================================================================
-    # Create Knowledge Documentation
-    # ==========================================================================
-    print("\n📚 Creating Knowledge Documentation...")
-
-    best_practices = await nodes_tool.handle(
-        operation="create",
-        node_type="KNOWLEDGE",
-        data={
-            "name": "best-practices",
-            "description": "Best practices for using MCP KG Skills",
-            "body": """# Best Practices
+    },
+]
+
+# ==========================================================================
+# Knowledge Documentation
+# ==========================================================================
+KNOWLEDGE = [
+    {
+        "name": "best-practices",
+        "description": "Best practices for using MCP KG Skills",
+        "body": """# Best Practices
 
 ## Organizing Skills
 
@@ -411,64 +274,127 @@ def api_get(endpoint: str, params: dict = None) -> dict:
 2. **Test Composition**: Test scripts working together
 3. **Error Cases**: Test error handling paths
 """,
-        },
-    )
+    },
+]
+
+NODES = {
+    "SKILL": SKILLS,
+    "SCRIPT": SCRIPTS,
+    "ENV": ENVS,
+    "KNOWLEDGE": KNOWLEDGE,
+}
+
+# ==========================================================================
+# Relationships: (source name, target name, properties) keyed by type
+# ==========================================================================
+RELATIONSHIPS = {
+    "CONTAINS": [
+        # Web scraper skill
+        ("web-scraper", "fetch_html", None),
+        ("web-scraper", "parse_links", None),
+        ("fetch_html", "scraper-config", None),
+        # Data processing skill
+        ("data-processing", "load_csv", None),
+        # API client skill
+        ("api-client", "api_get", None),
+        ("api_get", "api-credentials", None),
+        # Knowledge documentation
+        ("web-scraper", "best-practices", None),
+    ],
+    "RELATE_TO": [
+        # Web scraper relates to data processing (scrape -> process data)
+        (
+            "web-scraper",
+            "data-processing",
+            {"reason": "Web scraped data often needs processing"},
+        ),
+    ],
+}
 
-    await relationships_tool.handle(
-        operation="create",
-        relationship_type="CONTAINS",
-        source_id=web_scraper_id,
-        target_id=best_practices["node"]["id"],
-    )
 
-    print("✅ Created Knowledge Documentation")
+async def load_example_data():
+    """Load example data into the knowledge graph."""
+    # Load configuration
+    config = load_config()
 
-    # ==========================================================================
-    # Create Cross-Skill Relationships
-    # ==========================================================================
-    print("\n🔗 Creating Cross-Skill Relationships...")
-
-    # Web scraper relates to data processing (scrape -> process data)
-    await relationships_tool.handle(
-        operation="create",
-        relationship_type="RELATE_TO",
-        source_id=web_scraper_id,
-        target_id=data_skill_id,
-        properties={"reason": "Web scraped data often needs processing"},
+    # Initialize database
+    db = Neo4jDatabase(
+        uri=config.database.uri,
+        username=config.database.username,
+        password=config.database.password,
+        database=config.database.database,
     )
 
-    print("✅ Created cross-skill relationships")
+    await db.connect()
+    await db.initialize_schema()
+
+    # Initialize tools
+    env_manager = EnvFileManager(config.execution.env_dir)
+    secret_detector = SecretDetector(config.security.secret_matcher)
+    nodes_tool = NodesTool(db, env_manager, secret_detector)
+
+    print("🚀 Loading example data into MCP Knowledge Graph Skills...")
 
     # ==========================================================================
-    # Summary
+    # Create or update nodes (one bulk upsert per node type), then link them
     # ==========================================================================
-    print("\n" + "=" * 60)
-    print("✨ Example data loaded successfully!")
-    print("=" * 60)
-    print("\n📊 Summary:")
-    print("  - Skills: 3")
-    print("  - Scripts: 5")
-    print("  - Environments: 2")
-    print("  - Knowledge: 1")
-
-    print("\n💡 Try these queries:")
-    print("\n  # List all skills")
-    print("  MATCH (s:SKILL) RETURN s.name, s.description")
-    print("\n  # Find scripts in web-scraper skill")
-    print("  MATCH (s:SKILL {name: 'web-scraper'})-[:CONTAINS]->(script:SCRIPT)")
-    print("  RETURN script.name, script.description")
-    print("\n  # Execute web scraping")
-    print("  execute(")
-    print("    imports=['fetch_html', 'parse_links'],")
-    print("    code='''")
-    print("html = fetch_html('https://example.com')")
-    print("links = parse_links(html)")
-    print("print(f'Found {len(links)} links')")
-    print("'''")
-    print("  )")
+    print("\n📦 Loading skills, scripts, environments and knowledge...")
+
+    ids: dict[str, str] = {}
+    for node_type, items in NODES.items():
+        result = await nodes_tool.upsert_nodes_bulk(node_type, items)
+        ids.update(result["ids"])
+
+    relationship_count = 0
+    for rel_type, edges in RELATIONSHIPS.items():
+        relationship_count += await db.create_relationships_bulk(
+            rel_type,
+            [(ids[source], ids[target], properties) for source, target, properties in edges],
+            merge=True,
+        )
+
+    print(f"✅ Loaded {len(ids)} nodes and {relationship_count} relationships")
 
     await db.disconnect()
-    print("\n🎉 Done!")
+
+    # ==========================================================================
+    # Summary (written in one go rather than one print per line)
+    # ==========================================================================
+    summary = [
+        "",
+        "=" * 60,
+        "✨ Example data loaded successfully!",
+        "=" * 60,
+        "",
+        "📊 Summary:",
+        f"  - Skills: {len(SKILLS)}",
+        f"  - Scripts: {len(SCRIPTS)}",
+        f"  - Environments: {len(ENVS)}",
+        f"  - Knowledge: {len(KNOWLEDGE)}",
+        "",
+        "💡 Try these queries:",
+        "",
+        "  # List all skills",
+        "  MATCH (s:SKILL) RETURN s.name, s.description",
+        "",
+        "  # Find scripts in web-scraper skill",
+        "  MATCH (s:SKILL {name: 'web-scraper'})-[:CONTAINS]->(script:SCRIPT)",
+        "  RETURN script.name, script.description",
+        "",
+        "  # Execute web scraping",
+        "  execute(",
+        "    imports=['fetch_html', 'parse_links'],",
+        "    code='''",
+        "html = fetch_html('https://example.com')",
+        "links = parse_links(html)",
+        "print(f'Found {len(links)} links')",
+        "'''",
+        "  )",
+        "",
+        "🎉 Done!",
+    ]
+    sys.stdout.write("\n".join(summary) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -1,19 +1,38 @@
 """Configuration management for MCP Knowledge Graph Skills."""
 
+import asyncio
+import fnmatch
+import functools
 import logging
+import mmap
 import os
 import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .exceptions import ConfigurationError
+from .security.secrets import SecretMatcher
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Pattern for ${VAR_NAME} or $VAR_NAME
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}|\$([A-Z_][A-Z0-9_]*)")
+
+
+def _has_glob_chars(pattern: str) -> bool:
+    """Check whether a glob fragment contains any wildcard characters."""
+    return any(char in pattern for char in "*?[")
+
 
 class DatabaseConfig(BaseSettings):
     """Neo4j database configuration."""
@@ -25,6 +44,44 @@ class DatabaseConfig(BaseSettings):
     username: str = Field(default="neo4j", description="Database username")
     password: str = Field(..., description="Database password")
     database: str = Field(default="neo4j", description="Database name")
+    max_connection_pool_size: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum number of connections in the driver pool",
+    )
+    connection_acquisition_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds to wait for a connection from the pool",
+    )
+    max_connection_lifetime: int = Field(
+        default=3600,
+        ge=1,
+        description="Seconds before a pooled connection is replaced",
+    )
+    connection_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait when opening a new connection",
+    )
+    cache_size: int = Field(
+        default=10_000,
+        ge=1,
+        description="Maximum entries in each in-process read cache",
+    )
+    cache_ttl: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds a cached node lookup stays valid",
+    )
+    cache_queries: bool = Field(
+        default=False,
+        description="Cache results of read-only queries until the next write",
+    )
+    warm_up: bool = Field(
+        default=True,
+        description="Plan prebuilt queries and open pooled connections on connect",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="NEO4J_",
@@ -55,13 +112,22 @@ class ExecutionConfig(BaseSettings):
         le=3600,
         description="Maximum allowed execution timeout",
     )
+    composite_cache_size: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum generated composite scripts kept in the cache directory",
+    )
 
     @field_validator("cache_dir", "env_dir", mode="before")
     @classmethod
     def expand_path(cls, v: Any) -> Path:
-        """Expand and resolve path."""
+        """Expand ``~`` and make the path absolute.
+
+        Uses pure path arithmetic; symlinks are not resolved, which avoids
+        the stat calls ``Path.resolve()`` makes on every config load.
+        """
         if isinstance(v, str):
-            return Path(v).expanduser().resolve()
+            return Path(os.path.abspath(os.path.expanduser(v)))
         return v
 
     model_config = SettingsConfigDict(
@@ -88,11 +154,49 @@ class SecurityConfig(BaseSettings):
         description="Patterns for detecting secret variable names",
     )
 
+    _secret_matcher: SecretMatcher = PrivateAttr()
+
     model_config = SettingsConfigDict(
         env_prefix="SECURITY_",
         case_sensitive=False,
     )
 
+    def model_post_init(self, __context: Any) -> None:
+        """Compile all secret patterns into a single matcher.
+
+        Patterns starting with ``^`` are treated as regular expressions, all
+        others as globs (``*_KEY``) that must match the whole name.
+        """
+        # Plain "PREFIX*" / "*SUFFIX" globs become literal startswith/endswith
+        # checks; only the remaining patterns go through the regex engine
+        regex_patterns = []
+        for pattern in self.secret_patterns:
+            if pattern.startswith("^"):
+                regex_patterns.append(pattern)
+            elif pattern.startswith("*") and not _has_glob_chars(pattern[1:]):
+                regex_patterns.append(f"{re.escape(pattern[1:])}$")
+            elif pattern.endswith("*") and not _has_glob_chars(pattern[:-1]):
+                regex_patterns.append(f"^{re.escape(pattern[:-1])}")
+            else:
+                regex_patterns.append(f"^{fnmatch.translate(pattern)}")
+        self._secret_matcher = SecretMatcher.from_patterns(regex_patterns)
+
+    @property
+    def secret_matcher(self) -> SecretMatcher:
+        """Compiled matcher for any secret variable name."""
+        return self._secret_matcher
+
+    def match(self, name: str) -> bool:
+        """Check if a variable name matches any secret pattern.
+
+        Args:
+            name: Variable name to check
+
+        Returns:
+            True if the name is a secret, False otherwise
+        """
+        return self._secret_matcher.match(name)
+
 
 class LoggingConfig(BaseSettings):
     """Logging configuration."""
@@ -122,6 +226,21 @@ class LoggingConfig(BaseSettings):
     )
 
 
+@dataclass(slots=True, frozen=True)
+class RuntimeConfig:
+    """Immutable snapshot of the settings read on every request.
+
+    Built once at startup by ``AppConfig.snapshot()`` so hot paths read plain
+    slots instead of going through the settings models.
+    """
+
+    secret_matcher: SecretMatcher
+    cache_dir: Path
+    env_dir: Path
+    default_timeout: int
+    max_timeout: int
+
+
 class AppConfig(BaseSettings):
     """Main application configuration."""
 
@@ -167,20 +286,30 @@ class AppConfig(BaseSettings):
             raise ConfigurationError(f"Configuration file not found: {config_path}")
 
         try:
-            with open(config_path) as f:
-                raw_content = f.read()
-
             # Substitute environment variables
-            content = cls._substitute_env_vars(raw_content)
+            content = cls._substitute_env_vars(cls._read_file(config_path))
 
             # Parse YAML
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=_YamlLoader)
 
             if not data:
                 raise ConfigurationError("Configuration file is empty")
 
-            # Create config from dict
-            return cls(**data)
+            # Build each section exactly once; the top-level model receives
+            # ready instances and doesn't validate them again. Values from the
+            # file take precedence, environment variables only fill gaps.
+            sections: dict[str, type[BaseSettings]] = {
+                "database": DatabaseConfig,
+                "execution": ExecutionConfig,
+                "security": SecurityConfig,
+                "logging": LoggingConfig,
+            }
+            return cls.model_validate(
+                {
+                    name: section.model_validate(data[name]) if name in data else section()
+                    for name, section in sections.items()
+                }
+            )
 
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML in config file: {e}")
@@ -206,8 +335,37 @@ class AppConfig(BaseSettings):
                 logger.warning(f"Configuration file not found: {config_path}. Using defaults.")
 
         logger.info("Using default configuration")
+        return cls.from_env()
+
+    @classmethod
+    def from_env(cls) -> "AppConfig":
+        """Build configuration from defaults and environment variables only.
+
+        Returns:
+            AppConfig instance
+        """
         return cls()
 
+    @staticmethod
+    def _read_file(config_path: Path) -> str:
+        """Read a configuration file through a read-only memory map.
+
+        Mapping the file avoids copying it into an intermediate buffer
+        before decoding.
+
+        Args:
+            config_path: Path to the configuration file
+
+        Returns:
+            Decoded file content
+        """
+        with open(config_path, "rb") as f:
+            # Empty files cannot be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return ""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return str(mm, "utf-8")
+
     @staticmethod
     def _substitute_env_vars(content: str) -> str:
         """Substitute environment variables in configuration content.
@@ -220,8 +378,9 @@ class AppConfig(BaseSettings):
         Returns:
             Content with environment variables substituted
         """
-        # Pattern for ${VAR_NAME} or $VAR_NAME
-        pattern = r"\$\{([^}]+)\}|\$([A-Z_][A-Z0-9_]*)"
+        # Most configs have no variables at all
+        if "$" not in content:
+            return content
 
         def replace_var(match: re.Match) -> str:
             var_name = match.group(1) or match.group(2)
@@ -233,7 +392,21 @@ class AppConfig(BaseSettings):
 
             return value
 
-        return re.sub(pattern, replace_var, content)
+        return _ENV_VAR_RE.sub(replace_var, content)
+
+    def snapshot(self) -> RuntimeConfig:
+        """Capture the runtime settings as an immutable snapshot.
+
+        Returns:
+            RuntimeConfig with the secret matcher, directories and timeouts
+        """
+        return RuntimeConfig(
+            secret_matcher=self.security.secret_matcher,
+            cache_dir=self.execution.cache_dir,
+            env_dir=self.execution.env_dir,
+            default_timeout=self.execution.default_timeout,
+            max_timeout=self.execution.max_timeout,
+        )
 
     def setup_logging(self) -> None:
         """Configure Python logging based on settings."""
@@ -249,6 +422,17 @@ class AppConfig(BaseSettings):
         self.execution.env_dir.mkdir(parents=True, exist_ok=True)
         logger.info("Ensured all required directories exist")
 
+    async def ensure_directories_async(self) -> None:
+        """Create necessary directories without blocking the event loop.
+
+        Both directories are created concurrently in worker threads.
+        """
+        await asyncio.gather(
+            asyncio.to_thread(self.execution.cache_dir.mkdir, parents=True, exist_ok=True),
+            asyncio.to_thread(self.execution.env_dir.mkdir, parents=True, exist_ok=True),
+        )
+        logger.info("Ensured all required directories exist")
+
 
 def get_default_config_path() -> Path:
     """Get the default configuration file path.
@@ -262,6 +446,10 @@ def get_default_config_path() -> Path:
 def load_config(config_path: Path | str | None = None) -> AppConfig:
     """Load application configuration.
 
+    Configurations are cached per resolved file path, so repeated calls do not
+    re-read the YAML file or re-scan the environment. Call
+    ``clear_config_cache()`` to pick up changes.
+
     Args:
         config_path: Optional path to configuration file.
                     If None, uses default path.
@@ -272,4 +460,15 @@ def load_config(config_path: Path | str | None = None) -> AppConfig:
     if config_path is None:
         config_path = get_default_config_path()
 
+    return _load_config_cached(str(Path(config_path).resolve()))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path: str) -> AppConfig:
+    """Load configuration for a normalized path (cached)."""
     return AppConfig.load_from_file_or_defaults(config_path)
+
+
+def clear_config_cache() -> None:
+    """Discard cached configurations so the next load re-reads them."""
+    _load_config_cached.cache_clear()
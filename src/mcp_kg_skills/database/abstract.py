@@ -3,6 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from ..models import BulkLoadPlan
+
 
 class DatabaseInterface(ABC):
     """Abstract interface for database operations.
@@ -30,7 +32,8 @@ class DatabaseInterface(ABC):
         """Initialize database schema (constraints, indexes).
 
         Creates:
-        - Unique constraints on node names (SKILL, SCRIPT, ENV)
+        - Unique constraints on node names for every node type, which also
+          serve as the index for lookups and MERGE by name
         - Indexes on node IDs and timestamps
         """
         pass
@@ -64,11 +67,72 @@ class DatabaseInterface(ABC):
         pass
 
     @abstractmethod
-    async def read_node(self, node_id: str) -> dict[str, Any] | None:
+    async def create_nodes_bulk(
+        self, node_type: str, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Create multiple nodes of the same type in a single round-trip.
+
+        Args:
+            node_type: Type of node (SKILL, KNOWLEDGE, SCRIPT, ENV)
+            rows: List of node property dictionaries
+
+        Returns:
+            Created nodes, in the same order as ``rows``
+
+        Raises:
+            NodeAlreadyExistsError: If any node name already exists (no nodes are created)
+            ValidationError: If data is invalid
+        """
+        pass
+
+    @abstractmethod
+    async def upsert_nodes_bulk(
+        self, node_type: str, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Create or update many nodes of one type, matched by name.
+
+        Rows whose name doesn't exist yet are created as-is. Rows matching an
+        existing node update its properties but keep its ID and created_at,
+        so repeated loads of the same data are idempotent.
+
+        Args:
+            node_type: Type of node (SKILL, KNOWLEDGE, SCRIPT, ENV)
+            rows: Node properties for each node; every row needs a name
+
+        Returns:
+            The created or updated nodes in input order
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_load(self, plan: BulkLoadPlan) -> dict[str, str]:
+        """Create all nodes and relationships of a plan in one transaction.
+
+        Either everything in the plan is created or nothing is.
+
+        Args:
+            plan: Nodes keyed by type and relationships referencing nodes by name
+
+        Returns:
+            Created node IDs keyed by node name
+
+        Raises:
+            NodeAlreadyExistsError: If any node name already exists
+            CircularDependencyError: If the plan's CONTAINS relationships form a cycle
+            ValidationError: If the plan is inconsistent (duplicate or unknown names)
+        """
+        pass
+
+    @abstractmethod
+    async def read_node(self, node_id: str, node_type: str | None = None) -> dict[str, Any] | None:
         """Retrieve a node by ID.
 
+        Passing the node type when it is known lets the backend look the ID up
+        in that type's index only.
+
         Args:
             node_id: Node identifier
+            node_type: Optional node type; nodes of other types are not matched
 
         Returns:
             Node properties or None if not found
@@ -89,12 +153,42 @@ class DatabaseInterface(ABC):
         pass
 
     @abstractmethod
-    async def update_node(self, node_id: str, data: dict[str, Any]) -> dict[str, Any]:
+    async def read_nodes_by_names(
+        self, node_type: str, names: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve several nodes of one type by name in a single query.
+
+        Args:
+            node_type: Type of node
+            names: Node names to look up
+
+        Returns:
+            Node properties keyed by name; names that don't exist are omitted
+        """
+        pass
+
+    @abstractmethod
+    async def read_nodes_by_ids(self, node_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Retrieve several nodes by ID in a single query.
+
+        Args:
+            node_ids: Node identifiers to look up
+
+        Returns:
+            Node properties keyed by ID; IDs that don't exist are omitted
+        """
+        pass
+
+    @abstractmethod
+    async def update_node(
+        self, node_id: str, data: dict[str, Any], node_type: str | None = None
+    ) -> dict[str, Any]:
         """Update an existing node.
 
         Args:
             node_id: Node identifier
             data: Properties to update
+            node_type: Optional node type; nodes of other types are not matched
 
         Returns:
             Updated node with all properties
@@ -106,11 +200,12 @@ class DatabaseInterface(ABC):
         pass
 
     @abstractmethod
-    async def delete_node(self, node_id: str) -> bool:
+    async def delete_node(self, node_id: str, node_type: str | None = None) -> bool:
         """Delete a node and all its relationships.
 
         Args:
             node_id: Node identifier
+            node_type: Optional node type; nodes of other types are not matched
 
         Returns:
             True if node was deleted, False if not found
@@ -124,17 +219,50 @@ class DatabaseInterface(ABC):
         filters: dict[str, Any] | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[dict[str, Any]]:
         """List nodes of a specific type with optional filtering.
 
+        Nodes are returned newest first, each with its ``created_at``. For
+        deep pagination pass ``encode_cursor`` of the last node of the
+        previous page as ``cursor``; the page then starts right after that
+        node at index-seek cost instead of skipping ``offset`` rows, even if
+        the node was deleted since.
+
         Args:
             node_type: Type of nodes to list
-            filters: Optional filter criteria (name, created_after, created_before)
+            filters: Optional filter criteria (name, name_prefix, created_after,
+                created_before). ``name`` is a fuzzy substring match that has to
+                look at every node of the type; ``name_prefix`` is an exact,
+                case-sensitive prefix that can be answered from the name index.
             limit: Maximum number of results
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when cursor is given)
+            cursor: Cursor from ``utils.pagination.encode_cursor``
 
         Returns:
             List of nodes matching criteria
+
+        Raises:
+            ValidationError: If the cursor is malformed
+        """
+        pass
+
+    @abstractmethod
+    async def list_nodes_columnar(self, node_type: str, fields: list[str]) -> dict[str, list[Any]]:
+        """Export selected fields of every node of a type, one list per field.
+
+        Meant for bulk exports and analytics: only the requested fields are
+        read, and each comes back as a column that can be scanned (or turned
+        into an array) without per-node dict lookups. Rows are in
+        ``list_nodes`` order, newest first, and position ``i`` of every
+        column belongs to the same node.
+
+        Args:
+            node_type: Type of nodes to export
+            fields: Node properties to export; missing values are None
+
+        Returns:
+            List of values keyed by field name
         """
         pass
 
@@ -165,6 +293,32 @@ class DatabaseInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_relationships_bulk(
+        self,
+        rel_type: str,
+        edges: list[tuple[str, str, dict[str, Any] | None]],
+        merge: bool = False,
+    ) -> int:
+        """Create many relationships of one type in a single transaction.
+
+        Args:
+            rel_type: Relationship type (CONTAINS, RELATE_TO)
+            edges: (source ID, target ID, optional properties) per relationship
+            merge: Skip edges that already exist between the same nodes
+                instead of creating a duplicate; existing edges are left as is
+
+        Returns:
+            Number of relationships created (or, with merge, created or
+            already present)
+
+        Raises:
+            NodeNotFoundError: If any source or target node is not found
+            CircularDependencyError: If any CONTAINS edge would create a cycle;
+                no relationships are created in that case
+        """
+        pass
+
     @abstractmethod
     async def delete_relationship(self, rel_id: str) -> bool:
         """Delete a relationship by ID.
@@ -204,18 +358,23 @@ class DatabaseInterface(ABC):
         rel_type: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[dict[str, Any]]:
-        """List relationships matching criteria.
+        """List relationships matching criteria, newest first.
 
         Args:
             source_id: Optional source node filter
             target_id: Optional target node filter
             rel_type: Optional relationship type filter
             limit: Maximum number of results
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when cursor is given)
+            cursor: Cursor from ``utils.pagination.encode_cursor``
 
         Returns:
             List of relationships
+
+        Raises:
+            ValidationError: If the cursor is malformed
         """
         pass
 
@@ -238,6 +397,7 @@ class DatabaseInterface(ABC):
         node_id: str,
         rel_type: str | None = None,
         direction: str = "outgoing",
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """Get nodes connected to a given node.
 
@@ -245,6 +405,7 @@ class DatabaseInterface(ABC):
             node_id: Node identifier
             rel_type: Optional relationship type filter
             direction: Direction to traverse ('outgoing', 'incoming', 'both')
+            limit: Maximum number of nodes to return (default: all)
 
         Returns:
             List of connected nodes
@@ -1,13 +1,27 @@
 """Neo4j database implementation for MCP Knowledge Graph Skills."""
 
+import asyncio
+import copy
+import hashlib
 import json
 import logging
+import uuid
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime
 from typing import Any
 
-from neo4j import AsyncDriver, AsyncGraphDatabase
+from cachetools import TTLCache
+from neo4j import (
+    READ_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    Record,
+    RoutingControl,
+)
 from neo4j.exceptions import (
     ConstraintError,
+    DriverError,
     Neo4jError,
     ServiceUnavailable,
 )
@@ -19,7 +33,12 @@ from ..exceptions import (
     InvalidQueryError,
     NodeAlreadyExistsError,
     NodeNotFoundError,
+    ValidationError,
 )
+from ..models import BulkLoadPlan, NodeType, RelationshipType
+from ..utils import json_codec
+from ..utils.cypher import find_volatile_call, find_write_keyword
+from ..utils.pagination import decode_cursor
 from .abstract import DatabaseInterface
 
 logger = logging.getLogger(__name__)
@@ -27,6 +46,246 @@ logger = logging.getLogger(__name__)
 # Fields that contain nested structures and need JSON serialization
 JSON_SERIALIZED_FIELDS = {"variables", "secret_keys", "properties"}
 
+# Rows sent per UNWIND statement by the bulk methods, which keeps request
+# messages and per-statement memory bounded for very large batches
+_BULK_CHUNK_SIZE = 10_000
+
+# Result sets larger than this are converted to dicts in a worker thread so
+# a big listing does not stall other requests on the event loop
+_OFFLOAD_THRESHOLD = 500
+
+
+def _match_by_id(var: str, id_expr: str, label: str | None = None, scope: str = "") -> str:
+    """Build a clause binding ``var`` to the node whose ``id`` is ``id_expr``.
+
+    An unlabeled ``MATCH (n {id: ...})`` can't use the per-label ID indexes
+    and scans every node. Without a label, each label's index is probed in a
+    UNION subquery instead.
+
+    Args:
+        var: Variable to bind
+        id_expr: Cypher expression holding the ID (e.g. ``$node_id``)
+        label: Node label, if known
+        scope: Outer variables the subquery needs (e.g. ``rel``)
+
+    Returns:
+        MATCH or CALL clause
+    """
+    if label:
+        return f"MATCH ({var}:{label} {{id: {id_expr}}})"
+    with_clause = f"WITH {scope} " if scope else ""
+    branches = " UNION ".join(
+        f"{with_clause}MATCH ({var}:{t.value} {{id: {id_expr}}}) RETURN {var}" for t in NodeType
+    )
+    return f"CALL {{ {branches} }}"
+
+
+# Labels and relationship types cannot be query parameters, so the
+# statements are built once per label/type instead of formatted per call.
+# Identical query text also lets the server reuse its cached plans.
+_CREATE_NODE_CQL = {
+    label.value: f"""
+    CREATE (n:{label.value} $props)
+    RETURN n
+    """
+    for label in NodeType
+}
+_CREATE_NODES_CQL = {
+    label.value: f"""
+    UNWIND $rows AS row
+    CREATE (n:{label.value})
+    SET n = row
+    RETURN n
+    """
+    for label in NodeType
+}
+# Always returns one row: the endpoints are collected (null when missing)
+# and the relationship is only created when both exist, so a failed create
+# reports which side was missing without another round-trip.
+_CREATE_RELATIONSHIP_CQL = {
+    rel_type.value: f"""
+    CALL {{ {_match_by_id("source", "$source_id")} RETURN head(collect(source)) AS source }}
+    CALL {{ {_match_by_id("target", "$target_id")} RETURN head(collect(target)) AS target }}
+    CALL {{
+        WITH source, target
+        WITH source, target WHERE source IS NOT NULL AND target IS NOT NULL
+        CREATE (source)-[r:{rel_type.value} $props]->(target)
+        RETURN r
+        UNION
+        WITH source, target
+        WITH source, target WHERE source IS NULL OR target IS NULL
+        RETURN null AS r
+    }}
+    RETURN r, id(r) AS rel_id, source.id AS source_id, target.id AS target_id,
+           source IS NULL AS source_missing
+    """
+    for rel_type in RelationshipType
+}
+_CREATE_RELATIONSHIPS_CQL = {
+    rel_type.value: f"""
+    UNWIND $rels AS rel
+    {_match_by_id("source", "rel.source_id", scope="rel")}
+    {_match_by_id("target", "rel.target_id", scope="rel")}
+    CREATE (source)-[r:{rel_type.value}]->(target)
+    SET r = rel.props
+    RETURN count(r) AS created
+    """
+    for rel_type in RelationshipType
+}
+
+_UPSERT_NODES_CQL = {
+    label.value: f"""
+    UNWIND $rows AS row
+    MERGE (n:{label.value} {{name: row.create.name}})
+    ON CREATE SET n = row.create
+    ON MATCH SET n += row.update
+    RETURN n
+    """
+    for label in NodeType
+}
+_MERGE_RELATIONSHIPS_CQL = {
+    rel_type.value: f"""
+    UNWIND $rels AS rel
+    {_match_by_id("source", "rel.source_id", scope="rel")}
+    {_match_by_id("target", "rel.target_id", scope="rel")}
+    MERGE (source)-[r:{rel_type.value}]->(target)
+    ON CREATE SET r = rel.props
+    RETURN count(r) AS created
+    """
+    for rel_type in RelationshipType
+}
+
+_READ_NODE_BY_NAME_CQL = {
+    label.value: f"""
+    MATCH (n:{label.value} {{name: $name}})
+    RETURN n
+    """
+    for label in NodeType
+}
+_READ_NODES_BY_NAMES_CQL = {
+    label.value: f"""
+    UNWIND $names AS name
+    MATCH (n:{label.value} {{name: name}})
+    RETURN name, n
+    """
+    for label in NodeType
+}
+
+# Lookups by ID keyed by label, with None for "label unknown"
+_NODE_LABELS = (None, *(label.value for label in NodeType))
+_READ_NODE_CQL = {
+    label: f"""
+    {_match_by_id("n", "$node_id", label)}
+    RETURN n, labels(n)[0] AS label
+    """
+    for label in _NODE_LABELS
+}
+_UPDATE_NODE_CQL = {
+    label: f"""
+    {_match_by_id("n", "$node_id", label)}
+    SET n += $props
+    RETURN n
+    """
+    for label in _NODE_LABELS
+}
+_DELETE_NODE_CQL = {
+    label: f"""
+    {_match_by_id("n", "$node_id", label)}
+    DETACH DELETE n
+    RETURN count(n) AS deleted
+    """
+    for label in _NODE_LABELS
+}
+# Patterns for the dynamically filtered list/delete statements. Going
+# through these keeps their text within the closed set of labels and types
+# (a bounded number of plans) instead of formatting whatever string arrives.
+_NODE_PATTERNS = {label.value: f"(n:{label.value})" for label in NodeType}
+_REL_PATTERNS = {None: "[r]", **{t.value: f"[r:{t.value}]" for t in RelationshipType}}
+_READ_NODES_BY_IDS_CQL = f"""
+CALL {{ {" UNION ".join(f"MATCH (n:{t.value}) WHERE n.id IN $node_ids RETURN n" for t in NodeType)} }}
+RETURN n
+"""
+_CHECK_CYCLE_CQL = f"""
+{_match_by_id("target", "$target_id")}
+{_match_by_id("source", "$source_id")}
+RETURN EXISTS {{ MATCH (target)-[:CONTAINS*]->(source) }} AS has_cycle
+"""
+# First ID with no node, probing each label's ID index
+_MISSING_ID_CQL = f"""
+UNWIND $ids AS id
+WITH id
+WHERE {" AND ".join(f"NOT EXISTS {{ MATCH (:{t.value} {{id: id}}) }}" for t in NodeType)}
+RETURN id
+LIMIT 1
+"""
+_FIND_CYCLE_CQL = f"""
+UNWIND $rels AS rel
+{_match_by_id("target", "rel.target_id", scope="rel")}
+{_match_by_id("source", "rel.source_id", scope="rel")}
+WITH rel, target, source
+WHERE EXISTS {{ MATCH (target)-[:CONTAINS*]->(source) }}
+RETURN rel.source_id AS source_id, rel.target_id AS target_id
+LIMIT 1
+"""
+
+# Traversal patterns keyed by (relationship type or None for any, direction)
+_CONNECTED_PATTERNS = {
+    "outgoing": "(n)-{rel}->(connected)",
+    "incoming": "(n)<-{rel}-(connected)",
+    "both": "(n)-{rel}-(connected)",
+}
+_CONNECTED_NODES_CQL = {
+    (rel_type, direction): f"""
+    {_match_by_id("n", "$node_id")}
+    MATCH {pattern.format(rel=f"[:{rel_type}]" if rel_type else "[]")}
+    RETURN connected
+    """
+    for rel_type in (None, *(t.value for t in RelationshipType))
+    for direction, pattern in _CONNECTED_PATTERNS.items()
+}
+
+# Every prebuilt statement, planned with EXPLAIN after connecting so the first
+# real call of each does not pay for query planning
+_WARM_UP_CQL = [
+    *_CREATE_NODE_CQL.values(),
+    *_CREATE_NODES_CQL.values(),
+    *_CREATE_RELATIONSHIP_CQL.values(),
+    *_CREATE_RELATIONSHIPS_CQL.values(),
+    *_UPSERT_NODES_CQL.values(),
+    *_MERGE_RELATIONSHIPS_CQL.values(),
+    *_READ_NODE_BY_NAME_CQL.values(),
+    *_READ_NODES_BY_NAMES_CQL.values(),
+    *_READ_NODE_CQL.values(),
+    *_UPDATE_NODE_CQL.values(),
+    *_DELETE_NODE_CQL.values(),
+    _READ_NODES_BY_IDS_CQL,
+    _CHECK_CYCLE_CQL,
+    _FIND_CYCLE_CQL,
+    *_CONNECTED_NODES_CQL.values(),
+]
+# Warm-up statements in flight at once, which is also how many pooled
+# connections get opened ahead of the first request
+_WARM_UP_CONCURRENCY = 8
+
+
+def _cql(templates: dict[Any, str], key: Any) -> str:
+    """Look up a prebuilt statement, rejecting unknown labels or types.
+
+    Args:
+        templates: Statements keyed by node label or relationship type
+        key: Node label or relationship type (or a tuple including one)
+
+    Returns:
+        Cypher statement for the label or type
+
+    Raises:
+        ValidationError: If the label or type is not part of the schema
+    """
+    try:
+        return templates[key]
+    except KeyError:
+        raise ValidationError(f"Unknown node or relationship type: '{key}'")
+
 
 def _convert_neo4j_types(value: Any) -> Any:
     """Convert Neo4j types to JSON-serializable Python types.
@@ -64,7 +323,7 @@ def _serialize_for_neo4j(data: dict[str, Any]) -> dict[str, Any]:
     result = {}
     for key, value in data.items():
         if key in JSON_SERIALIZED_FIELDS and isinstance(value, (dict, list)):
-            result[key] = json.dumps(value)
+            result[key] = json_codec.dumps(value)
         else:
             result[key] = value
     return result
@@ -83,7 +342,7 @@ def _deserialize_from_neo4j(data: dict[str, Any]) -> dict[str, Any]:
     for key, value in data.items():
         if key in JSON_SERIALIZED_FIELDS and isinstance(value, str):
             try:
-                result[key] = json.loads(value)
+                result[key] = json_codec.loads(value)
             except json.JSONDecodeError:
                 # If it's not valid JSON, keep as string
                 result[key] = value
@@ -92,6 +351,65 @@ def _deserialize_from_neo4j(data: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
+def _deserialize_column(field: str, values: Iterable[Any]) -> list[Any]:
+    """Deserialize one field's values, as _deserialize_from_neo4j does per node.
+
+    Args:
+        field: Property name the values belong to
+        values: Raw values from Neo4j
+
+    Returns:
+        Values with JSON strings parsed and Neo4j types converted
+    """
+    if field not in JSON_SERIALIZED_FIELDS:
+        return [_convert_neo4j_types(value) for value in values]
+    return [_deserialize_from_neo4j({field: value})[field] for value in values]
+
+
+def _node_from_record(record: Record) -> dict[str, Any]:
+    """Convert a record whose first column is a node."""
+    return _deserialize_from_neo4j(dict(record[0]))
+
+
+def _relationship_from_record(record: Record) -> dict[str, Any]:
+    """Convert a (r, rel_id, rel_type, source_id, target_id) record."""
+    return {
+        "id": str(record[1]),
+        "type": record[2],
+        "source_id": record[3],
+        "target_id": record[4],
+        **_convert_neo4j_types(dict(record[0])),
+    }
+
+
+async def _convert_records[T](records: list[Record], convert: Callable[[Record], T]) -> list[T]:
+    """Convert records, off the event loop when there are many of them.
+
+    Args:
+        records: Records returned by the driver
+        convert: Turns one record into the value to return
+
+    Returns:
+        Converted records, in order
+    """
+    if len(records) <= _OFFLOAD_THRESHOLD:
+        return [convert(record) for record in records]
+    return await asyncio.to_thread(lambda: [convert(record) for record in records])
+
+
+# Unique constraints on names (these also back MATCH/MERGE on name) followed
+# by indexes on node IDs and timestamps
+_SCHEMA_CQL = [
+    f"CREATE CONSTRAINT {t.value.lower()}_name_unique IF NOT EXISTS "
+    f"FOR (n:{t.value}) REQUIRE n.name IS UNIQUE"
+    for t in NodeType
+] + [
+    f"CREATE INDEX {t.value.lower()}_{field}_index IF NOT EXISTS FOR (n:{t.value}) ON (n.{field})"
+    for t in NodeType
+    for field in ("id", "created_at", "updated_at")
+]
+
+
 class Neo4jDatabase(DatabaseInterface):
     """Neo4j implementation of the database interface."""
 
@@ -101,6 +419,14 @@ class Neo4jDatabase(DatabaseInterface):
         username: str,
         password: str,
         database: str = "neo4j",
+        max_connection_pool_size: int = 100,
+        connection_acquisition_timeout: float = 60.0,
+        max_connection_lifetime: int = 3600,
+        connection_timeout: float = 30.0,
+        cache_size: int = 10_000,
+        cache_ttl: float = 60.0,
+        cache_queries: bool = False,
+        warm_up: bool = True,
     ):
         """Initialize Neo4j database connection.
 
@@ -109,28 +435,97 @@ class Neo4jDatabase(DatabaseInterface):
             username: Database username
             password: Database password
             database: Database name (default: neo4j)
+            max_connection_pool_size: Maximum connections kept in the driver pool
+            connection_acquisition_timeout: Seconds to wait for a pooled connection
+            max_connection_lifetime: Seconds before a pooled connection is recycled
+            connection_timeout: Seconds to wait when opening a new connection
+            cache_size: Maximum entries per in-process read cache
+            cache_ttl: Seconds a cached read stays valid
+            cache_queries: Also cache execute_query results; queries calling
+                clock, random, APOC or other procedures are never cached
+            warm_up: Plan the prebuilt statements and fill the pool on connect
         """
         self.uri = uri
         self.username = username
         self.password = password
         self.database = database
+        self.max_connection_pool_size = max_connection_pool_size
+        self.connection_acquisition_timeout = connection_acquisition_timeout
+        self.max_connection_lifetime = max_connection_lifetime
+        self.connection_timeout = connection_timeout
+        self.cache_queries = cache_queries
+        self.warm_up = warm_up
         self.driver: AsyncDriver | None = None
 
+        # Read-through caches for hot lookups. Names map to node IDs so a
+        # node is only stored once; writes invalidate the affected entries.
+        self._node_cache: TTLCache[str, tuple[str, dict[str, Any]]] = TTLCache(
+            cache_size, cache_ttl
+        )
+        self._name_cache: TTLCache[tuple[str, str], str] = TTLCache(cache_size, cache_ttl)
+        self._connected_cache: TTLCache[tuple[Any, ...], list[dict[str, Any]]] = TTLCache(
+            cache_size, cache_ttl
+        )
+        # Results of read-only user queries, tagged with the write generation
+        # they were read at
+        self._query_cache: TTLCache[bytes, tuple[int, list[dict[str, Any]]]] = TTLCache(
+            cache_size, cache_ttl
+        )
+        # Answers of check_circular_dependency keyed by (source, target)
+        self._cycle_cache: TTLCache[tuple[str, str], bool] = TTLCache(cache_size, cache_ttl)
+        # Bumped on every write so reads that raced a write don't cache stale
+        # data and query results from before the write are not served
+        self._cache_generation = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+
     async def connect(self) -> None:
         """Establish connection to Neo4j."""
         try:
             self.driver = AsyncGraphDatabase.driver(
                 self.uri,
                 auth=(self.username, self.password),
+                max_connection_pool_size=self.max_connection_pool_size,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
+                max_connection_lifetime=self.max_connection_lifetime,
+                connection_timeout=self.connection_timeout,
             )
             # Verify connectivity
             await self.driver.verify_connectivity()
             logger.info(f"Connected to Neo4j at {self.uri}")
         except ServiceUnavailable as e:
             raise DatabaseConnectionError(f"Cannot connect to Neo4j at {self.uri}: {e}")
-        except Exception as e:
+        except (Neo4jError, DriverError, ValueError) as e:
+            # ValueError covers malformed URIs rejected by the driver factory
             raise DatabaseConnectionError(f"Failed to connect to Neo4j: {e}")
 
+        if self.warm_up:
+            await self._warm_up()
+
+    async def _warm_up(self) -> None:
+        """Plan every prebuilt statement and open pooled connections.
+
+        EXPLAIN plans without executing, which fills the server's plan cache.
+        Failures are logged only; a cold cache is slower, not broken.
+        """
+        driver = self.driver
+        if not driver:
+            return
+        semaphore = asyncio.Semaphore(_WARM_UP_CONCURRENCY)
+
+        async def explain(statement: str) -> None:
+            async with semaphore:
+                await driver.execute_query(f"EXPLAIN {statement}", database_=self.database)
+
+        try:
+            await asyncio.gather(*(explain(statement) for statement in _WARM_UP_CQL))
+            logger.info(f"Warmed up {len(_WARM_UP_CQL)} query plans")
+        except (Neo4jError, DriverError) as e:
+            # DriverError covers ServiceUnavailable and session expiry
+            logger.warning(f"Query plan warm-up failed: {e}")
+
     async def disconnect(self) -> None:
         """Close Neo4j connection."""
         if self.driver:
@@ -143,46 +538,148 @@ class Neo4jDatabase(DatabaseInterface):
         if not self.driver:
             raise DatabaseConnectionError("Not connected to database")
 
+        # Schema commands can't share a query, so issue them concurrently on
+        # separate sessions instead of one round-trip after another
+        await asyncio.gather(*(self._run_schema_statement(stmt) for stmt in _SCHEMA_CQL))
+
+        logger.info("Database schema initialized")
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return hit/miss counters and sizes of the read caches."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "nodes": len(self._node_cache),
+            "names": len(self._name_cache),
+            "connected": len(self._connected_cache),
+            "query_hits": self._query_cache_hits,
+            "query_misses": self._query_cache_misses,
+            "queries": len(self._query_cache),
+            "cycles": len(self._cycle_cache),
+        }
+
+    def _invalidate_cache(self, node_id: str | None = None, nodes: bool = True) -> None:
+        """Drop cached reads affected by a write.
+
+        Args:
+            node_id: Node that changed; None clears every node entry
+            nodes: False when only relationships changed
+        """
+        self._cache_generation += 1
+        if nodes and node_id is None:
+            self._node_cache.clear()
+        elif nodes:
+            # Name entries pointing at this ID miss once the node is gone
+            self._node_cache.pop(node_id, None)
+        # Connected lists embed node data and depend on relationships
+        self._connected_cache.clear()
+
+    def _invalidate_cycles(self, added: bool) -> None:
+        """Drop cached cycle checks that a CONTAINS write may have flipped.
+
+        Adding CONTAINS edges can only create paths and removing them can
+        only break paths, so each kind of write drops just one kind of answer.
+
+        Args:
+            added: True when CONTAINS edges were created, False when removed
+        """
+        stale = [key for key, has_cycle in self._cycle_cache.items() if has_cycle != added]
+        for key in stale:
+            self._cycle_cache.pop(key, None)
+
+    async def _query(
+        self, query: str, parameters: dict[str, Any] | None = None, *, write: bool = False
+    ) -> list[Record]:
+        """Run a single statement through the driver's managed execute_query.
+
+        Args:
+            query: Cypher statement
+            parameters: Query parameters
+            write: Route to the writer instead of a reader
+
+        Returns:
+            All records returned by the statement
+        """
+        records, _, _ = await self.driver.execute_query(
+            query,
+            parameters_=parameters,
+            routing_=RoutingControl.WRITE if write else RoutingControl.READ,
+            database_=self.database,
+        )
+        return records
+
+    async def _stream[T](
+        self,
+        query: str,
+        parameters: dict[str, Any],
+        convert: Callable[[Record], T],
+        limit: int | None = None,
+    ) -> list[T]:
+        """Run a read query and convert records as they stream in.
+
+        Unlike ``_query`` the raw result set is never buffered as a whole,
+        and pulling stops once ``limit`` records have been converted.
+
+        Args:
+            query: Cypher statement
+            parameters: Query parameters
+            convert: Turns one record into the value to return
+            limit: Maximum number of records to consume
+
+        Returns:
+            Converted records, in order
+        """
+        if limit is not None and limit <= 0:
+            return []
+
+        async def work(tx: AsyncManagedTransaction) -> list[T]:
+            # Rebuilt from scratch if the driver retries the transaction
+            items: list[T] = []
+            result = await tx.run(query, parameters)
+            async for record in result:
+                items.append(convert(record))
+                if limit is not None and len(items) >= limit:
+                    break
+            return items
+
+        async with self.driver.session(
+            database=self.database, default_access_mode=READ_ACCESS
+        ) as session:
+            return await session.execute_read(work)
+
+    async def _run_chunked(
+        self, query: str, param: str, rows: list[dict[str, Any]]
+    ) -> list[Record]:
+        """Run an UNWIND statement over rows in chunks inside one transaction.
+
+        Args:
+            query: Cypher statement unwinding ``$<param>``
+            param: Name of the list parameter
+            rows: All rows; sent ``_BULK_CHUNK_SIZE`` at a time
+
+        Returns:
+            Records of all chunks, in order
+        """
+
+        async def work(tx: AsyncManagedTransaction) -> list[Record]:
+            records: list[Record] = []
+            for start in range(0, len(rows), _BULK_CHUNK_SIZE):
+                result = await tx.run(query, {param: rows[start : start + _BULK_CHUNK_SIZE]})
+                records.extend([record async for record in result])
+            return records
+
         async with self.driver.session(database=self.database) as session:
-            # Unique constraints on names
-            await session.run(
-                """
-                CREATE CONSTRAINT skill_name_unique IF NOT EXISTS
-                FOR (s:SKILL) REQUIRE s.name IS UNIQUE
-                """
-            )
-            await session.run(
-                """
-                CREATE CONSTRAINT script_name_unique IF NOT EXISTS
-                FOR (s:SCRIPT) REQUIRE s.name IS UNIQUE
-                """
-            )
-            await session.run(
-                """
-                CREATE CONSTRAINT env_name_unique IF NOT EXISTS
-                FOR (e:ENV) REQUIRE e.name IS UNIQUE
-                """
-            )
+            return await session.execute_write(work)
 
-            # Index on node IDs for fast lookups
-            for node_type in ["SKILL", "KNOWLEDGE", "SCRIPT", "ENV"]:
-                await session.run(
-                    f"""
-                    CREATE INDEX {node_type.lower()}_id_index IF NOT EXISTS
-                    FOR (n:{node_type}) ON (n.id)
-                    """
-                )
+    async def _run_schema_statement(self, statement: str) -> None:
+        """Run a single schema statement in its own session."""
 
-            # Index on created_at for temporal queries
-            for node_type in ["SKILL", "KNOWLEDGE", "SCRIPT", "ENV"]:
-                await session.run(
-                    f"""
-                    CREATE INDEX {node_type.lower()}_created_at_index IF NOT EXISTS
-                    FOR (n:{node_type}) ON (n.created_at)
-                    """
-                )
+        async def work(tx: AsyncManagedTransaction) -> None:
+            result = await tx.run(statement)
+            await result.consume()
 
-            logger.info("Database schema initialized")
+        async with self.driver.session(database=self.database) as session:
+            await session.execute_write(work)
 
     async def health_check(self) -> bool:
         """Check database connection health."""
@@ -190,11 +687,9 @@ class Neo4jDatabase(DatabaseInterface):
             return False
 
         try:
-            async with self.driver.session(database=self.database) as session:
-                result = await session.run("RETURN 1 AS health")
-                record = await result.single()
-                return record and record["health"] == 1
-        except Exception as e:
+            records = await self._query("RETURN 1 AS health")
+            return bool(records) and records[0]["health"] == 1
+        except (Neo4jError, DriverError) as e:
             logger.error(f"Health check failed: {e}")
             return False
 
@@ -213,68 +708,249 @@ class Neo4jDatabase(DatabaseInterface):
         # Serialize nested structures for Neo4j storage
         serialized_data = _serialize_for_neo4j(data)
 
+        try:
+            records = await self._query(
+                _cql(_CREATE_NODE_CQL, node_type), {"props": serialized_data}, write=True
+            )
+        except ConstraintError:
+            # Unique constraint violation
+            name = data.get("name", "unknown")
+            raise NodeAlreadyExistsError(name, node_type)
+        except Neo4jError as e:
+            raise DatabaseConnectionError(f"Failed to create node: {e}")
+        finally:
+            self._cache_generation += 1
+
+        if not records:
+            raise DatabaseConnectionError("Failed to create node")
+
+        # Deserialize back to Python structures
+        node = _deserialize_from_neo4j(dict(records[0]["n"]))
+        logger.info(f"Created {node_type} node: {node.get('id')}")
+        return node
+
+    async def create_nodes_bulk(
+        self, node_type: str, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Create multiple nodes with UNWIND, chunked within one transaction."""
+        if not self.driver:
+            raise DatabaseConnectionError("Not connected to database")
+
+        if not rows:
+            return []
+
+        # One timestamp for the whole batch
+        now = datetime.now(UTC)
+        serialized_rows = []
+        for data in rows:
+            data.setdefault("created_at", now)
+            data.setdefault("updated_at", now)
+            serialized_rows.append(_serialize_for_neo4j(data))
+
+        query = _cql(_CREATE_NODES_CQL, node_type)
+        try:
+            if len(serialized_rows) <= _BULK_CHUNK_SIZE:
+                records = await self._query(query, {"rows": serialized_rows}, write=True)
+            else:
+                records = await self._run_chunked(query, "rows", serialized_rows)
+        except ConstraintError:
+            names = ", ".join(str(data.get("name", "unknown")) for data in rows)
+            raise NodeAlreadyExistsError(names, node_type)
+        except Neo4jError as e:
+            raise DatabaseConnectionError(f"Failed to create nodes: {e}")
+        finally:
+            self._cache_generation += 1
+
+        nodes = await _convert_records(records, _node_from_record)
+        logger.info(f"Created {len(nodes)} {node_type} nodes")
+        return nodes
+
+    async def upsert_nodes_bulk(
+        self, node_type: str, rows: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Create or update multiple nodes with a single UNWIND/MERGE on name."""
+        if not self.driver:
+            raise DatabaseConnectionError("Not connected to database")
+
+        if not rows:
+            return []
+
+        query = _cql(_UPSERT_NODES_CQL, node_type)
+        now = datetime.now(UTC)
+        params = []
+        for data in rows:
+            # Existing nodes keep their identity and creation time
+            update = {k: v for k, v in data.items() if k not in ("id", "created_at")}
+            update["updated_at"] = now
+            params.append(
+                {
+                    "create": _serialize_for_neo4j(
+                        {"id": str(uuid.uuid4()), "created_at": now, **data, "updated_at": now}
+                    ),
+                    "update": _serialize_for_neo4j(update),
+                }
+            )
+
+        try:
+            if len(params) <= _BULK_CHUNK_SIZE:
+                records = await self._query(query, {"rows": params}, write=True)
+            else:
+                records = await self._run_chunked(query, "rows", params)
+        except Neo4jError as e:
+            raise DatabaseConnectionError(f"Failed to upsert nodes: {e}")
+        finally:
+            self._invalidate_cache()
+
+        nodes = await _convert_records(records, _node_from_record)
+        logger.info(f"Upserted {len(nodes)} {node_type} nodes")
+        return nodes
+
+    async def bulk_load(self, plan: BulkLoadPlan) -> dict[str, str]:
+        """Create all nodes and relationships of a plan in one explicit transaction."""
+        if not self.driver:
+            raise DatabaseConnectionError("Not connected to database")
+
+        try:
+            ids = plan.node_ids_by_name()
+            relationships = plan.resolve_relationships(ids)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+        cycle = plan.find_contains_cycle()
+        if cycle:
+            raise CircularDependencyError(ids[cycle[0]], ids[cycle[1]])
+
+        # One timestamp for the whole load
+        now = datetime.now(UTC)
+
+        async def work(tx: AsyncManagedTransaction) -> None:
+            for node_type, rows in plan.nodes.items():
+                query = _cql(_CREATE_NODES_CQL, node_type.value)
+                serialized_rows = [
+                    _serialize_for_neo4j({"created_at": now, "updated_at": now, **data})
+                    for data in rows
+                ]
+
+                for start in range(0, len(serialized_rows), _BULK_CHUNK_SIZE):
+                    result = await tx.run(
+                        query, rows=serialized_rows[start : start + _BULK_CHUNK_SIZE]
+                    )
+                    await result.consume()
+
+            for rel_type, edges in relationships.items():
+                query = _cql(_CREATE_RELATIONSHIPS_CQL, rel_type)
+                rels = [
+                    {
+                        "source_id": source_id,
+                        "target_id": target_id,
+                        "props": {"created_at": now, **properties},
+                    }
+                    for source_id, target_id, properties in edges
+                ]
+
+                for start in range(0, len(rels), _BULK_CHUNK_SIZE):
+                    result = await tx.run(query, rels=rels[start : start + _BULK_CHUNK_SIZE])
+                    await result.consume()
+
         async with self.driver.session(database=self.database) as session:
             try:
-                result = await session.run(
-                    f"""
-                    CREATE (n:{node_type} $props)
-                    RETURN n
-                    """,
-                    props=serialized_data,
-                )
-                record = await result.single()
-                if not record:
-                    raise DatabaseConnectionError("Failed to create node")
-
-                # Deserialize back to Python structures
-                node = _deserialize_from_neo4j(dict(record["n"]))
-                logger.info(f"Created {node_type} node: {node.get('id')}")
-                return node
-
-            except ConstraintError:
-                # Unique constraint violation
-                name = data.get("name", "unknown")
-                raise NodeAlreadyExistsError(name, node_type)
+                await session.execute_write(work)
+            except ConstraintError as e:
+                # Rolled back; report only the names that are already taken
+                for node_type, rows in plan.nodes.items():
+                    taken = await self.read_nodes_by_names(
+                        node_type.value, [row["name"] for row in rows]
+                    )
+                    if taken:
+                        raise NodeAlreadyExistsError(", ".join(taken), node_type.value)
+                raise DatabaseConnectionError(f"Bulk load failed: {e}")
             except Neo4jError as e:
-                raise DatabaseConnectionError(f"Failed to create node: {e}")
-
-    async def read_node(self, node_id: str) -> dict[str, Any] | None:
+                raise DatabaseConnectionError(f"Bulk load failed: {e}")
+
+        self._invalidate_cache(nodes=False)
+        if "CONTAINS" in relationships:
+            self._invalidate_cycles(added=True)
+        logger.info(
+            f"Bulk loaded {len(ids)} nodes and "
+            f"{sum(len(edges) for edges in relationships.values())} relationships"
+        )
+        return ids
+
+    async def read_node(self, node_id: str, node_type: str | None = None) -> dict[str, Any] | None:
         """Retrieve a node by ID."""
         if not self.driver:
             raise DatabaseConnectionError("Not connected to database")
 
-        async with self.driver.session(database=self.database) as session:
-            result = await session.run(
-                """
-                MATCH (n {id: $node_id})
-                RETURN n
-                """,
-                node_id=node_id,
-            )
-            record = await result.single()
-            if record:
-                return _deserialize_from_neo4j(dict(record["n"]))
+        cached = self._node_cache.get(node_id)
+        if cached is not None:
+            self._cache_hits += 1
+            label, node = cached
+            # Nested lists and dicts are shared with the cache, so copy deeply
+            return copy.deepcopy(node) if node_type in (None, label) else None
+        self._cache_misses += 1
+
+        generation = self._cache_generation
+        records = await self._query(_cql(_READ_NODE_CQL, node_type), {"node_id": node_id})
+        if not records:
             return None
 
+        node = _deserialize_from_neo4j(dict(records[0]["n"]))
+        if generation == self._cache_generation:
+            self._node_cache[node_id] = (records[0]["label"], node)
+        return copy.deepcopy(node)
+
     async def read_node_by_name(self, node_type: str, name: str) -> dict[str, Any] | None:
         """Retrieve a node by type and name."""
         if not self.driver:
             raise DatabaseConnectionError("Not connected to database")
 
-        async with self.driver.session(database=self.database) as session:
-            result = await session.run(
-                f"""
-                MATCH (n:{node_type} {{name: $name}})
-                RETURN n
-                """,
-                name=name,
-            )
-            record = await result.single()
-            if record:
-                return _deserialize_from_neo4j(dict(record["n"]))
+        node_id = self._name_cache.get((node_type, name))
+        cached = self._node_cache.get(node_id) if node_id else None
+        # A renamed node leaves a stale name entry behind; treat it as a miss
+        if cached is not None and cached[1].get("name") == name:
+            self._cache_hits += 1
+            return copy.deepcopy(cached[1])
+        self._cache_misses += 1
+
+        generation = self._cache_generation
+        records = await self._query(_cql(_READ_NODE_BY_NAME_CQL, node_type), {"name": name})
+        if not records:
             return None
 
-    async def update_node(self, node_id: str, data: dict[str, Any]) -> dict[str, Any]:
+        node = _deserialize_from_neo4j(dict(records[0]["n"]))
+        if generation == self._cache_generation:
+            self._node_cache[node["id"]] = (node_type, node)
+            self._name_cache[(node_type, name)] = node["id"]
+        return copy.deepcopy(node)
+
+    async def read_nodes_by_names(
+        self, node_type: str, names: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieve several nodes of one type by name in a single query."""
+        if not self.driver:
+            raise DatabaseConnectionError("Not connected to database")
+
+        if not names:
+            return {}
+
+        records = await self._query(_cql(_READ_NODES_BY_NAMES_CQL, node_type), {"names": names})
+        return {name: _deserialize_from_neo4j(dict(node)) for name, node in records}
+
+    async def read_nodes_by_ids(self, node_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Retrieve several nodes by ID in a single query."""
+        if not self.driver:
+            raise DatabaseConnectionError("Not connected to database")
+
+        if not node_ids:
+            return {}
+
+        records = await self._query(_READ_NODES_BY_IDS_CQL, {"node_ids": node_ids})
+        nodes = await _convert_records(records, _node_from_record)
+        return {node["id"]: node for node in nodes}
+
+    async def update_node(
+        self, node_id: str, data: dict[str, Any], node_type: str | None = None
+    ) -> dict[str, Any]:
         """Update an existing node."""
         if not self.driver:
             raise DatabaseConnectionError("Not connected to database")
@@ -285,53 +961,45 @@ class Neo4jDatabase(DatabaseInterface):
         # Serialize nested structures for Neo4j storage
         serialized_data = _serialize_for_neo4j(data)
 
-        async with self.driver.session(database=self.database) as session:
-            try:
-                result = await session.run(
-                    """
-                    MATCH (n {id: $node_id})
-                    SET n += $props
-                    RETURN n
-                    """,
-                    node_id=node_id,
-                    props=serialized_data,
-                )
-                record = await result.single()
-                if not record:
-                    raise NodeNotFoundError(node_id)
-
-                # Deserialize back to Python structures
-                node = _deserialize_from_neo4j(dict(record["n"]))
-                logger.info(f"Updated node: {node_id}")
-                return node
-
-            except ConstraintError:
-                name = data.get("name", "unknown")
-                raise NodeAlreadyExistsError(name, "node")
-            except Neo4jError as e:
-                raise DatabaseConnectionError(f"Failed to update node: {e}")
-
-    async def delete_node(self, node_id: str) -> bool:
+        try:
+            records = await self._query(
+                _cql(_UPDATE_NODE_CQL, node_type),
+                {"node_id": node_id, "props": serialized_data},
+                write=True,
+            )
+        except ConstraintError:
+            name = data.get("name", "unknown")
+            raise NodeAlreadyExistsError(name, "node")
+        except Neo4jError as e:
+            raise DatabaseConnectionError(f"Failed to update node: {e}")
+        finally:
+            self._invalidate_cache(node_id)
+
+        if not records:
+            raise NodeNotFoundError(node_id)
+
+        # Deserialize back to Python structures
+        node = _deserialize_from_neo4j(dict(records[0]["n"]))
+        logger.info(f"Updated node: {node_id}")
+        return node
+
+    async def delete_node(self, node_id: str, node_type: str | None = None) -> bool:
         """Delete a node and all its relationships."""
         if not self.driver:
             raise DatabaseConnectionError("Not connected to database")
 
-        async with self.driver.session(database=self.database) as session:
-            result = await session.run(
-                """
-                MATCH (n {id: $node_id})
-                DETACH DELETE n
-                RETURN count(n) AS deleted
-                """,
-                node_id=node_id,
-            )
-            record = await result.single()
-            deleted = record["deleted"] if record else 0
+        records = await self._query(
+            _cql(_DELETE_NODE_CQL, node_type), {"node_id": node_id}, write=True
+        )
+        self._invalidate_cache(node_id)
+        # DETACH DELETE takes the node's CONTAINS edges with it
+        self._invalidate_cycles(added=False)
+        deleted = records[0]["deleted"] if records else 0
 
-            if deleted > 0:
-                logger.info(f"Deleted node: {node_id}")
-                return True
-            return False
+        if deleted > 0:
+            logger.info(f"Deleted node: {node_id}")
+            return True
+        return False
 
     async def list_nodes(
         self,
@@ -339,15 +1007,30 @@ class Neo4jDatabase(DatabaseInterface):
         filters: dict[str, Any] | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[dict[str, Any]]:
         """List nodes with optional filtering."""
         if not self.driver:
             raise DatabaseConnectionError("Not connected to database")
 
+        node_pattern = _cql(_NODE_PATTERNS, node_type)
         filters = filters or {}
         where_clauses = []
         params: dict[str, Any] = {"limit": limit, "offset": offset}
 
+        if cursor:
+            # Keyset pagination: continue after the cursor's (created_at, id)
+            created_at, cursor_id = decode_cursor(cursor)
+            # The plain range lets the created_at index seek to the cursor
+            where_clauses.append("n.created_at <= $cursor_created_at")
+            where_clauses.append(
+                "(n.created_at < $cursor_created_at "
+                "OR (n.created_at = $cursor_created_at AND n.id < $cursor_id))"
+            )
+            params["cursor_created_at"] = datetime.fromisoformat(created_at)
+            params["cursor_id"] = cursor_id
+            params["offset"] = 0
+
         # Build WHERE clauses
         if "name" in filters and filters["name"]:
             # Case-insensitive matching with normalized comparison
@@ -359,6 +1042,11 @@ class Neo4jDatabase(DatabaseInterface):
             )
             params["name"] = filters["name"]
 
+        if "name_prefix" in filters and filters["name_prefix"]:
+            # STARTS WITH is answered by the name index; CONTAINS above is not
+            where_clauses.append("n.name STARTS WITH $name_prefix")
+            params["name_prefix"] = filters["name_prefix"]
+
         if "created_after" in filters and filters["created_after"]:
             where_clauses.append("n.created_at >= $created_after")
             params["created_after"] = filters["created_after"]
@@ -370,18 +1058,40 @@ class Neo4jDatabase(DatabaseInterface):
         where_clause = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
         query = f"""
-        MATCH (n:{node_type})
+        MATCH {node_pattern}
         {where_clause}
         RETURN n
-        ORDER BY n.created_at DESC
+        ORDER BY n.created_at DESC, n.id DESC
         SKIP $offset
         LIMIT $limit
         """
 
-        async with self.driver.session(database=self.database) as session:
-            result = await session.run(query, **params)
-            records = await result.values()
-            return [_deserialize_from_neo4j(dict(record[0])) for record in records]
+        records = await self._query(query, params)
+        return await _convert_records(records, _node_from_record)
+
+    async def list_nodes_columnar(self, node_type: str, fields: list[str]) -> dict[str, list[Any]]:
+        """Export selected fields of every node of a type, one list per field."""
+        if not self.driver:
+            raise DatabaseConnectionError("Not connected to database")
+
+        if not fields:
+            return {}
+
+        # Only the requested properties cross the wire, as one list per node
+        query = f"""
+        MATCH {_cql(_NODE_PATTERNS, node_type)}
+        RETURN [field IN $fields | n[field]] AS row
+        ORDER BY n.created_at DESC, n.id DESC
+        """
+        records = await self._query(query, {"fields": fields})
+        columns = list(zip(*(record["row"] for record in records), strict=True)) or [()] * len(
+            fields
+        )
+
+        return {
+            field: _deserialize_column(field, values)
+            for field, values in zip(fields, columns, strict=True)
+        }
 
     # Relationship Operations
 
@@ -396,6 +1106,8 @@ class Neo4jDatabase(DatabaseInterface):
         if not self.driver:
             raise DatabaseConnectionError("Not connected to database")
 
+        query = _cql(_CREATE_RELATIONSHIP_CQL, rel_type)
+
         # Check for circular dependencies if CONTAINS relationship
         if rel_type == "CONTAINS":
             if await self.check_circular_dependency(source_id, target_id):
@@ -404,59 +1116,123 @@ class Neo4jDatabase(DatabaseInterface):
         properties = properties or {}
         properties.setdefault("created_at", datetime.now(UTC))
 
-        async with self.driver.session(database=self.database) as session:
-            result = await session.run(
-                f"""
-                MATCH (source {{id: $source_id}})
-                MATCH (target {{id: $target_id}})
-                CREATE (source)-[r:{rel_type} $props]->(target)
-                RETURN r, id(r) AS rel_id, source.id AS source_id, target.id AS target_id
-                """,
-                source_id=source_id,
-                target_id=target_id,
-                props=properties,
-            )
-            record = await result.single()
-            if not record:
-                # Check which node doesn't exist
-                source_exists = await self.read_node(source_id)
-                if not source_exists:
-                    raise NodeNotFoundError(source_id)
-                raise NodeNotFoundError(target_id)
-
-            relationship = {
-                "id": str(record["rel_id"]),
-                "type": rel_type,
-                "source_id": record["source_id"],
-                "target_id": record["target_id"],
-                **_convert_neo4j_types(dict(record["r"])),
+        records = await self._query(
+            query,
+            {"source_id": source_id, "target_id": target_id, "props": properties},
+            write=True,
+        )
+        self._invalidate_cache(nodes=False)
+        if rel_type == "CONTAINS":
+            self._invalidate_cycles(added=True)
+
+        record = records[0]
+        if record["r"] is None:
+            raise NodeNotFoundError(source_id if record["source_missing"] else target_id)
+
+        relationship = {
+            "id": str(record["rel_id"]),
+            "type": rel_type,
+            "source_id": record["source_id"],
+            "target_id": record["target_id"],
+            **_convert_neo4j_types(dict(record["r"])),
+        }
+
+        logger.info(f"Created {rel_type} relationship: {source_id} -> {target_id}")
+        return relationship
+
+    async def create_relationships_bulk(
+        self,
+        rel_type: str,
+        edges: list[tuple[str, str, dict[str, Any] | None]],
+        merge: bool = False,
+    ) -> int:
+        """Create many relationships with chunked UNWINDs in a single transaction."""
+        if not self.driver:
+            raise DatabaseConnectionError("Not connected to database")
+
+        if not edges:
+            return 0
+
+        query = _cql(_MERGE_RELATIONSHIPS_CQL if merge else _CREATE_RELATIONSHIPS_CQL, rel_type)
+        now = datetime.now(UTC)
+        rels = [
+            {
+                "source_id": source_id,
+                "target_id": target_id,
+                "props": {"created_at": now, **(properties or {})},
             }
+            for source_id, target_id, properties in edges
+        ]
+
+        async def work(tx: AsyncManagedTransaction) -> int:
+            created = 0
+            for start in range(0, len(rels), _BULK_CHUNK_SIZE):
+                result = await tx.run(query, rels=rels[start : start + _BULK_CHUNK_SIZE])
+                record = await result.single()
+                created += record["created"] if record else 0
+
+            # Raising inside the transaction function rolls it back
+            if created < len(rels):
+                # Some endpoint did not match; find which one within tx
+                node_ids = list(
+                    dict.fromkeys(rel[key] for rel in rels for key in ("source_id", "target_id"))
+                )
+                result = await tx.run(_MISSING_ID_CQL, ids=node_ids)
+                missing = await result.single()
+                if missing:
+                    raise NodeNotFoundError(missing["id"])
+                raise DatabaseConnectionError(
+                    f"Created only {created} of {len(rels)} {rel_type} relationships"
+                )
+
+            if rel_type == "CONTAINS":
+                # With the new edges in place, a path back from target to
+                # source means one of them closed a cycle
+                for start in range(0, len(rels), _BULK_CHUNK_SIZE):
+                    result = await tx.run(
+                        _FIND_CYCLE_CQL, rels=rels[start : start + _BULK_CHUNK_SIZE]
+                    )
+                    cycle = await result.single()
+                    if cycle:
+                        raise CircularDependencyError(cycle["source_id"], cycle["target_id"])
+            return created
 
-            logger.info(f"Created {rel_type} relationship: {source_id} -> {target_id}")
-            return relationship
+        try:
+            async with self.driver.session(database=self.database) as session:
+                created = await session.execute_write(work)
+        except Neo4jError as e:
+            raise DatabaseConnectionError(f"Failed to create relationships: {e}")
+
+        self._invalidate_cache(nodes=False)
+        if rel_type == "CONTAINS":
+            self._invalidate_cycles(added=True)
+        logger.info(f"Created {created} {rel_type} relationships")
+        return created
 
     async def delete_relationship(self, rel_id: str) -> bool:
         """Delete a relationship by internal ID."""
         if not self.driver:
             raise DatabaseConnectionError("Not connected to database")
 
-        async with self.driver.session(database=self.database) as session:
-            result = await session.run(
-                """
-                MATCH ()-[r]->()
-                WHERE id(r) = toInteger($rel_id)
-                DELETE r
-                RETURN count(r) AS deleted
-                """,
-                rel_id=rel_id,
-            )
-            record = await result.single()
-            deleted = record["deleted"] if record else 0
-
-            if deleted > 0:
-                logger.info(f"Deleted relationship: {rel_id}")
-                return True
-            return False
+        records = await self._query(
+            """
+            MATCH ()-[r]->()
+            WHERE id(r) = toInteger($rel_id)
+            DELETE r
+            RETURN count(r) AS deleted
+            """,
+            {"rel_id": rel_id},
+            write=True,
+        )
+        self._invalidate_cache(nodes=False)
+        # The type of the deleted relationship is not known here
+        self._invalidate_cycles(added=False)
+        deleted = records[0]["deleted"] if records else 0
+
+        if deleted > 0:
+            logger.info(f"Deleted relationship: {rel_id}")
+            return True
+        return False
 
     async def delete_relationships(
         self,
@@ -468,35 +1244,36 @@ class Neo4jDatabase(DatabaseInterface):
         if not self.driver:
             raise DatabaseConnectionError("Not connected to database")
 
-        where_clauses = []
         params: dict[str, Any] = {}
 
+        # Bind the endpoints through their ID indexes before expanding
+        node_matches = []
         if source_id:
-            where_clauses.append("source.id = $source_id")
+            node_matches.append(_match_by_id("source", "$source_id"))
             params["source_id"] = source_id
 
         if target_id:
-            where_clauses.append("target.id = $target_id")
+            node_matches.append(_match_by_id("target", "$target_id"))
             params["target_id"] = target_id
 
-        where_clause = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
-        rel_pattern = f"[r:{rel_type}]" if rel_type else "[r]"
+        rel_pattern = _cql(_REL_PATTERNS, rel_type or None)
 
         query = f"""
+        {" ".join(node_matches)}
         MATCH (source)-{rel_pattern}->(target)
-        {where_clause}
         DELETE r
         RETURN count(r) AS deleted
         """
 
-        async with self.driver.session(database=self.database) as session:
-            result = await session.run(query, **params)
-            record = await result.single()
-            deleted = record["deleted"] if record else 0
+        records = await self._query(query, params, write=True)
+        self._invalidate_cache(nodes=False)
+        if rel_type in (None, "CONTAINS"):
+            self._invalidate_cycles(added=False)
+        deleted = records[0]["deleted"] if records else 0
 
-            if deleted > 0:
-                logger.info(f"Deleted {deleted} relationship(s)")
-            return deleted
+        if deleted > 0:
+            logger.info(f"Deleted {deleted} relationship(s)")
+        return deleted
 
     async def list_relationships(
         self,
@@ -505,6 +1282,7 @@ class Neo4jDatabase(DatabaseInterface):
         rel_type: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[dict[str, Any]]:
         """List relationships matching criteria."""
         if not self.driver:
@@ -513,93 +1291,103 @@ class Neo4jDatabase(DatabaseInterface):
         where_clauses = []
         params: dict[str, Any] = {"limit": limit, "offset": offset}
 
+        if cursor:
+            # Keyset pagination: continue after the cursor's (created_at, id)
+            created_at, cursor_id = decode_cursor(cursor)
+            if not cursor_id.isdigit():
+                raise ValidationError(f"Invalid pagination cursor: '{cursor}'")
+            where_clauses.append(
+                "(r.created_at < $cursor_created_at "
+                "OR (r.created_at = $cursor_created_at AND id(r) < $cursor_id))"
+            )
+            params["cursor_created_at"] = datetime.fromisoformat(created_at)
+            params["cursor_id"] = int(cursor_id)
+            params["offset"] = 0
+
+        # Bind the endpoints through their ID indexes before expanding
+        node_matches = []
         if source_id:
-            where_clauses.append("source.id = $source_id")
+            node_matches.append(_match_by_id("source", "$source_id"))
             params["source_id"] = source_id
 
         if target_id:
-            where_clauses.append("target.id = $target_id")
+            node_matches.append(_match_by_id("target", "$target_id"))
             params["target_id"] = target_id
 
         where_clause = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
-        rel_pattern = f"[r:{rel_type}]" if rel_type else "[r]"
+        rel_pattern = _cql(_REL_PATTERNS, rel_type or None)
 
         query = f"""
+        {" ".join(node_matches)}
         MATCH (source)-{rel_pattern}->(target)
         {where_clause}
         RETURN r, id(r) AS rel_id, type(r) AS rel_type,
                source.id AS source_id, target.id AS target_id
-        ORDER BY r.created_at DESC
+        ORDER BY r.created_at DESC, rel_id DESC
         SKIP $offset
         LIMIT $limit
         """
 
-        async with self.driver.session(database=self.database) as session:
-            result = await session.run(query, **params)
-            records = await result.values()
-
-            relationships = []
-            for record in records:
-                rel_data = _convert_neo4j_types(dict(record[0]))  # r properties
-                relationship = {
-                    "id": str(record[1]),  # rel_id
-                    "type": record[2],  # rel_type
-                    "source_id": record[3],  # source_id
-                    "target_id": record[4],  # target_id
-                    **rel_data,
-                }
-                relationships.append(relationship)
-
-            return relationships
+        records = await self._query(query, params)
+        return await _convert_records(records, _relationship_from_record)
 
     async def check_circular_dependency(self, source_id: str, target_id: str) -> bool:
         """Check if creating CONTAINS relationship would create a cycle."""
         if not self.driver:
             raise DatabaseConnectionError("Not connected to database")
 
+        key = (source_id, target_id)
+        cached = self._cycle_cache.get(key)
+        if cached is not None:
+            self._cache_hits += 1
+            return cached
+        self._cache_misses += 1
+
+        generation = self._cache_generation
         # Check if there's already a path from target to source via CONTAINS
-        async with self.driver.session(database=self.database) as session:
-            result = await session.run(
-                """
-                MATCH path = (target {id: $target_id})-[:CONTAINS*]->(source {id: $source_id})
-                RETURN count(path) > 0 AS has_cycle
-                """,
-                target_id=target_id,
-                source_id=source_id,
-            )
-            record = await result.single()
-            return record["has_cycle"] if record else False
+        # (EXISTS stops at the first one instead of counting every path)
+        records = await self._query(
+            _CHECK_CYCLE_CQL, {"target_id": target_id, "source_id": source_id}
+        )
+        has_cycle = bool(records[0]["has_cycle"]) if records else False
+        if generation == self._cache_generation:
+            self._cycle_cache[key] = has_cycle
+        return has_cycle
 
     async def get_connected_nodes(
         self,
         node_id: str,
         rel_type: str | None = None,
         direction: str = "outgoing",
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """Get nodes connected to a given node."""
         if not self.driver:
             raise DatabaseConnectionError("Not connected to database")
 
-        rel_pattern = f"[:{rel_type}]" if rel_type else "[]"
-
-        if direction == "outgoing":
-            pattern = f"(n {{id: $node_id}})-{rel_pattern}->(connected)"
-        elif direction == "incoming":
-            pattern = f"(n {{id: $node_id}})<-{rel_pattern}-(connected)"
-        elif direction == "both":
-            pattern = f"(n {{id: $node_id}})-{rel_pattern}-(connected)"
-        else:
+        if direction not in _CONNECTED_PATTERNS:
             raise ValueError(f"Invalid direction: {direction}")
 
-        query = f"""
-        MATCH {pattern}
-        RETURN connected
-        """
-
-        async with self.driver.session(database=self.database) as session:
-            result = await session.run(query, node_id=node_id)
-            records = await result.values()
-            return [_deserialize_from_neo4j(dict(record[0])) for record in records]
+        query = _cql(_CONNECTED_NODES_CQL, (rel_type or None, direction))
+
+        key = (node_id, rel_type, direction, limit)
+        cached = self._connected_cache.get(key)
+        if cached is not None:
+            self._cache_hits += 1
+            return copy.deepcopy(cached)
+        self._cache_misses += 1
+
+        generation = self._cache_generation
+        # Hub nodes can have very many neighbours; stream instead of buffering
+        nodes = await self._stream(
+            query,
+            {"node_id": node_id},
+            _node_from_record,
+            limit,
+        )
+        if generation == self._cache_generation:
+            self._connected_cache[key] = nodes
+        return copy.deepcopy(nodes)
 
     # Query Operations
 
@@ -621,47 +1409,48 @@ class Neo4jDatabase(DatabaseInterface):
 
         parameters = parameters or {}
 
-        async with self.driver.session(database=self.database) as session:
-            try:
-                result = await session.run(cypher, **parameters)
-                records = await result.values()
-
-                # Convert records to list of dicts
-                results = []
-                keys = result.keys()
-                for record in records[:limit]:
-                    result_dict = {}
-                    for i, key in enumerate(keys):
-                        value = record[i]
-                        # Convert Neo4j types to Python types and deserialize JSON fields
-                        if hasattr(value, "__dict__"):
-                            result_dict[key] = _deserialize_from_neo4j(dict(value))
-                        else:
-                            result_dict[key] = _convert_neo4j_types(value)
-                    results.append(result_dict)
-
-                return results
+        # Queries that read the clock, draw random values or call procedures
+        # answer differently on every run, so their results are never reused
+        cache_key = None
+        if self.cache_queries and find_volatile_call(cypher) is None:
+            cache_key = hashlib.blake2b(
+                f"{limit}\0{cypher}\0".encode()
+                + json.dumps(parameters, sort_keys=True, default=str).encode()
+            ).digest()
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                generation, cached_results = cached
+                if generation == self._cache_generation:
+                    self._query_cache_hits += 1
+                    return copy.deepcopy(cached_results)
+                # Written to since; drop lazily
+                del self._query_cache[cache_key]
+            self._query_cache_misses += 1
+
+        generation = self._cache_generation
+
+        def convert(record: Record) -> dict[str, Any]:
+            result_dict = {}
+            for key, value in record.items():
+                # Convert Neo4j types to Python types and deserialize JSON fields
+                if hasattr(value, "__dict__"):
+                    result_dict[key] = _deserialize_from_neo4j(dict(value))
+                else:
+                    result_dict[key] = _convert_neo4j_types(value)
+            return result_dict
+
+        # Stream and stop after `limit` rows rather than fetching everything
+        try:
+            results = await self._stream(cypher, parameters, convert, limit)
+        except Neo4jError as e:
+            raise InvalidQueryError(f"Query execution failed: {e}")
 
-            except Neo4jError as e:
-                raise InvalidQueryError(f"Query execution failed: {e}")
+        if cache_key is None:
+            return results
+        if generation == self._cache_generation:
+            self._query_cache[cache_key] = (generation, results)
+        return copy.deepcopy(results)
 
     def _is_readonly_query(self, cypher: str) -> bool:
         """Check if a Cypher query is read-only."""
-        cypher_upper = cypher.upper()
-
-        # List of write operations
-        write_keywords = [
-            "CREATE",
-            "DELETE",
-            "REMOVE",
-            "SET",
-            "MERGE",
-            "DETACH",
-            "DROP",
-        ]
-
-        for keyword in write_keywords:
-            if keyword in cypher_upper:
-                return False
-
-        return True
+        return find_write_keyword(cypher) is None
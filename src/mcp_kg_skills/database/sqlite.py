@@ -4,12 +4,20 @@ This is a lightweight alternative to Neo4j for testing and development.
 It stores the graph structure in relational tables.
 """
 
-import json
+import asyncio
+import copy
+import functools
 import logging
 import sqlite3
-from datetime import datetime
+import uuid
+from collections.abc import Callable, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Concatenate
+
+from cachetools import LRUCache
 
 from ..exceptions import (
     CircularDependencyError,
@@ -17,11 +25,420 @@ from ..exceptions import (
     InvalidQueryError,
     NodeAlreadyExistsError,
     NodeNotFoundError,
+    ValidationError,
 )
+from ..models import BulkLoadPlan
+from ..utils import json_codec
+from ..utils.pagination import decode_cursor
 from .abstract import DatabaseInterface
 
 logger = logging.getLogger(__name__)
 
+# SQLite 3.45+ can keep JSON in its binary JSONB format: smaller rows and no
+# re-tokenizing of the text inside SQLite. json() turns either format back
+# into text, so rows written as plain text before the switch still read fine.
+_JSONB = sqlite3.sqlite_version_info >= (3, 45, 0)
+
+# Extended result codes of a duplicate node: a clashing ID hits the primary
+# key, a clashing name one of the per-type unique name indexes
+_DUPLICATE_ERRORS = frozenset(
+    {sqlite3.SQLITE_CONSTRAINT_PRIMARYKEY, sqlite3.SQLITE_CONSTRAINT_UNIQUE}
+)
+
+
+# Applied on every connection. page_size only takes effect before the first
+# table exists, so it runs first; synchronous=NORMAL is safe with WAL and
+# drops the per-commit fsync of the rollback journal. busy_timeout is left to
+# sqlite3.connect's own timeout (5 seconds).
+_PRAGMAS = (
+    "PRAGMA page_size = 8192",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",  # KiB, i.e. 64 MiB
+    "PRAGMA mmap_size = 268435456",  # 256 MiB
+    "PRAGMA foreign_keys = ON",
+)
+
+# Transitive closure of CONTAINS, kept up to date by triggers so a cycle
+# check is one primary-key probe instead of a graph walk. ``paths`` counts
+# the distinct paths from ancestor to descendant; deleting an edge subtracts
+# the paths running through it and a pair disappears once none are left.
+# (Counting is what makes deletes exact when several paths join two nodes.)
+_CLOSURE_SCHEMA_SQL = (
+    """
+    CREATE TABLE IF NOT EXISTS contains_closure (
+        ancestor TEXT NOT NULL,
+        descendant TEXT NOT NULL,
+        paths INTEGER NOT NULL,
+        PRIMARY KEY (ancestor, descendant)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_contains_closure_descendant
+    ON contains_closure(descendant, ancestor)
+    """,
+    # Every ancestor of the new edge's source (and the source itself) now
+    # reaches every descendant of its target (and the target itself)
+    """
+    CREATE TRIGGER IF NOT EXISTS contains_closure_insert
+    AFTER INSERT ON relationships WHEN NEW.rel_type = 'CONTAINS'
+    BEGIN
+        INSERT INTO contains_closure (ancestor, descendant, paths)
+        SELECT up.ancestor, down.descendant, up.paths * down.paths
+        FROM (
+            SELECT NEW.source_id AS ancestor, 1 AS paths
+            UNION ALL
+            SELECT ancestor, paths FROM contains_closure WHERE descendant = NEW.source_id
+        ) AS up, (
+            SELECT NEW.target_id AS descendant, 1 AS paths
+            UNION ALL
+            SELECT descendant, paths FROM contains_closure WHERE ancestor = NEW.target_id
+        ) AS down
+        WHERE true
+        ON CONFLICT (ancestor, descendant) DO UPDATE SET paths = paths + excluded.paths;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS contains_closure_delete
+    AFTER DELETE ON relationships WHEN OLD.rel_type = 'CONTAINS'
+    BEGIN
+        UPDATE contains_closure
+        SET paths = paths - (
+            CASE WHEN ancestor = OLD.source_id THEN 1 ELSE (
+                SELECT up.paths FROM contains_closure AS up
+                WHERE up.ancestor = contains_closure.ancestor
+                AND up.descendant = OLD.source_id
+            ) END
+        ) * (
+            CASE WHEN descendant = OLD.target_id THEN 1 ELSE (
+                SELECT down.paths FROM contains_closure AS down
+                WHERE down.ancestor = OLD.target_id
+                AND down.descendant = contains_closure.descendant
+            ) END
+        )
+        WHERE (
+            ancestor = OLD.source_id
+            OR ancestor IN (SELECT ancestor FROM contains_closure WHERE descendant = OLD.source_id)
+        ) AND (
+            descendant = OLD.target_id
+            OR descendant IN (SELECT descendant FROM contains_closure WHERE ancestor = OLD.target_id)
+        );
+        DELETE FROM contains_closure
+        WHERE paths <= 0 AND (
+            ancestor = OLD.source_id
+            OR ancestor IN (SELECT ancestor FROM contains_closure WHERE descendant = OLD.source_id)
+        );
+    END
+    """,
+)
+# Fills the closure from existing edges when the table is first created;
+# each walk row is one path, so counting them gives ``paths``. Once the
+# triggers maintain it the closure is only empty without CONTAINS edges,
+# so the emptiness check makes this a no-op on every later start.
+_CLOSURE_BACKFILL_SQL = """
+    INSERT INTO contains_closure (ancestor, descendant, paths)
+    WITH RECURSIVE walk(ancestor, descendant) AS (
+        SELECT source_id, target_id FROM relationships WHERE rel_type = 'CONTAINS'
+        UNION ALL
+        SELECT w.ancestor, r.target_id
+        FROM walk w
+        JOIN relationships r ON r.source_id = w.descendant AND r.rel_type = 'CONTAINS'
+    )
+    SELECT ancestor, descendant, count(*) FROM walk
+    WHERE NOT EXISTS (SELECT 1 FROM contains_closure)
+    GROUP BY ancestor, descendant
+"""
+
+# A CONTAINS edge :source -> :target closes a cycle when target already
+# reaches source (or both are the same node)
+_HAS_CYCLE_EXPR = """(
+    :source = :target
+    OR EXISTS(
+        SELECT 1 FROM contains_closure WHERE ancestor = :target AND descendant = :source
+    )
+)"""
+
+# Endpoint existence plus (for CONTAINS) the cycle check in one statement;
+# only integer flags come back, no node payloads. Used to explain why a gated
+# insert did not add a row.
+_ENDPOINT_CHECK_SQL = """
+    SELECT
+        EXISTS(SELECT 1 FROM nodes WHERE id = :source),
+        EXISTS(SELECT 1 FROM nodes WHERE id = :target),
+        0
+"""
+_CONTAINS_ENDPOINT_CHECK_SQL = f"""
+    SELECT
+        EXISTS(SELECT 1 FROM nodes WHERE id = :source),
+        EXISTS(SELECT 1 FROM nodes WHERE id = :target),
+        {_HAS_CYCLE_EXPR}
+"""
+
+
+def _json_in(param: str = "?") -> str:
+    """SQL expression storing a JSON text parameter in the column format."""
+    return f"jsonb({param})" if _JSONB else param
+
+
+def _json_out(column: str = "properties") -> str:
+    """SQL expression selecting a JSON column as text named ``properties``."""
+    return f"json({column}) AS properties" if _JSONB else column
+
+
+# Hot statements, built once. sqlite3 keeps prepared statements in a
+# per-connection cache keyed by SQL text, so reusing the same strings skips
+# re-compiling them on every call.
+_INSERT_NODE_SQL = f"""
+    INSERT INTO nodes (id, node_type, name, properties, created_at, updated_at)
+    VALUES (?, ?, ?, {_json_in()}, ?, ?)
+"""
+_UPDATE_NODE_SQL = f"""
+    UPDATE nodes
+    SET properties = {_json_in()}, name = ?, updated_at = ?
+    WHERE id = ?
+"""
+_UPDATE_NODE_PROPERTIES_SQL = (
+    f"UPDATE nodes SET properties = {_json_in()}, updated_at = ? WHERE id = ?"
+)
+# Name with case, hyphens, underscores and spaces folded away, as matched by
+# the fuzzy ``name`` filter of list_nodes. The expression index on it must
+# use exactly the same text for the planner to pick it up.
+_NAME_KEY_SQL = "LOWER(REPLACE(REPLACE(REPLACE(name, '-', ''), '_', ''), ' ', ''))"
+_DELETE_NODE_SQL = (
+    "DELETE FROM nodes WHERE id = :id AND (:node_type IS NULL OR node_type = :node_type)"
+)
+_READ_NODE_SQL = f"SELECT node_type, {_json_out()} FROM nodes WHERE id = ?"
+_READ_NODE_BY_NAME_SQL = f"SELECT {_json_out()} FROM nodes WHERE node_type = ? AND name = ?"
+_INSERT_RELATIONSHIP_SQL = f"""
+    INSERT INTO relationships (rel_type, source_id, target_id, properties, created_at)
+    VALUES (?, ?, ?, {_json_in()}, ?)
+"""
+# Only inserts edges that don't exist yet. sqlite3 only binds tuples to
+# plain "?" placeholders, so rel_type, source_id and target_id are passed
+# twice: once to insert and once for the existence check.
+_MERGE_RELATIONSHIP_SQL = f"""
+    INSERT INTO relationships (rel_type, source_id, target_id, properties, created_at)
+    SELECT ?, ?, ?, {_json_in()}, ?
+    WHERE NOT EXISTS (
+        SELECT 1 FROM relationships
+        WHERE rel_type = ? AND source_id = ? AND target_id = ?
+    )
+"""
+# Single-statement relationship creates: the row is only inserted when both
+# endpoints exist (and, for CONTAINS, no path leads back from target to
+# source). rowcount 0 means a check failed; the endpoint check SQL then says
+# which one.
+_GATED_INSERT_RELATIONSHIP_SQL = f"""
+    INSERT INTO relationships (rel_type, source_id, target_id, properties, created_at)
+    SELECT :rel_type, :source, :target, {_json_in(":props")}, :created_at
+    WHERE EXISTS(SELECT 1 FROM nodes WHERE id = :source)
+    AND EXISTS(SELECT 1 FROM nodes WHERE id = :target)
+"""
+_GATED_INSERT_CONTAINS_SQL = f"""
+    {_GATED_INSERT_RELATIONSHIP_SQL}
+    AND NOT {_HAS_CYCLE_EXPR}
+"""
+_CHECK_CYCLE_SQL = f"SELECT {_HAS_CYCLE_EXPR}"
+
+# Neighbour queries keyed by direction. A NULL :rel_type matches any type and
+# a negative :limit means no limit, so each direction is a single statement.
+_CONNECTED_NODES_SQL = {
+    "outgoing": f"""
+        SELECT {_json_out("n.properties")}
+        FROM nodes n
+        JOIN relationships r ON n.id = r.target_id
+        WHERE r.source_id = :node_id
+        AND (:rel_type IS NULL OR r.rel_type = :rel_type)
+        LIMIT :limit
+    """,
+    "incoming": f"""
+        SELECT {_json_out("n.properties")}
+        FROM nodes n
+        JOIN relationships r ON n.id = r.source_id
+        WHERE r.target_id = :node_id
+        AND (:rel_type IS NULL OR r.rel_type = :rel_type)
+        LIMIT :limit
+    """,
+    # An OR across source_id/target_id can't use either adjacency index, so
+    # the neighbour IDs are collected from each covering index separately;
+    # UNION de-duplicates the narrow IDs before any properties are read
+    "both": f"""
+        SELECT {_json_out("n.properties")}
+        FROM nodes n
+        WHERE n.id IN (
+            SELECT target_id FROM relationships
+            WHERE source_id = :node_id
+            AND (:rel_type IS NULL OR rel_type = :rel_type)
+            UNION
+            SELECT source_id FROM relationships
+            WHERE target_id = :node_id
+            AND (:rel_type IS NULL OR rel_type = :rel_type)
+        )
+        AND n.id != :node_id
+        LIMIT :limit
+    """,
+}
+
+# Filter clauses of the listing queries keyed by filter name. A query's text
+# depends only on which filters are set, so the builders below cache it per
+# shape; callers bind parameters in the order the names are passed.
+_NODE_FILTER_SQL = {
+    "name": f" AND {_NAME_KEY_SQL} LIKE ?",
+    # Exact, case-sensitive prefix as a range on the (node_type, name)
+    # index: prefix <= name < successor (LIKE would ignore case)
+    "name_prefix": " AND name >= ? AND name < ?",
+    # Prefix with no successor (only U+10FFFF characters)
+    "name_prefix_open": " AND name >= ?",
+    "created_after": " AND created_at >= ?",
+    "created_before": " AND created_at <= ?",
+    # Keyset pagination: continue after the cursor's (created_at, id)
+    "cursor": " AND (created_at, id) < (?, ?)",
+}
+_RELATIONSHIP_FILTER_SQL = {
+    "source_id": " AND source_id = ?",
+    "target_id": " AND target_id = ?",
+    "rel_type": " AND rel_type = ?",
+    # Keyset pagination: continue after the cursor's (created_at, id)
+    "cursor": " AND (created_at, id) < (?, ?)",
+}
+
+
+def _prefix_successor(prefix: str) -> str | None:
+    """Get the smallest string greater than every string starting with prefix.
+
+    Args:
+        prefix: Name prefix
+
+    Returns:
+        Upper bound for a ``name < ?`` range, or None if there is none
+    """
+    stripped = prefix.rstrip("\U0010ffff")
+    if not stripped:
+        return None
+    code = ord(stripped[-1]) + 1
+    if 0xD800 <= code <= 0xDFFF:
+        # Surrogates can't be stored as UTF-8 text
+        code = 0xE000
+    return stripped[:-1] + chr(code)
+
+
+@functools.lru_cache(maxsize=64)
+def _list_nodes_sql(filters: tuple[str, ...]) -> str:
+    """Build the list_nodes query for a combination of set filters."""
+    return (
+        f"SELECT created_at, {_json_out()} FROM nodes WHERE node_type = ?"
+        + "".join(_NODE_FILTER_SQL[name] for name in filters)
+        + " ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _list_relationships_sql(filters: tuple[str, ...]) -> str:
+    """Build the list_relationships query for a combination of set filters."""
+    return (
+        f"SELECT id, rel_type, source_id, target_id, {_json_out()} FROM relationships WHERE 1=1"
+        + "".join(_RELATIONSHIP_FILTER_SQL[name] for name in filters)
+        + " ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _delete_relationships_sql(filters: tuple[str, ...]) -> str:
+    """Build the delete_relationships statement for a combination of set filters."""
+    return "DELETE FROM relationships WHERE 1=1" + "".join(
+        _RELATIONSHIP_FILTER_SQL[name] for name in filters
+    )
+
+
+_SCHEMA_SQL = f"""
+    CREATE TABLE IF NOT EXISTS nodes (
+        id TEXT PRIMARY KEY,
+        node_type TEXT NOT NULL,
+        name TEXT,
+        properties BLOB NOT NULL,  -- JSON (JSONB on SQLite 3.45+)
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS relationships (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        rel_type TEXT NOT NULL,
+        source_id TEXT NOT NULL,
+        target_id TEXT NOT NULL,
+        properties BLOB,  -- JSON (JSONB on SQLite 3.45+)
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (source_id) REFERENCES nodes(id) ON DELETE CASCADE,
+        FOREIGN KEY (target_id) REFERENCES nodes(id) ON DELETE CASCADE
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_nodes_type_name ON nodes(node_type, name);
+    CREATE INDEX IF NOT EXISTS idx_nodes_created ON nodes(created_at);
+
+    -- The fuzzy name filter's LIKE has a leading wildcard, so it can't seek;
+    -- with the folded name stored in the index it is checked there instead
+    -- of recomputed from every row of the type
+    CREATE INDEX IF NOT EXISTS idx_nodes_type_name_key ON nodes(node_type, {_NAME_KEY_SQL});
+
+    -- Adjacency indexes covering (endpoint, type, other endpoint), so
+    -- traversals and cycle checks hop without touching the table. They
+    -- replace the earlier single-column indexes.
+    CREATE INDEX IF NOT EXISTS idx_rel_src_type_tgt
+    ON relationships(source_id, rel_type, target_id);
+    CREATE INDEX IF NOT EXISTS idx_rel_tgt_type_src
+    ON relationships(target_id, rel_type, source_id);
+    DROP INDEX IF EXISTS idx_relationships_source;
+    DROP INDEX IF EXISTS idx_relationships_target;
+    DROP INDEX IF EXISTS idx_relationships_type;
+
+    -- Unique constraints for node names (per type)
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_skill_name ON nodes(node_type, name)
+    WHERE node_type = 'SKILL' AND name IS NOT NULL;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_script_name ON nodes(node_type, name)
+    WHERE node_type = 'SCRIPT' AND name IS NOT NULL;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_env_name ON nodes(node_type, name)
+    WHERE node_type = 'ENV' AND name IS NOT NULL;
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_knowledge_name ON nodes(node_type, name)
+    WHERE node_type = 'KNOWLEDGE' AND name IS NOT NULL;
+
+    {";".join(_CLOSURE_SCHEMA_SQL)};
+    {_CLOSURE_BACKFILL_SQL};
+"""
+
+
+# Node fields kept in their own columns; list_nodes_columnar reads these
+# directly and everything else out of the properties JSON
+_NODE_COLUMNS = frozenset({"id", "name", "created_at", "updated_at"})
+
+
+def _relationship_filters(
+    source_id: str | None, target_id: str | None, rel_type: str | None
+) -> tuple[tuple[str, ...], list[Any]]:
+    """Return the names and parameters of the set relationship filters."""
+    given = {"source_id": source_id, "target_id": target_id, "rel_type": rel_type}
+    applied = tuple(name for name, value in given.items() if value)
+    return applied, [given[name] for name in applied]
+
+
+def _on_db_thread[**P, T](
+    method: Callable[Concatenate["SQLiteDatabase", P], T],
+) -> Callable[Concatenate["SQLiteDatabase", P], Coroutine[Any, Any, T]]:
+    """Turn a blocking adapter method into a coroutine run on the database thread.
+
+    sqlite3 calls block, so they run on the adapter's single worker thread
+    instead of stalling the event loop. With one thread every call on the
+    connection is serialised, which also keeps read-modify-write methods
+    from interleaving.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: "SQLiteDatabase", *args: P.args, **kwargs: P.kwargs) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(method, self, *args, **kwargs)
+        )
+
+    return wrapper
+
 
 class SQLiteDatabase(DatabaseInterface):
     """SQLite implementation of the database interface.
@@ -32,107 +449,142 @@ class SQLiteDatabase(DatabaseInterface):
     - Provides graph query capabilities via SQL
     """
 
-    def __init__(self, db_path: str | Path = ":memory:"):
+    def __init__(self, db_path: str | Path = ":memory:", cache_size: int = 10_000):
         """Initialize SQLite database connection.
 
         Args:
             db_path: Path to SQLite database file, or ":memory:" for in-memory database
+            cache_size: Maximum entries per in-process read cache
         """
         self.db_path = str(db_path) if db_path != ":memory:" else ":memory:"
         self.connection: sqlite3.Connection | None = None
+        # The connection is opened on, and only ever used from, this thread
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Read-through caches for traversals that revisit the same nodes.
+        # Only this adapter writes through its connection, so entries stay
+        # valid until one of its own writes invalidates them.
+        self._node_cache: LRUCache[str, tuple[str, dict[str, Any]]] = LRUCache(cache_size)
+        self._connected_cache: LRUCache[tuple[Any, ...], list[dict[str, Any]]] = LRUCache(
+            cache_size
+        )
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     async def connect(self) -> None:
         """Establish connection to SQLite."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        await self._open()
+
+    async def disconnect(self) -> None:
+        """Close SQLite connection."""
+        await self._close()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @_on_db_thread
+    def _open(self) -> None:
+        """Open the connection and apply the connection PRAGMAs."""
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            # Autocommit mode: multi-statement writes open their own
+            # transaction (see _transaction) instead of relying on the
+            # module's implicit BEGIN before each DML statement
+            self.connection = sqlite3.connect(
+                self.db_path, isolation_level=None, cached_statements=256
+            )
             self.connection.row_factory = sqlite3.Row  # Enable dict-like access
+            for pragma in _PRAGMAS:
+                self.connection.execute(pragma)
+            if self.db_path != ":memory:":
+                # In-memory databases have no journal file to put in WAL mode
+                self.connection.execute("PRAGMA journal_mode = WAL")
             logger.info(f"Connected to SQLite at {self.db_path}")
-        except Exception as e:
+        except sqlite3.Error as e:
             raise DatabaseConnectionError(f"Failed to connect to SQLite: {e}")
 
-    async def disconnect(self) -> None:
-        """Close SQLite connection."""
+    @_on_db_thread
+    def _close(self) -> None:
+        """Close the connection if it is open."""
         if self.connection:
             self.connection.close()
             self.connection = None
             logger.info("Disconnected from SQLite")
 
-    async def initialize_schema(self) -> None:
-        """Initialize database schema."""
+    def cache_stats(self) -> dict[str, int]:
+        """Return hit/miss counters and sizes of the read caches."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "nodes": len(self._node_cache),
+            "connected": len(self._connected_cache),
+        }
+
+    def _invalidate_cache(self, *node_ids: str) -> None:
+        """Drop cached reads affected by a write.
+
+        Args:
+            node_ids: Nodes that were updated or deleted; none when only
+                relationships changed
+        """
+        for node_id in node_ids:
+            self._node_cache.pop(node_id, None)
+        # Connected lists embed node data and depend on relationships
+        self._connected_cache.clear()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run the enclosed statements in one ``BEGIN IMMEDIATE`` transaction.
+
+        The write lock is taken up front, so the whole operation commits (and
+        syncs) once. Any exception rolls the transaction back and propagates.
+
+        Yields:
+            Cursor to run the statements on
+        """
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
+        cursor = self.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
 
+    def _tuple_cursor(self) -> sqlite3.Cursor:
+        """Return a cursor yielding plain tuples for hot listing queries.
+
+        Rows are unpacked by position while iterating the cursor, which skips
+        building ``sqlite3.Row`` objects and a full ``fetchall`` list.
+        """
+        if not self.connection:
+            raise DatabaseConnectionError("Not connected to database")
         cursor = self.connection.cursor()
+        cursor.row_factory = None
+        return cursor
+
+    @_on_db_thread
+    def initialize_schema(self) -> None:
+        """Initialize database schema."""
+        if not self.connection:
+            raise DatabaseConnectionError("Not connected to database")
+
+        # One script, so the whole schema is parsed and applied in a single
+        # call; executescript runs it as written, BEGIN and COMMIT included
+        try:
+            self.connection.executescript(f"BEGIN IMMEDIATE; {_SCHEMA_SQL} COMMIT;")
+        except BaseException:
+            if self.connection.in_transaction:
+                self.connection.execute("ROLLBACK")
+            raise
 
-        # Nodes table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS nodes (
-                id TEXT PRIMARY KEY,
-                node_type TEXT NOT NULL,
-                name TEXT,
-                properties TEXT NOT NULL,  -- JSON
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Relationships table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS relationships (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                rel_type TEXT NOT NULL,
-                source_id TEXT NOT NULL,
-                target_id TEXT NOT NULL,
-                properties TEXT,  -- JSON
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (source_id) REFERENCES nodes(id) ON DELETE CASCADE,
-                FOREIGN KEY (target_id) REFERENCES nodes(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Indexes
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_nodes_type_name
-            ON nodes(node_type, name)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_nodes_created
-            ON nodes(created_at)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_relationships_source
-            ON relationships(source_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_relationships_target
-            ON relationships(target_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_relationships_type
-            ON relationships(rel_type)
-        """)
-
-        # Unique constraints for node names (per type)
-        cursor.execute("""
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_skill_name
-            ON nodes(node_type, name)
-            WHERE node_type = 'SKILL' AND name IS NOT NULL
-        """)
-        cursor.execute("""
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_script_name
-            ON nodes(node_type, name)
-            WHERE node_type = 'SCRIPT' AND name IS NOT NULL
-        """)
-        cursor.execute("""
-            CREATE UNIQUE INDEX IF NOT EXISTS idx_env_name
-            ON nodes(node_type, name)
-            WHERE node_type = 'ENV' AND name IS NOT NULL
-        """)
-
-        self.connection.commit()
         logger.info("SQLite schema initialized")
 
-    async def health_check(self) -> bool:
+    @_on_db_thread
+    def health_check(self) -> bool:
         """Check database connection health."""
         if not self.connection:
             return False
@@ -141,13 +593,14 @@ class SQLiteDatabase(DatabaseInterface):
             cursor = self.connection.cursor()
             cursor.execute("SELECT 1")
             return True
-        except Exception as e:
+        except sqlite3.Error as e:
             logger.error(f"Health check failed: {e}")
             return False
 
     # Node Operations
 
-    async def create_node(self, node_type: str, data: dict[str, Any]) -> dict[str, Any]:
+    @_on_db_thread
+    def create_node(self, node_type: str, data: dict[str, Any]) -> dict[str, Any]:
         """Create a new node."""
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
@@ -161,173 +614,443 @@ class SQLiteDatabase(DatabaseInterface):
         node_id = data.get("id")
         if not node_id:
             # Generate UUID if not provided
-            import uuid
-
             node_id = str(uuid.uuid4())
             data["id"] = node_id
 
         name = data.get("name")
-        now = datetime.utcnow().isoformat()
+        now = datetime.now(UTC).isoformat()
 
         # Store all data as JSON in properties
-        properties = json.dumps(data)
+        properties = json_codec.dumps(data)
 
         try:
             cursor.execute(
-                """
-                INSERT INTO nodes (id, node_type, name, properties, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                _INSERT_NODE_SQL,
                 (node_id, node_type, name, properties, now, now),
             )
-            self.connection.commit()
 
-            # Return the created node
-            return {**data, "created_at": now, "updated_at": now}
+            # Return the created node; the copy made above is ours to extend
+            data["created_at"] = data["updated_at"] = now
+            return data
 
         except sqlite3.IntegrityError as e:
-            if "UNIQUE constraint failed" in str(e):
+            if e.sqlite_errorcode in _DUPLICATE_ERRORS:
                 raise NodeAlreadyExistsError(name or "unknown", node_type)
             raise DatabaseConnectionError(f"Failed to create node: {e}")
 
-    async def read_node(self, node_id: str) -> dict[str, Any] | None:
+    @_on_db_thread
+    def create_nodes_bulk(self, node_type: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create multiple nodes with a single executemany in one transaction."""
+        if not self.connection:
+            raise DatabaseConnectionError("Not connected to database")
+
+        if not rows:
+            return []
+
+        now = datetime.now(UTC).isoformat()
+        created = []
+        params = []
+
+        for data in rows:
+            data = data.copy()
+            node_id = data.get("id")
+            if not node_id:
+                node_id = str(uuid.uuid4())
+                data["id"] = node_id
+
+            params.append((node_id, node_type, data.get("name"), json_codec.dumps(data), now, now))
+            # Timestamps go on the copy after it was serialised, as in create_node
+            data["created_at"] = data["updated_at"] = now
+            created.append(data)
+
+        try:
+            with self._transaction() as cursor:
+                cursor.executemany(
+                    _INSERT_NODE_SQL,
+                    params,
+                )
+
+        except sqlite3.IntegrityError as e:
+            if e.sqlite_errorcode in _DUPLICATE_ERRORS:
+                names = ", ".join(str(data.get("name", "unknown")) for data in rows)
+                raise NodeAlreadyExistsError(names, node_type)
+            raise DatabaseConnectionError(f"Failed to create nodes: {e}")
+
+        logger.info(f"Created {len(created)} {node_type} nodes")
+        return created
+
+    @_on_db_thread
+    def upsert_nodes_bulk(self, node_type: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create or update multiple nodes matched by name in one transaction."""
+        if not self.connection:
+            raise DatabaseConnectionError("Not connected to database")
+
+        if not rows:
+            return []
+
+        existing = self._read_nodes_by_names(node_type, [data["name"] for data in rows])
+        now = datetime.now(UTC).isoformat()
+        nodes = []
+        inserts = []
+        updates = []
+
+        for data in rows:
+            current = existing.get(data["name"])
+            if current:
+                # Existing nodes keep their identity and creation time
+                node = {
+                    **current,
+                    **{k: v for k, v in data.items() if k not in ("id", "created_at")},
+                    "updated_at": now,
+                }
+                updates.append((json_codec.dumps(node), now, node["id"]))
+            else:
+                node = {"id": str(uuid.uuid4()), **data}
+                inserts.append(
+                    (node["id"], node_type, node["name"], json_codec.dumps(node), now, now)
+                )
+                node = {**node, "created_at": now, "updated_at": now}
+                # Later rows with the same name update this one
+                existing[data["name"]] = node
+            nodes.append(node)
+
+        try:
+            with self._transaction() as cursor:
+                cursor.executemany(
+                    _INSERT_NODE_SQL,
+                    inserts,
+                )
+                cursor.executemany(
+                    _UPDATE_NODE_PROPERTIES_SQL,
+                    updates,
+                )
+
+        except sqlite3.IntegrityError as e:
+            raise DatabaseConnectionError(f"Failed to upsert nodes: {e}")
+
+        if updates:
+            self._invalidate_cache(*(node_id for _, _, node_id in updates))
+
+        logger.info(f"Upserted {len(nodes)} {node_type} nodes")
+        return nodes
+
+    @_on_db_thread
+    def bulk_load(self, plan: BulkLoadPlan) -> dict[str, str]:
+        """Create all nodes and relationships of a plan in one transaction."""
+        if not self.connection:
+            raise DatabaseConnectionError("Not connected to database")
+
+        try:
+            ids = plan.node_ids_by_name()
+            relationships = plan.resolve_relationships(ids)
+        except ValueError as e:
+            raise ValidationError(str(e))
+
+        cycle = plan.find_contains_cycle()
+        if cycle:
+            raise CircularDependencyError(ids[cycle[0]], ids[cycle[1]])
+
+        now = datetime.now(UTC).isoformat()
+
+        node_params = [
+            (data["id"], node_type.value, data.get("name"), json_codec.dumps(data), now, now)
+            for node_type, rows in plan.nodes.items()
+            for data in rows
+        ]
+        rel_params = [
+            (
+                rel_type,
+                source_id,
+                target_id,
+                json_codec.dumps({**properties, "created_at": now}),
+                now,
+            )
+            for rel_type, edges in relationships.items()
+            for source_id, target_id, properties in edges
+        ]
+
+        try:
+            with self._transaction() as cursor:
+                cursor.executemany(
+                    _INSERT_NODE_SQL,
+                    node_params,
+                )
+                cursor.executemany(
+                    _INSERT_RELATIONSHIP_SQL,
+                    rel_params,
+                )
+
+        except sqlite3.IntegrityError as e:
+            if e.sqlite_errorcode in _DUPLICATE_ERRORS:
+                # Rolled back; report only the names that are already taken
+                for node_type, rows in plan.nodes.items():
+                    taken = self._read_nodes_by_names(
+                        node_type.value, [row["name"] for row in rows]
+                    )
+                    if taken:
+                        raise NodeAlreadyExistsError(", ".join(taken), node_type.value)
+            raise DatabaseConnectionError(f"Bulk load failed: {e}")
+
+        self._invalidate_cache()
+
+        logger.info(f"Bulk loaded {len(node_params)} nodes and {len(rel_params)} relationships")
+        return ids
+
+    @_on_db_thread
+    def read_node(self, node_id: str, node_type: str | None = None) -> dict[str, Any] | None:
         """Retrieve a node by ID."""
+        return self._read_node(node_id, node_type)
+
+    def _read_node(self, node_id: str, node_type: str | None = None) -> dict[str, Any] | None:
+        """Retrieve a node by ID on the database thread."""
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
 
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "SELECT properties FROM nodes WHERE id = ?",
-            (node_id,),
-        )
-        row = cursor.fetchone()
+        cached = self._node_cache.get(node_id)
+        if cached is None:
+            self._cache_misses += 1
+            cursor = self._tuple_cursor()
+            cursor.execute(_READ_NODE_SQL, (node_id,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            cached = (row[0], json_codec.loads(row[1]))
+            self._node_cache[node_id] = cached
+        else:
+            self._cache_hits += 1
 
-        if row:
-            return json.loads(row["properties"])
-        return None
+        label, node = cached
+        # Deep copies keep callers from mutating the cached entry, nested
+        # values included
+        return copy.deepcopy(node) if node_type in (None, label) else None
 
-    async def read_node_by_name(self, node_type: str, name: str) -> dict[str, Any] | None:
+    @_on_db_thread
+    def read_node_by_name(self, node_type: str, name: str) -> dict[str, Any] | None:
         """Retrieve a node by type and name."""
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
 
         cursor = self.connection.cursor()
         cursor.execute(
-            "SELECT properties FROM nodes WHERE node_type = ? AND name = ?",
+            _READ_NODE_BY_NAME_SQL,
             (node_type, name),
         )
         row = cursor.fetchone()
 
         if row:
-            return json.loads(row["properties"])
+            return json_codec.loads(row["properties"])
         return None
 
-    async def update_node(self, node_id: str, data: dict[str, Any]) -> dict[str, Any]:
-        """Update an existing node."""
+    @_on_db_thread
+    def read_nodes_by_names(self, node_type: str, names: list[str]) -> dict[str, dict[str, Any]]:
+        """Retrieve several nodes of one type by name in a single query."""
+        return self._read_nodes_by_names(node_type, names)
+
+    def _read_nodes_by_names(self, node_type: str, names: list[str]) -> dict[str, dict[str, Any]]:
+        """Retrieve several nodes of one type by name on the database thread."""
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
 
-        # First, get existing node
-        existing = await self.read_node(node_id)
-        if not existing:
-            raise NodeNotFoundError(node_id)
+        if not names:
+            return {}
 
-        # Merge updates
-        updated_data = {**existing, **data}
-        updated_data["updated_at"] = datetime.utcnow().isoformat()
+        placeholders = ", ".join("?" for _ in names)
+        cursor = self._tuple_cursor()
+        cursor.execute(
+            f"SELECT name, {_json_out()} FROM nodes "
+            f"WHERE node_type = ? AND name IN ({placeholders})",
+            (node_type, *names),
+        )
+        return {name: json_codec.loads(props) for name, props in cursor}
 
-        cursor = self.connection.cursor()
-        properties = json.dumps(updated_data)
-        name = updated_data.get("name")
+    @_on_db_thread
+    def read_nodes_by_ids(self, node_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Retrieve several nodes by ID in a single query."""
+        if not self.connection:
+            raise DatabaseConnectionError("Not connected to database")
 
-        try:
-            cursor.execute(
-                """
-                UPDATE nodes
-                SET properties = ?, name = ?, updated_at = ?
-                WHERE id = ?
-                """,
-                (properties, name, updated_data["updated_at"], node_id),
-            )
-            self.connection.commit()
+        if not node_ids:
+            return {}
+
+        placeholders = ", ".join("?" for _ in node_ids)
+        cursor = self._tuple_cursor()
+        cursor.execute(
+            f"SELECT id, {_json_out()} FROM nodes WHERE id IN ({placeholders})",
+            tuple(node_ids),
+        )
+        return {node_id: json_codec.loads(props) for node_id, props in cursor}
+
+    def _missing_node_id(self, node_ids: list[str]) -> str | None:
+        """Return the first of the given IDs without a node, if any.
 
+        Only the ID column is read, so endpoint checks don't decode every
+        node's properties.
+        """
+        if not self.connection:
+            raise DatabaseConnectionError("Not connected to database")
+
+        unique_ids = list(dict.fromkeys(node_ids))
+        placeholders = ", ".join("?" for _ in unique_ids)
+        cursor = self._tuple_cursor()
+        cursor.execute(f"SELECT id FROM nodes WHERE id IN ({placeholders})", unique_ids)
+        existing = {node_id for (node_id,) in cursor}
+        return next((node_id for node_id in unique_ids if node_id not in existing), None)
+
+    @_on_db_thread
+    def update_node(
+        self, node_id: str, data: dict[str, Any], node_type: str | None = None
+    ) -> dict[str, Any]:
+        """Update an existing node."""
+        if not self.connection:
+            raise DatabaseConnectionError("Not connected to database")
+
+        name = None
+        try:
+            # Read and write under one write lock so a concurrent update
+            # can't slip in between
+            with self._transaction() as cursor:
+                existing = self._read_node(node_id, node_type)
+                if not existing:
+                    raise NodeNotFoundError(node_id)
+
+                # Merge updates into the fresh copy _read_node returned
+                updated_data = existing
+                updated_data.update(data)
+                updated_data["updated_at"] = datetime.now(UTC).isoformat()
+                name = updated_data.get("name")
+
+                cursor.execute(
+                    _UPDATE_NODE_SQL,
+                    (json_codec.dumps(updated_data), name, updated_data["updated_at"], node_id),
+                )
+
+            self._invalidate_cache(node_id)
             return updated_data
 
         except sqlite3.IntegrityError as e:
-            if "UNIQUE constraint failed" in str(e):
+            if e.sqlite_errorcode in _DUPLICATE_ERRORS:
                 raise NodeAlreadyExistsError(name or "unknown", "node")
             raise DatabaseConnectionError(f"Failed to update node: {e}")
 
-    async def delete_node(self, node_id: str) -> bool:
+    @_on_db_thread
+    def delete_node(self, node_id: str, node_type: str | None = None) -> bool:
         """Delete a node and all its relationships."""
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
 
+        # foreign_keys is on, so ON DELETE CASCADE removes the node's
+        # relationships (and the closure triggers fire) in this statement
         cursor = self.connection.cursor()
-
-        # Delete relationships first (CASCADE should handle this, but be explicit)
-        cursor.execute(
-            "DELETE FROM relationships WHERE source_id = ? OR target_id = ?",
-            (node_id, node_id),
-        )
-
-        # Delete node
-        cursor.execute("DELETE FROM nodes WHERE id = ?", (node_id,))
+        cursor.execute(_DELETE_NODE_SQL, {"id": node_id, "node_type": node_type or None})
         deleted = cursor.rowcount > 0
 
-        self.connection.commit()
-
+        self._invalidate_cache(node_id)
         if deleted:
             logger.info(f"Deleted node: {node_id}")
         return deleted
 
-    async def list_nodes(
+    @_on_db_thread
+    def list_nodes(
         self,
         node_type: str,
         filters: dict[str, Any] | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[dict[str, Any]]:
         """List nodes with optional filtering."""
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
 
         filters = filters or {}
-        cursor = self.connection.cursor()
-
-        # Build query
-        query = "SELECT properties FROM nodes WHERE node_type = ?"
+        applied: list[str] = []
         params: list[Any] = [node_type]
 
-        if "name" in filters and filters["name"]:
+        if filters.get("name"):
             # Case-insensitive matching with normalized comparison
             # Removes hyphens, underscores, spaces for fuzzy matching
             # e.g., "sales-connect" matches "salesconnect", "Sales_Connect", etc.
             normalized_search = (
                 filters["name"].lower().replace("-", "").replace("_", "").replace(" ", "")
             )
-            query += " AND LOWER(REPLACE(REPLACE(REPLACE(name, '-', ''), '_', ''), ' ', '')) LIKE ?"
+            applied.append("name")
             params.append(f"%{normalized_search}%")
 
-        if "created_after" in filters and filters["created_after"]:
-            query += " AND created_at >= ?"
+        if filters.get("name_prefix"):
+            prefix = filters["name_prefix"]
+            successor = _prefix_successor(prefix)
+            if successor is None:
+                applied.append("name_prefix_open")
+                params.append(prefix)
+            else:
+                applied.append("name_prefix")
+                params.extend([prefix, successor])
+
+        if filters.get("created_after"):
+            applied.append("created_after")
             params.append(filters["created_after"].isoformat())
 
-        if "created_before" in filters and filters["created_before"]:
-            query += " AND created_at <= ?"
+        if filters.get("created_before"):
+            applied.append("created_before")
             params.append(filters["created_before"].isoformat())
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        if cursor:
+            applied.append("cursor")
+            params.extend(decode_cursor(cursor))
+            offset = 0
+
         params.extend([limit, offset])
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        db_cursor = self._tuple_cursor()
+        db_cursor.execute(_list_nodes_sql(tuple(applied)), params)
+        # created_at only lives in its column; listings include it so callers
+        # can build the next page's cursor
+        return [
+            {**json_codec.loads(props), "created_at": created_at} for created_at, props in db_cursor
+        ]
+
+    @_on_db_thread
+    def list_nodes_columnar(self, node_type: str, fields: list[str]) -> dict[str, list[Any]]:
+        """Export selected fields of every node of a type, one list per field."""
+        if not self.connection:
+            raise DatabaseConnectionError("Not connected to database")
 
-        return [json.loads(row["properties"]) for row in rows]
+        if not fields:
+            return {}
+
+        # JSON fields come back as JSON text (json_quote keeps objects and
+        # arrays as they are) so nested values decode to the same types
+        # list_nodes returns
+        selects = []
+        paths = []
+        for field in fields:
+            if field in _NODE_COLUMNS:
+                selects.append(field)
+            elif '"' in field:
+                raise ValidationError(f"Invalid field name: {field}")
+            else:
+                selects.append("json_quote(json_extract(properties, ?))")
+                paths.append(f'$."{field}"')
+
+        cursor = self._tuple_cursor()
+        cursor.execute(
+            f"SELECT {', '.join(selects)} FROM nodes WHERE node_type = ? "
+            "ORDER BY created_at DESC, id DESC",
+            (*paths, node_type),
+        )
+        columns = list(zip(*cursor, strict=True)) or [()] * len(fields)
+
+        return {
+            field: list(values)
+            if field in _NODE_COLUMNS
+            else [json_codec.loads(value) for value in values]
+            for field, values in zip(fields, columns, strict=True)
+        }
 
     # Relationship Operations
 
-    async def create_relationship(
+    @_on_db_thread
+    def create_relationship(
         self,
         rel_type: str,
         source_id: str,
@@ -338,36 +1061,38 @@ class SQLiteDatabase(DatabaseInterface):
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
 
-        # Check nodes exist
-        source = await self.read_node(source_id)
-        if not source:
-            raise NodeNotFoundError(source_id)
-
-        target = await self.read_node(target_id)
-        if not target:
-            raise NodeNotFoundError(target_id)
-
-        # Check for circular dependencies if CONTAINS
-        if rel_type == "CONTAINS":
-            if await self.check_circular_dependency(source_id, target_id):
-                raise CircularDependencyError(source_id, target_id)
-
         properties = properties or {}
-        properties["created_at"] = datetime.utcnow().isoformat()
-        props_json = json.dumps(properties)
+        properties["created_at"] = datetime.now(UTC).isoformat()
+        props_json = json_codec.dumps(properties)
 
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            INSERT INTO relationships (rel_type, source_id, target_id, properties, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (rel_type, source_id, target_id, props_json, properties["created_at"]),
-        )
-        self.connection.commit()
+        contains = rel_type == "CONTAINS"
+        params = {"source": source_id, "target": target_id}
 
-        rel_id = cursor.lastrowid
+        # The insert checks its own preconditions; the diagnosis on failure
+        # runs under the same write lock, so it sees the same graph
+        with self._transaction() as cursor:
+            cursor.execute(
+                _GATED_INSERT_CONTAINS_SQL if contains else _GATED_INSERT_RELATIONSHIP_SQL,
+                {
+                    **params,
+                    "rel_type": rel_type,
+                    "props": props_json,
+                    "created_at": properties["created_at"],
+                },
+            )
+            if cursor.rowcount == 0:
+                cursor.execute(
+                    _CONTAINS_ENDPOINT_CHECK_SQL if contains else _ENDPOINT_CHECK_SQL, params
+                )
+                source_exists, target_exists, _ = cursor.fetchone()
+                if not source_exists:
+                    raise NodeNotFoundError(source_id)
+                if not target_exists:
+                    raise NodeNotFoundError(target_id)
+                raise CircularDependencyError(source_id, target_id)
+            rel_id = cursor.lastrowid
 
+        self._invalidate_cache()
         logger.info(f"Created {rel_type} relationship: {source_id} -> {target_id}")
 
         return {
@@ -378,7 +1103,62 @@ class SQLiteDatabase(DatabaseInterface):
             **properties,
         }
 
-    async def delete_relationship(self, rel_id: str) -> bool:
+    @_on_db_thread
+    def create_relationships_bulk(
+        self,
+        rel_type: str,
+        edges: list[tuple[str, str, dict[str, Any] | None]],
+        merge: bool = False,
+    ) -> int:
+        """Create many relationships with a single executemany in one transaction."""
+        if not self.connection:
+            raise DatabaseConnectionError("Not connected to database")
+
+        if not edges:
+            return 0
+
+        # Check all endpoints exist with one lookup
+        missing = self._missing_node_id(
+            [node_id for source_id, target_id, _ in edges for node_id in (source_id, target_id)]
+        )
+        if missing:
+            raise NodeNotFoundError(missing)
+
+        now = datetime.now(UTC).isoformat()
+        params = [
+            (
+                rel_type,
+                source_id,
+                target_id,
+                json_codec.dumps({**(properties or {}), "created_at": now}),
+                now,
+            )
+            for source_id, target_id, properties in edges
+        ]
+
+        if merge:
+            insert_sql = _MERGE_RELATIONSHIP_SQL
+            params = [row + row[:3] for row in params]
+        else:
+            insert_sql = _INSERT_RELATIONSHIP_SQL
+
+        # Raising inside the transaction rolls the inserts back
+        with self._transaction() as cursor:
+            cursor.executemany(insert_sql, params)
+
+            if rel_type == "CONTAINS":
+                # With the new edges in place, a path back from target to source
+                # means one of them closed a cycle
+                for source_id, target_id, _ in edges:
+                    if self._has_cycle(source_id, target_id):
+                        raise CircularDependencyError(source_id, target_id)
+
+        self._invalidate_cache()
+        logger.info(f"Created {len(params)} {rel_type} relationships")
+        return len(params)
+
+    @_on_db_thread
+    def delete_relationship(self, rel_id: str) -> bool:
         """Delete a relationship by ID."""
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
@@ -386,13 +1166,14 @@ class SQLiteDatabase(DatabaseInterface):
         cursor = self.connection.cursor()
         cursor.execute("DELETE FROM relationships WHERE id = ?", (int(rel_id),))
         deleted = cursor.rowcount > 0
-        self.connection.commit()
 
         if deleted:
+            self._invalidate_cache()
             logger.info(f"Deleted relationship: {rel_id}")
         return deleted
 
-    async def delete_relationships(
+    @_on_db_thread
+    def delete_relationships(
         self,
         source_id: str | None = None,
         target_id: str | None = None,
@@ -402,162 +1183,112 @@ class SQLiteDatabase(DatabaseInterface):
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
 
-        query = "DELETE FROM relationships WHERE 1=1"
-        params: list[Any] = []
-
-        if source_id:
-            query += " AND source_id = ?"
-            params.append(source_id)
-
-        if target_id:
-            query += " AND target_id = ?"
-            params.append(target_id)
-
-        if rel_type:
-            query += " AND rel_type = ?"
-            params.append(rel_type)
+        applied, params = _relationship_filters(source_id, target_id, rel_type)
 
         cursor = self.connection.cursor()
-        cursor.execute(query, params)
+        cursor.execute(_delete_relationships_sql(applied), params)
         deleted = cursor.rowcount
-        self.connection.commit()
 
         if deleted > 0:
+            self._invalidate_cache()
             logger.info(f"Deleted {deleted} relationship(s)")
         return deleted
 
-    async def list_relationships(
+    @_on_db_thread
+    def list_relationships(
         self,
         source_id: str | None = None,
         target_id: str | None = None,
         rel_type: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> list[dict[str, Any]]:
         """List relationships matching criteria."""
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
 
-        query = "SELECT id, rel_type, source_id, target_id, properties FROM relationships WHERE 1=1"
-        params: list[Any] = []
-
-        if source_id:
-            query += " AND source_id = ?"
-            params.append(source_id)
-
-        if target_id:
-            query += " AND target_id = ?"
-            params.append(target_id)
+        applied, params = _relationship_filters(source_id, target_id, rel_type)
 
-        if rel_type:
-            query += " AND rel_type = ?"
-            params.append(rel_type)
+        if cursor:
+            created_at, rel_id = decode_cursor(cursor)
+            if not rel_id.isdigit():
+                raise ValidationError(f"Invalid pagination cursor: '{cursor}'")
+            applied += ("cursor",)
+            params.extend([created_at, int(rel_id)])
+            offset = 0
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        cursor = self.connection.cursor()
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-
-        relationships = []
-        for row in rows:
-            props = json.loads(row["properties"]) if row["properties"] else {}
-            relationship = {
-                "id": str(row["id"]),
-                "type": row["rel_type"],
-                "source_id": row["source_id"],
-                "target_id": row["target_id"],
-                **props,
+        db_cursor = self._tuple_cursor()
+        db_cursor.execute(_list_relationships_sql(applied), params)
+        return [
+            {
+                "id": str(rel_id),
+                "type": row_type,
+                "source_id": row_source,
+                "target_id": row_target,
+                **(json_codec.loads(props) if props else {}),
             }
-            relationships.append(relationship)
-
-        return relationships
+            for rel_id, row_type, row_source, row_target, props in db_cursor
+        ]
 
-    async def check_circular_dependency(self, source_id: str, target_id: str) -> bool:
+    @_on_db_thread
+    def check_circular_dependency(self, source_id: str, target_id: str) -> bool:
         """Check if creating CONTAINS relationship would create a cycle."""
+        return self._has_cycle(source_id, target_id)
+
+    def _has_cycle(self, source_id: str, target_id: str) -> bool:
+        """Check for a would-be CONTAINS cycle on the database thread."""
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
 
-        # Use recursive CTE to find paths
+        # A path from target back to source means the new edge closes a cycle
         cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            WITH RECURSIVE path(node_id, depth) AS (
-                SELECT ?, 0
-                UNION ALL
-                SELECT r.target_id, p.depth + 1
-                FROM relationships r
-                JOIN path p ON r.source_id = p.node_id
-                WHERE r.rel_type = 'CONTAINS' AND p.depth < 100
-            )
-            SELECT 1 FROM path WHERE node_id = ? LIMIT 1
-            """,
-            (target_id, source_id),
-        )
+        cursor.execute(_CHECK_CYCLE_SQL, {"target": target_id, "source": source_id})
 
-        return cursor.fetchone() is not None
+        return bool(cursor.fetchone()[0])
 
-    async def get_connected_nodes(
+    @_on_db_thread
+    def get_connected_nodes(
         self,
         node_id: str,
         rel_type: str | None = None,
         direction: str = "outgoing",
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
         """Get nodes connected to a given node."""
         if not self.connection:
             raise DatabaseConnectionError("Not connected to database")
 
-        cursor = self.connection.cursor()
-
-        if direction == "outgoing":
-            query = """
-                SELECT n.properties
-                FROM nodes n
-                JOIN relationships r ON n.id = r.target_id
-                WHERE r.source_id = ?
-            """
-            params: list[Any] = [node_id]
-            if rel_type:
-                query += " AND r.rel_type = ?"
-                params.append(rel_type)
-
-        elif direction == "incoming":
-            query = """
-                SELECT n.properties
-                FROM nodes n
-                JOIN relationships r ON n.id = r.source_id
-                WHERE r.target_id = ?
-            """
-            params = [node_id]
-            if rel_type:
-                query += " AND r.rel_type = ?"
-                params.append(rel_type)
-
-        elif direction == "both":
-            query = """
-                SELECT DISTINCT n.properties
-                FROM nodes n
-                JOIN relationships r ON (n.id = r.target_id OR n.id = r.source_id)
-                WHERE (r.source_id = ? OR r.target_id = ?)
-                AND n.id != ?
-            """
-            params = [node_id, node_id, node_id]
-            if rel_type:
-                query += " AND r.rel_type = ?"
-                params.append(rel_type)
-
-        else:
+        query = _CONNECTED_NODES_SQL.get(direction)
+        if query is None:
             raise ValueError(f"Invalid direction: {direction}")
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        key = (node_id, rel_type or None, direction, limit)
+        cached = self._connected_cache.get(key)
+        if cached is not None:
+            self._cache_hits += 1
+            return copy.deepcopy(cached)
+        self._cache_misses += 1
 
-        return [json.loads(row["properties"]) for row in rows]
+        cursor = self._tuple_cursor()
+        cursor.execute(
+            query,
+            {
+                "node_id": node_id,
+                "rel_type": rel_type or None,
+                "limit": -1 if limit is None else limit,
+            },
+        )
+        nodes = [json_codec.loads(props) for (props,) in cursor]
+        self._connected_cache[key] = nodes
+        return copy.deepcopy(nodes)
 
     # Query Operations
 
-    async def execute_query(
+    @_on_db_thread
+    def execute_query(
         self,
         cypher: str,
         parameters: dict[str, Any] | None = None,
@@ -1,13 +1,62 @@
 """PEP 723 inline script metadata parser."""
 
+import copy
+import functools
 import logging
+import re
 import tomllib
+from collections.abc import Iterator
 from typing import Any
 
 from ..exceptions import DependencyParseError
 
 logger = logging.getLogger(__name__)
 
+# Block delimiter lines; like the line.strip() comparison they replace, they
+# allow surrounding whitespace. Searching for them directly means only the
+# block itself is ever split into lines.
+_BLOCK_START = re.compile(r"^[^\S\n]*# /// script[^\S\n]*$", re.MULTILINE)
+_BLOCK_END = re.compile(r"^[^\S\n]*# ///[^\S\n]*$", re.MULTILINE)
+# Whitespace-only lines at the start of a script
+_LEADING_BLANK_LINES = re.compile(r"\A(?:[^\S\n]*\n)*(?:\s*\Z)?")
+
+# The common metadata shape: requires-python and a dependencies array of
+# plain basic strings (no escapes or control characters), nothing else.
+# Anything outside this grammar falls back to tomllib.
+_SIMPLE_STRING = r'"[^"\\\x00-\x1f\x7f]*"'
+_SIMPLE_STRING_RE = re.compile(_SIMPLE_STRING)
+_SIMPLE_BLANK_LINE = re.compile(r"[ \t]*(?:\n|\Z)")
+_SIMPLE_ENTRY = re.compile(
+    rf"[ \t]*(requires-python|dependencies)[ \t]*=[ \t]*"
+    rf"(?:({_SIMPLE_STRING})"
+    rf"|\[((?:[ \t\n]*{_SIMPLE_STRING}[ \t\n]*,)*[ \t\n]*(?:{_SIMPLE_STRING}[ \t\n]*)?)\])"
+    rf"[ \t]*(?:\n|\Z)"
+)
+
+
+def _find_line(pattern: re.Pattern[str], marker: str, text: str, pos: int) -> re.Match[str] | None:
+    """Find the first line at or after ``pos`` that ``pattern`` matches.
+
+    Candidate lines are located with ``str.find`` on the marker text, so the
+    regex only runs on lines that contain it rather than across the script.
+
+    Args:
+        pattern: Compiled pattern matching a whole line
+        marker: Text every matching line contains
+        text: Script source
+        pos: Offset to search from (a line start or a newline)
+
+    Returns:
+        Match of the line or None
+    """
+    index = text.find(marker, pos)
+    while index != -1:
+        match = pattern.match(text, text.rfind("\n", 0, index) + 1)
+        if match:
+            return match
+        index = text.find(marker, index + 1)
+    return None
+
 
 class PEP723Parser:
     """Parser for PEP 723 inline script metadata.
@@ -39,7 +88,8 @@ class PEP723Parser:
         Returns:
             True if metadata block exists, False otherwise
         """
-        return "# /// script" in script_body and "# ///" in script_body
+        # Only a line of its own opens a block, as in _extract_metadata_block
+        return _find_line(_BLOCK_START, "# /// script", script_body, 0) is not None
 
     @staticmethod
     def parse_metadata(script_body: str, script_name: str | None = None) -> dict[str, Any] | None:
@@ -55,21 +105,29 @@ class PEP723Parser:
         Raises:
             DependencyParseError: If metadata block is malformed
         """
-        if not PEP723Parser.has_metadata(script_body):
-            return None
+        metadata = PEP723Parser._cached_metadata(script_body, script_name)
 
-        try:
-            # Extract the metadata block
-            metadata_block = PEP723Parser._extract_metadata_block(script_body)
+        # The cached dict is shared, so callers get their own copy
+        return copy.deepcopy(metadata)
 
-            if not metadata_block:
-                return None
+    @staticmethod
+    def _cached_metadata(script_body: str, script_name: str | None = None) -> dict[str, Any] | None:
+        """Return the memoised metadata of a script without copying it.
 
-            # Parse as TOML
-            metadata = tomllib.loads(metadata_block)
+        The result is shared between callers and must not be modified.
 
-            logger.debug(f"Parsed PEP 723 metadata: {metadata}")
-            return metadata
+        Args:
+            script_body: Python script source code
+            script_name: Optional script name for error messages
+
+        Returns:
+            Parsed metadata dictionary or None if no metadata block found
+
+        Raises:
+            DependencyParseError: If metadata block is malformed
+        """
+        try:
+            return _load_metadata(script_body)
 
         except tomllib.TOMLDecodeError as e:
             raise DependencyParseError(
@@ -92,30 +150,30 @@ class PEP723Parser:
         Returns:
             Raw TOML content from metadata block or None
         """
-        lines = script_body.split("\n")
-        in_block = False
+        start = _find_line(_BLOCK_START, "# /// script", script_body, 0)
+        if not start:
+            return None
+
+        # Lines between the delimiters; an unterminated block runs to the end
+        end = _find_line(_BLOCK_END, "# ///", script_body, start.end())
+        first = start.end() + 1
+        last = end.start() - 1 if end else len(script_body)
         metadata_lines = []
 
-        for line in lines:
+        for line in script_body[first:last].split("\n") if last >= first else ():
             stripped = line.strip()
 
             if stripped == "# /// script":
-                in_block = True
                 continue
 
-            if in_block:
-                if stripped == "# ///":
-                    # End of block
-                    break
-
-                # Remove leading '# ' from metadata lines
-                if stripped.startswith("# "):
-                    metadata_lines.append(stripped[2:])
-                elif stripped == "#":
-                    metadata_lines.append("")
-                else:
-                    # Line doesn't follow expected format
-                    logger.warning(f"Unexpected line in metadata block: {line}")
+            # Remove leading '# ' from metadata lines
+            if stripped.startswith("# "):
+                metadata_lines.append(stripped[2:])
+            elif stripped == "#":
+                metadata_lines.append("")
+            else:
+                # Line doesn't follow expected format
+                logger.warning(f"Unexpected line in metadata block: {line}")
 
         if not metadata_lines:
             return None
@@ -142,10 +200,49 @@ class PEP723Parser:
             >>> PEP723Parser.extract_dependencies(script)
             ['requests>=2.31.0', 'pandas']
         """
-        metadata = PEP723Parser.parse_metadata(script_body, script_name)
+        metadata = PEP723Parser._cached_metadata(script_body, script_name)
+        return PEP723Parser.dependencies_from_metadata(metadata, script_name)
 
+    @staticmethod
+    def dependencies_from_metadata(
+        metadata: dict[str, Any] | None, script_name: str | None = None
+    ) -> list[str]:
+        """Get the dependency list from already parsed metadata.
+
+        Args:
+            metadata: Parsed metadata, as returned by parse_metadata
+            script_name: Optional script name for error messages
+
+        Returns:
+            List of dependency specifications
+
+        Raises:
+            DependencyParseError: If 'dependencies' is not a list
+        """
+        return list(PEP723Parser.iter_dependencies(metadata, script_name))
+
+    @staticmethod
+    def iter_dependencies(
+        metadata: dict[str, Any] | None, script_name: str | None = None
+    ) -> Iterator[str]:
+        """Iterate over the dependencies in already parsed metadata.
+
+        Unlike dependencies_from_metadata this doesn't copy the list, which
+        suits callers that only fold the dependencies into another
+        collection.
+
+        Args:
+            metadata: Parsed metadata, as returned by parse_metadata
+            script_name: Optional script name for error messages
+
+        Returns:
+            Iterator over dependency specifications
+
+        Raises:
+            DependencyParseError: If 'dependencies' is not a list
+        """
         if not metadata:
-            return []
+            return iter(())
 
         dependencies = metadata.get("dependencies", [])
 
@@ -155,7 +252,7 @@ class PEP723Parser:
                 script_name,
             )
 
-        return dependencies
+        return iter(dependencies)
 
     @staticmethod
     def extract_python_version(script_body: str, script_name: str | None = None) -> str | None:
@@ -177,13 +274,42 @@ class PEP723Parser:
             >>> PEP723Parser.extract_python_version(script)
             '>=3.12'
         """
-        metadata = PEP723Parser.parse_metadata(script_body, script_name)
+        metadata = PEP723Parser._cached_metadata(script_body, script_name)
 
         if not metadata:
             return None
 
         return metadata.get("requires-python")
 
+    @staticmethod
+    def split_metadata(
+        script_body: str, script_name: str | None = None
+    ) -> tuple[str, dict[str, Any] | None]:
+        """Separate a script's PEP 723 metadata from its code.
+
+        Callers that need both the metadata and the bare code (such as the
+        script runner) get them from one call instead of checking for,
+        parsing and removing the block separately.
+
+        Args:
+            script_body: Python script source code
+            script_name: Optional script name for error messages
+
+        Returns:
+            Script without its metadata block, and the parsed metadata or
+            None if there is no block
+
+        Raises:
+            DependencyParseError: If metadata block is malformed
+        """
+        metadata = PEP723Parser.parse_metadata(script_body, script_name)
+
+        # An empty block parses to None but is still stripped
+        if metadata is None and not PEP723Parser.has_metadata(script_body):
+            return script_body, None
+
+        return PEP723Parser._remove_metadata_block(script_body), metadata
+
     @staticmethod
     def merge_dependencies(*scripts_bodies: str) -> list[str]:
         """Merge dependencies from multiple scripts, removing duplicates.
@@ -243,20 +369,14 @@ class PEP723Parser:
             # ]
             # ///
         """
-        lines = ["# /// script"]
-
-        if python_version:
-            lines.append(f'# requires-python = "{python_version}"')
-
-        if dependencies:
-            lines.append("# dependencies = [")
-            for dep in dependencies:
-                lines.append(f'#   "{dep}",')
-            lines.append("# ]")
-
-        lines.append("# ///")
+        requires = f'# requires-python = "{python_version}"\n' if python_version else ""
+        deps = (
+            "# dependencies = [\n" + "".join(f'#   "{dep}",\n' for dep in dependencies) + "# ]\n"
+            if dependencies
+            else ""
+        )
 
-        return "\n".join(lines)
+        return f"# /// script\n{requires}{deps}# ///"
 
     @staticmethod
     def add_metadata_to_script(
@@ -299,26 +419,94 @@ class PEP723Parser:
         Returns:
             Script without metadata block
         """
-        lines = script_body.split("\n")
-        result_lines = []
-        in_block = False
+        # Runs of kept lines, joined back with newlines like the lines were.
+        # pos is the start of the next unread line, None past the last one.
+        kept = []
+        pos: int | None = 0
+
+        while pos is not None and (
+            start := _find_line(_BLOCK_START, "# /// script", script_body, pos)
+        ):
+            if start.start() > pos:
+                kept.append(script_body[pos : start.start() - 1])
+            end = _find_line(_BLOCK_END, "# ///", script_body, start.end())
+            # An unterminated block runs to the end of the script
+            pos = end.end() + 1 if end and end.end() < len(script_body) else None
+
+        if pos is not None:
+            kept.append(script_body[pos:])
 
-        for line in lines:
-            stripped = line.strip()
+        # Remove leading empty lines after block removal
+        return _LEADING_BLANK_LINES.sub("", "\n".join(kept), count=1)
 
-            if stripped == "# /// script":
-                in_block = True
-                continue
 
-            if in_block and stripped == "# ///":
-                in_block = False
-                continue
+@functools.lru_cache(maxsize=512)
+def _parse_simple_metadata(metadata_block: str) -> dict[str, Any] | None:
+    """Parse a metadata block that has only the common PEP 723 keys.
 
-            if not in_block:
-                result_lines.append(line)
+    Handles ``requires-python = "..."`` and a ``dependencies`` array of
+    plain strings, which is what nearly every script declares, without
+    going through the full TOML parser.
 
-        # Remove leading empty lines after block removal
-        while result_lines and not result_lines[0].strip():
-            result_lines.pop(0)
+    Args:
+        metadata_block: Raw metadata block content
+
+    Returns:
+        Same dictionary tomllib would return, or None if the block uses
+        anything else and needs tomllib
+    """
+    metadata: dict[str, Any] = {}
+    pos = 0
+
+    while pos < len(metadata_block):
+        blank = _SIMPLE_BLANK_LINE.match(metadata_block, pos)
+        if blank and blank.end() > pos:
+            pos = blank.end()
+            continue
+
+        entry = _SIMPLE_ENTRY.match(metadata_block, pos)
+        if entry is None:
+            return None
 
-        return "\n".join(result_lines)
+        key, string, items = entry.groups()
+        # Duplicate keys are a TOML error; wrongly typed values are left
+        # to tomllib and the callers' validation
+        if key in metadata or (key == "requires-python") != (string is not None):
+            return None
+
+        if string is not None:
+            metadata[key] = string[1:-1]
+        else:
+            metadata[key] = [item[1:-1] for item in _SIMPLE_STRING_RE.findall(items)]
+        pos = entry.end()
+
+    return metadata
+
+
+@functools.lru_cache(maxsize=512)
+def _load_metadata(script_body: str) -> dict[str, Any] | None:
+    """Extract and parse a script's metadata block, memoised per script body.
+
+    The same script bodies are parsed on every execution (dependency merge,
+    Python version lookup), so each distinct body is only split and parsed
+    once. Parse errors are not cached.
+
+    Args:
+        script_body: Python script source code
+
+    Returns:
+        Parsed metadata dictionary or None if no metadata block found
+
+    Raises:
+        tomllib.TOMLDecodeError: If the block is not valid TOML
+    """
+    # Finding the block is the metadata check; no separate has_metadata scan
+    metadata_block = PEP723Parser._extract_metadata_block(script_body)
+    if not metadata_block:
+        return None
+
+    metadata = _parse_simple_metadata(metadata_block)
+    if metadata is None:
+        metadata = tomllib.loads(metadata_block)
+    logger.debug(f"Parsed PEP 723 metadata: {metadata}")
+    return metadata
@@ -1,20 +1,33 @@
 """Script execution runner with uv integration."""
 
 import asyncio
+import codecs
+import functools
+import hashlib
 import logging
+import os
+import shutil
+import signal
 import time
+import uuid
 from pathlib import Path
 from typing import Any
 
 from ..database.abstract import DatabaseInterface
 from ..exceptions import NodeNotFoundError, ScriptExecutionError
-from ..security.secrets import SecretDetector
+from ..security.secrets import SecretDetector, SecretValues
 from ..utils.env_file import EnvFileManager
 from ..utils.script_cleaner import ScriptCleaner
 from .dependency import PEP723Parser
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from the subprocess pipes per sanitization step
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Seconds before a dependency set whose venv failed to build is retried
+_VENV_RETRY_SECONDS = 300.0
+
 
 class ScriptRunner:
     """Executes Python scripts with dynamic imports and dependency management."""
@@ -25,6 +38,7 @@ class ScriptRunner:
         cache_dir: Path | str,
         env_dir: Path | str,
         secret_detector: SecretDetector | None = None,
+        composite_cache_size: int = 256,
     ):
         """Initialize script runner.
 
@@ -33,8 +47,11 @@ class ScriptRunner:
             cache_dir: Directory for caching execution artifacts
             env_dir: Directory where ENV files are stored
             secret_detector: Secret detector for sanitizing output (optional)
+            composite_cache_size: Maximum composite scripts kept on disk;
+                the least recently used are removed beyond that
         """
         self.db = db
+        self.composite_cache_size = composite_cache_size
         self.cache_dir = Path(cache_dir)
         self.env_dir = Path(env_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -42,6 +59,21 @@ class ScriptRunner:
         self.env_manager = EnvFileManager(env_dir)
         self.secret_detector = secret_detector or SecretDetector()
 
+        # Resolve uv once; fall back to a PATH lookup at spawn time so a
+        # missing uv is still reported when a script is executed
+        self._uv_path = shutil.which("uv") or "uv"
+
+        # Subprocess environment captured once: the server environment plus
+        # a shared uv cache unless the user configured their own. ENV node
+        # variables are layered on per execution.
+        self._base_env = os.environ.copy()
+        self._base_env.setdefault("UV_CACHE_DIR", str(self.cache_dir / "uv"))
+
+        # Serialises building each dependency set's venv; failed builds are
+        # remembered (digest -> monotonic time) so they aren't retried per run
+        self._venv_locks: dict[str, asyncio.Lock] = {}
+        self._venv_failures: dict[str, float] = {}
+
     async def execute(
         self,
         code: str,
@@ -55,12 +87,13 @@ class ScriptRunner:
         1. Load SCRIPT nodes by name
         2. For each script, find connected ENV nodes
         3. Load directly specified ENV nodes
-        4. Parse PEP 723 dependencies from all scripts
-        5. Generate composite script with all imports
-        6. Create temporary .env file with merged environment
-        7. Execute with 'uv run --script <file>'
-        8. Sanitize output (remove secrets)
-        9. Return results
+        4. Parse PEP 723 dependencies from all scripts, then reuse the
+           cached composite script for this code and these script bodies
+           or generate (and cache) one
+        5. Execute with the cached venv's python for the dependency set,
+           falling back to 'uv run <file>', with the merged environment
+        6. Sanitize output (remove secrets) as it is read
+        7. Return results
 
         Args:
             code: Python code to execute
@@ -86,6 +119,9 @@ class ScriptRunner:
         imports = imports or []
         envs = envs or []
         start_time = time.time()
+        # One budget for the whole call: building a venv eats into the time
+        # left for the script instead of getting a timeout of its own
+        deadline = time.monotonic() + timeout
 
         try:
             # Load all requested scripts
@@ -94,42 +130,47 @@ class ScriptRunner:
             # Load and merge environment variables (from scripts + direct envs)
             env_vars, secret_values = await self._load_environments(scripts, envs)
 
-            # Merge dependencies from all scripts
-            merged_deps = self._merge_dependencies(scripts)
-
-            # Generate composite script
-            composite_script = self._generate_composite_script(scripts, code, merged_deps)
-
-            # Create temporary script file
-            script_file = self._create_temp_script_file(composite_script)
-
-            # Create temporary .env file if we have env vars
-            env_file = None
-            if env_vars:
-                env_file = self.env_manager.create_temp_env_file(env_vars, prefix="exec")
+            # Clean each script and collect its dependencies (memoised per
+            # body, off the event loop for the first sight of a body)
+            parts = await asyncio.to_thread(self._split_scripts, scripts)
+            merged_deps = self._merge_dependencies(parts)
 
+            # Reuse the composite script of an earlier run with the same code
+            # and script bodies; it is keyed by content, so edits miss
+            script_file = self._composite_path(scripts, code)
             try:
-                # Execute with uv
-                result = await self._execute_with_uv(script_file, env_file, timeout)
-
-                execution_time = time.time() - start_time
+                # Touching a hit marks it recently used for eviction
+                os.utime(script_file)
+            except FileNotFoundError:
+                # Generation and the write run off the event loop
+                await asyncio.to_thread(
+                    self._build_composite_script, parts, code, merged_deps, script_file
+                )
 
-                # Sanitize output to remove secrets
-                sanitized_result = self._sanitize_result(result, secret_values)
-                sanitized_result["execution_time"] = execution_time
+            # Dependencies are installed once per distinct set
+            python = None
+            if merged_deps:
+                try:
+                    python = await self._venv_python(merged_deps, deadline)
+                except TimeoutError:
+                    # The build used up the whole budget; nothing left to run
+                    raise ScriptExecutionError(f"Script execution timed out after {timeout}s")
+
+            # Execute, passing env vars straight to the subprocess; output is
+            # sanitized as it is read
+            result = await self._execute_with_uv(
+                script_file, env_vars, secret_values, timeout, python, deadline
+            )
 
-                logger.info(
-                    f"Script execution completed in {execution_time:.2f}s "
-                    f"(return code: {result['return_code']})"
-                )
+            execution_time = time.time() - start_time
+            result["execution_time"] = execution_time
 
-                return sanitized_result
+            logger.info(
+                f"Script execution completed in {execution_time:.2f}s "
+                f"(return code: {result['return_code']})"
+            )
 
-            finally:
-                # Cleanup temporary files
-                script_file.unlink(missing_ok=True)
-                if env_file:
-                    env_file.unlink(missing_ok=True)
+            return result
 
         except Exception as e:
             execution_time = time.time() - start_time
@@ -152,10 +193,11 @@ class ScriptRunner:
         Raises:
             NodeNotFoundError: If any script doesn't exist
         """
-        scripts = []
+        found = await self.db.read_nodes_by_names("SCRIPT", script_names)
 
+        scripts = []
         for name in script_names:
-            script = await self.db.read_node_by_name("SCRIPT", name)
+            script = found.get(name)
             if not script:
                 raise NodeNotFoundError(name, "SCRIPT")
             scripts.append(script)
@@ -190,19 +232,24 @@ class ScriptRunner:
         # Collect all ENV nodes to load
         env_nodes_to_load: list[dict[str, Any]] = []
 
-        # 1. Find ENV nodes connected to scripts via CONTAINS relationship
-        for script in scripts:
-            script_id = script["id"]
-            connected_nodes = await self.db.get_connected_nodes(
-                script_id, rel_type="CONTAINS", direction="outgoing"
-            )
+        # Look up the connected and the named ENV nodes concurrently
+        *connected, named_envs = await asyncio.gather(
+            *(
+                self.db.get_connected_nodes(script["id"], rel_type="CONTAINS", direction="outgoing")
+                for script in scripts
+            ),
+            self.db.read_nodes_by_names("ENV", env_names),
+        )
+
+        # 1. ENV nodes connected to scripts via CONTAINS relationship
+        for connected_nodes in connected:
             for node in connected_nodes:
                 if "variables" in node:
                     env_nodes_to_load.append(node)
 
-        # 2. Load directly specified ENV nodes by name
+        # 2. Directly specified ENV nodes by name
         for env_name in env_names:
-            env_node = await self.db.read_node_by_name("ENV", env_name)
+            env_node = named_envs.get(env_name)
             if not env_node:
                 raise NodeNotFoundError(env_name, "ENV")
             env_nodes_to_load.append(env_node)
@@ -216,13 +263,17 @@ class ScriptRunner:
                 seen_ids.add(env_id)
                 unique_env_nodes.append(env_node)
 
-        # Load variables from all ENV nodes
-        for env_node in unique_env_nodes:
-            env_id = env_node["id"]
+        # Load full env vars from the .env files off the event loop
+        env_files = await asyncio.gather(
+            *(
+                asyncio.to_thread(self.env_manager.read_env_file_cached, env_node["id"])
+                for env_node in unique_env_nodes
+            )
+        )
 
-            # Load full env vars from .env file
-            if self.env_manager.env_file_exists(env_id):
-                env_file_vars = self.env_manager.read_env_file(env_id)
+        # Merge in node order so later ENVs still override earlier ones
+        for env_node, env_file_vars in zip(unique_env_nodes, env_files, strict=True):
+            if env_file_vars is not None:
                 all_variables.update(env_file_vars)
 
                 # Collect secret values for sanitization
@@ -238,21 +289,78 @@ class ScriptRunner:
 
         return all_variables, secret_values
 
-    def _merge_dependencies(self, scripts: list[dict[str, Any]]) -> list[str]:
-        """Merge dependencies from all scripts.
+    def _build_composite_script(
+        self,
+        parts: list[tuple[str, str, tuple[str, ...]]],
+        user_code: str,
+        merged_deps: list[str],
+        script_file: Path,
+    ) -> None:
+        """Generate the composite script for a run and write it to the cache.
+
+        Args:
+            parts: (name, code, dependencies) per script, from _split_scripts
+            user_code: User's code to execute
+            merged_deps: Merged list of dependencies
+            script_file: Cache path from _composite_path
+        """
+        # Generate and cache composite script
+        composite_script = self._generate_composite_script(parts, user_code, merged_deps)
+        self._write_script_file(script_file, composite_script)
+        self._evict_composite_scripts()
+
+    def _evict_composite_scripts(self) -> None:
+        """Remove the least recently used composite scripts over the limit.
+
+        Hits refresh a file's mtime, so mtime order is recency order.
+        """
+        cached = list(self.cache_dir.glob("composite_*.py"))
+        excess = len(cached) - self.composite_cache_size
+        if excess <= 0:
+            return
+
+        def last_used(path: Path) -> int:
+            # Another run may evict the same file concurrently
+            try:
+                return path.stat().st_mtime_ns
+            except FileNotFoundError:
+                return 0
+
+        for path in sorted(cached, key=last_used)[:excess]:
+            path.unlink(missing_ok=True)
+        logger.debug(f"Evicted {excess} composite scripts from {self.cache_dir}")
+
+    def _split_scripts(
+        self, scripts: list[dict[str, Any]]
+    ) -> list[tuple[str, str, tuple[str, ...]]]:
+        """Separate each script's code from its PEP 723 metadata.
 
         Args:
             scripts: List of script node dictionaries
 
+        Returns:
+            (name, cleaned code, dependencies) per script
+        """
+        parts = []
+        for script in scripts:
+            name = script.get("name", "unknown")
+            code, dependencies = _prepare_script(script.get("body", ""), name)
+            parts.append((name, code, dependencies))
+        return parts
+
+    def _merge_dependencies(self, parts: list[tuple[str, str, tuple[str, ...]]]) -> list[str]:
+        """Merge dependencies from all scripts.
+
+        Args:
+            parts: (name, code, dependencies) per script, from _split_scripts
+
         Returns:
             Deduplicated list of all dependencies
         """
         all_deps: set[str] = set()
 
-        for script in scripts:
-            body = script.get("body", "")
-            deps = PEP723Parser.extract_dependencies(body, script.get("name"))
-            all_deps.update(deps)
+        for _, _, dependencies in parts:
+            all_deps.update(dependencies)
 
         merged = sorted(all_deps)
         logger.debug(f"Merged {len(merged)} unique dependencies")
@@ -260,112 +368,232 @@ class ScriptRunner:
 
     def _generate_composite_script(
         self,
-        scripts: list[dict[str, Any]],
+        parts: list[tuple[str, str, tuple[str, ...]]],
         user_code: str,
         merged_deps: list[str],
     ) -> str:
         """Generate executable Python script with all imports.
 
         Args:
-            scripts: List of script node dictionaries
+            parts: (name, code, dependencies) per script, from _split_scripts
             user_code: User's code to execute
             merged_deps: Merged list of dependencies
 
         Returns:
             Complete executable Python script
         """
-        lines = []
-
         # Add PEP 723 metadata block with merged dependencies
+        metadata_block = ""
         if merged_deps:
             metadata_block = PEP723Parser.generate_metadata_block(
                 dependencies=merged_deps,
                 python_version=">=3.12",
             )
-            lines.append(metadata_block)
-            lines.append("")
+            metadata_block += "\n\n"
 
-        # Add each imported script
-        for script in scripts:
-            script_name = script.get("name", "unknown")
-            body = script.get("body", "")
+        # Add each imported script; _split_scripts already removed their
+        # metadata and __main__ blocks
+        imported = "".join(f"# Script: {name}\n{body}\n\n" for name, body, _ in parts)
 
-            # Remove PEP 723 metadata from individual scripts
-            if PEP723Parser.has_metadata(body):
-                body = PEP723Parser._remove_metadata_block(body)
+        # Add user's code
+        composite = f"{metadata_block}{imported}# User Code\n{user_code.strip()}\n"
+        logger.debug(f"Generated composite script ({len(parts)} scripts, {len(composite)} chars)")
+        return composite
 
-            # Remove __main__ blocks to prevent unintended execution
-            # SCRIPT nodes should not include __main__ blocks
-            if ScriptCleaner.has_main_block(body):
-                body = ScriptCleaner.remove_main_block(body, script_name)
+    def _composite_path(self, scripts: list[dict[str, Any]], user_code: str) -> Path:
+        """Get the cache path of the composite script for a run.
 
-            lines.append(f"# Script: {script_name}")
-            lines.append(body.strip())
-            lines.append("")
+        The key covers the user code and each imported script's name and
+        body in import order, so editing a script yields a new path.
 
-        # Add user's code
-        lines.append("# User Code")
-        lines.append(user_code.strip())
-        lines.append("")
+        Args:
+            scripts: List of script node dictionaries
+            user_code: User's code to execute
 
-        composite = "\n".join(lines)
-        logger.debug(f"Generated composite script ({len(lines)} lines)")
-        return composite
+        Returns:
+            Path of the cached composite script (may not exist yet)
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for script in scripts:
+            body = script.get("body", "").encode()
+            digest.update(f"{script.get('name', '')}\0{len(body)}\0".encode())
+            digest.update(body)
+        digest.update(user_code.encode())
+
+        return self.cache_dir / f"composite_{digest.hexdigest()}.py"
 
-    def _create_temp_script_file(self, script_content: str) -> Path:
-        """Create temporary script file.
+    def _write_script_file(self, script_path: Path, script_content: str) -> None:
+        """Write a script file atomically.
+
+        The content goes to a uniquely named temporary file first and is
+        then renamed into place, so concurrent runs never see a partial
+        script.
 
         Args:
+            script_path: Destination path
             script_content: Python script content
+        """
+        temp_path = script_path.with_name(f"exec_{uuid.uuid4().hex[:8]}.tmp")
+
+        # Write the encoded bytes straight to the fd, skipping the text layer
+        data = memoryview(script_content.encode("utf-8"))
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
+
+        try:
+            os.replace(temp_path, script_path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        logger.debug(f"Cached composite script: {script_path}")
+
+    async def _venv_python(self, deps: list[str], deadline: float) -> Path | None:
+        """Get the interpreter of a venv with the given dependencies installed.
+
+        Each distinct dependency set gets one venv under ``cache_dir/venvs``,
+        created with ``uv venv`` and ``uv pip install`` on first use and
+        marked ready with a sentinel file. Later runs start its python
+        directly, skipping uv's startup and resolution. The venv is built in
+        a scratch directory and renamed into place, so other processes
+        sharing the cache never see it half-built.
+
+        Args:
+            deps: Sorted dependency specifications
+            deadline: ``time.monotonic()`` value by which both uv steps must
+                have finished
 
         Returns:
-            Path to temporary script file
+            Path to the venv's python, or None if it couldn't be built (the
+            caller then falls back to ``uv run``, which reports the error)
+
+        Raises:
+            TimeoutError: If the deadline passed first; unlike a uv failure
+                this is not remembered, as a later call may have more time
         """
-        import uuid
+        digest = hashlib.sha256("\n".join(deps).encode()).hexdigest()[:16]
+        venv_dir = self.cache_dir / "venvs" / digest
+        ready = venv_dir / ".ready"
+        python = venv_dir / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+
+        if ready.exists():
+            return python
+
+        async with self._venv_locks.setdefault(digest, asyncio.Lock()):
+            if ready.exists():
+                return python
+
+            failed_at = self._venv_failures.get(digest)
+            if failed_at is not None and time.monotonic() - failed_at < _VENV_RETRY_SECONDS:
+                return None
 
-        script_id = uuid.uuid4().hex[:8]
-        script_path = self.cache_dir / f"exec_{script_id}.py"
+            # Relocatable, so the venv still works after the rename
+            build_dir = venv_dir.with_name(f".{digest}_{uuid.uuid4().hex[:8]}")
+            build_python = build_dir / python.relative_to(venv_dir)
+            try:
+                await self._run_uv(
+                    ["venv", str(build_dir), "--relocatable", "--python", ">=3.12"], deadline
+                )
+                await self._run_uv(
+                    ["pip", "install", "--python", str(build_python), *deps], deadline
+                )
+                (build_dir / ".ready").touch()
+                await asyncio.to_thread(_publish_venv, build_dir, venv_dir)
+            except TimeoutError:
+                # A subclass of OSError, but the caller's budget ran out
+                raise
+            except (ScriptExecutionError, OSError) as e:
+                logger.warning(f"Could not prepare venv for {deps}: {e}")
+                self._venv_failures[digest] = time.monotonic()
+                return None
+            finally:
+                await asyncio.to_thread(shutil.rmtree, build_dir, ignore_errors=True)
+
+            self._venv_failures.pop(digest, None)
+            logger.info(f"Prepared venv {venv_dir} with {len(deps)} dependencies")
+            return python
+
+    async def _run_uv(self, args: list[str], deadline: float) -> None:
+        """Run a uv command to completion.
+
+        Args:
+            args: Arguments after the uv executable
+            deadline: ``time.monotonic()`` value by which uv must finish
+
+        Raises:
+            ScriptExecutionError: If uv is missing or fails
+            TimeoutError: If uv is still running at the deadline
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self._uv_path,
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=self._base_env,
+                start_new_session=True,
+            )
+        except FileNotFoundError:
+            raise ScriptExecutionError(
+                "uv not found. Please install uv: https://docs.astral.sh/uv/"
+            )
 
-        with open(script_path, "w") as f:
-            f.write(script_content)
+        try:
+            _, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=max(deadline - time.monotonic(), 0)
+            )
+        except TimeoutError:
+            await _kill_process_tree(process)
+            raise
 
-        logger.debug(f"Created temporary script: {script_path}")
-        return script_path
+        if process.returncode:
+            raise ScriptExecutionError(
+                f"uv {args[0]} failed: {stderr.decode('utf-8', errors='replace').strip()}"
+            )
 
     async def _execute_with_uv(
         self,
         script_file: Path,
-        env_file: Path | None,
+        env_vars: dict[str, str],
+        secret_values: list[str],
         timeout: int,
+        python: Path | None = None,
+        deadline: float | None = None,
     ) -> dict[str, Any]:
-        """Execute script with uv run.
+        """Execute script with a prepared venv's python, or uv run.
 
         Args:
             script_file: Path to script file
-            env_file: Optional path to .env file
+            env_vars: Environment variables to add to the subprocess
+            secret_values: Secret values to remove from the output
             timeout: Execution timeout in seconds
+            python: Interpreter from _venv_python; None runs 'uv run'
+            deadline: ``time.monotonic()`` value the run must finish by when
+                earlier steps already used part of ``timeout``
 
         Returns:
-            Execution result dictionary
+            Execution result dictionary with sanitized output
 
         Raises:
             ScriptExecutionError: If execution fails or times out
         """
-        # Build uv command
-        cmd = ["uv", "run", str(script_file)]
-
-        # Set up environment - start with parent process env
-        import os
-
-        env = dict(os.environ)
+        # Build command
+        if python is not None:
+            cmd = [str(python), str(script_file)]
+        else:
+            cmd = [self._uv_path, "run", str(script_file)]
 
-        if env_file:
-            # Load .env file and merge into environment
-            env_vars = self.env_manager.load_env_to_dict(env_file)
-            env.update(env_vars)
+        # Set up environment - base env overlaid with the ENV nodes; the
+        # base dict is only read, so it is passed as-is when there is nothing
+        # to add
+        env = self._base_env | env_vars if env_vars else self._base_env
 
         try:
-            logger.info(f"Executing script with uv: {script_file}")
+            logger.info(f"Executing script with {cmd[0]}: {script_file}")
 
             # Run the command with inherited + custom environment
             process = await asyncio.create_subprocess_exec(
@@ -373,19 +601,26 @@ class ScriptRunner:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 env=env,
+                # Own process group, so a timeout can kill uv's children too
+                start_new_session=True,
             )
 
+            # Compiled once for both pipes and dropped with this call
+            secrets = SecretValues.from_values(secret_values)
+
             try:
-                stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    process.communicate(), timeout=timeout
+                stdout, stderr, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._read_sanitized(process.stdout, secrets),
+                        self._read_sanitized(process.stderr, secrets),
+                        process.wait(),
+                    ),
+                    timeout=timeout if deadline is None else max(deadline - time.monotonic(), 0),
                 )
             except TimeoutError:
-                process.kill()
-                await process.wait()
+                await _kill_process_tree(process)
                 raise ScriptExecutionError(f"Script execution timed out after {timeout}s")
 
-            stdout = stdout_bytes.decode("utf-8", errors="replace")
-            stderr = stderr_bytes.decode("utf-8", errors="replace")
             return_code = process.returncode or 0
 
             success = return_code == 0
@@ -404,24 +639,96 @@ class ScriptRunner:
         except Exception as e:
             raise ScriptExecutionError(f"Failed to execute script: {e}")
 
-    def _sanitize_result(self, result: dict[str, Any], secret_values: list[str]) -> dict[str, Any]:
-        """Sanitize execution result to remove secrets.
+    async def _read_sanitized(self, stream: asyncio.StreamReader, secrets: SecretValues) -> str:
+        """Read a subprocess pipe to EOF, removing secrets as chunks arrive.
 
         Args:
-            result: Execution result dictionary
-            secret_values: List of secret values to remove
+            stream: Subprocess stdout or stderr
+            secrets: Compiled secret values to remove
 
         Returns:
-            Sanitized result dictionary
+            Decoded and sanitized output
         """
-        sanitized = dict(result)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        parts: list[str] = []
+        tail = ""
 
-        if secret_values:
-            sanitized["stdout"] = self.secret_detector.sanitize_output(
-                result["stdout"], secret_values
-            )
-            sanitized["stderr"] = self.secret_detector.sanitize_output(
-                result["stderr"], secret_values
+        while chunk := await stream.read(_READ_CHUNK_SIZE):
+            sanitized, tail = self.secret_detector.sanitize_chunk(
+                tail + decoder.decode(chunk), secrets
             )
+            parts.append(sanitized)
+
+        sanitized, _ = self.secret_detector.sanitize_chunk(
+            tail + decoder.decode(b"", final=True), secrets, final=True
+        )
+        parts.append(sanitized)
+        return "".join(parts)
+
+
+def _publish_venv(build_dir: Path, venv_dir: Path) -> None:
+    """Rename a freshly built venv into place.
+
+    If another process published the same venv first, its copy is kept and
+    ``build_dir`` is left for the caller to remove. A leftover without the
+    ready sentinel is never used, so it is cleared and replaced.
+
+    Args:
+        build_dir: Scratch directory holding the complete venv
+        venv_dir: Final location of the venv
+    """
+    try:
+        os.replace(build_dir, venv_dir)
+    except OSError:
+        if (venv_dir / ".ready").exists():
+            return
+        shutil.rmtree(venv_dir, ignore_errors=True)
+        os.replace(build_dir, venv_dir)
+
+
+async def _kill_process_tree(process: asyncio.subprocess.Process) -> None:
+    """Kill a subprocess started with start_new_session and its children.
+
+    Killing only the direct child (uv) would leave the Python interpreter
+    it spawned running, so on POSIX the whole process group is killed.
+
+    Args:
+        process: Subprocess to kill
+    """
+    if os.name == "posix":
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    else:
+        process.kill()
+    await process.wait()
+
+
+@functools.lru_cache(maxsize=512)
+def _prepare_script(script_body: str, script_name: str) -> tuple[str, tuple[str, ...]]:
+    """Clean a script for composition, memoised per script body.
+
+    Scripts are imported again and again with different user code, so each
+    distinct body only goes through metadata parsing and the AST-based
+    __main__ removal once. Parse errors are not cached.
+
+    Args:
+        script_body: Python script source code
+        script_name: Script name for error messages and logging
+
+    Returns:
+        Tuple of (code without metadata or __main__ blocks, dependencies)
+
+    Raises:
+        DependencyParseError: If the metadata block is malformed
+    """
+    code, metadata = PEP723Parser.split_metadata(script_body, script_name)
+    dependencies = tuple(PEP723Parser.iter_dependencies(metadata, script_name))
+
+    # Remove __main__ blocks to prevent unintended execution
+    # SCRIPT nodes should not include __main__ blocks
+    if ScriptCleaner.has_main_block(code):
+        code = ScriptCleaner.remove_main_block(code, script_name)
 
-        return sanitized
+    return code.strip(), dependencies
@@ -1,6 +1,6 @@
 """Pydantic models for MCP Knowledge Graph Skills."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 from uuid import uuid4
@@ -28,9 +28,11 @@ class BaseNode(BaseModel):
     """Base model for all graph nodes."""
 
     id: str = Field(default_factory=lambda: str(uuid4()), description="Unique node identifier")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC), description="Creation timestamp"
+    )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow, description="Last update timestamp"
+        default_factory=lambda: datetime.now(UTC), description="Last update timestamp"
     )
 
     model_config = {"from_attributes": True, "populate_by_name": True}
@@ -120,7 +122,9 @@ class Relationship(BaseModel):
     source_id: str = Field(..., description="Source node ID")
     target_id: str = Field(..., description="Target node ID")
     properties: dict[str, Any] = Field(default_factory=dict, description="Additional properties")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(UTC), description="Creation timestamp"
+    )
 
     model_config = {"from_attributes": True}
 
@@ -129,10 +133,14 @@ class NodeFilter(BaseModel):
     """Filter criteria for listing nodes."""
 
     name: str | None = Field(None, description="Filter by name (partial match)")
+    name_prefix: str | None = Field(
+        None, description="Filter by exact name prefix (index-backed, case-sensitive)"
+    )
     created_after: datetime | None = Field(None, description="Filter by creation date")
     created_before: datetime | None = Field(None, description="Filter by creation date")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of results")
     offset: int = Field(0, ge=0, description="Offset for pagination")
+    cursor: str | None = Field(None, description="Continue after this ID (keyset pagination)")
 
 
 class RelationshipFilter(BaseModel):
@@ -143,6 +151,89 @@ class RelationshipFilter(BaseModel):
     relationship_type: RelationshipType | None = Field(None, description="Filter by type")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of results")
     offset: int = Field(0, ge=0, description="Offset for pagination")
+    cursor: str | None = Field(None, description="Continue after this ID (keyset pagination)")
+
+
+class BulkLoadPlan(BaseModel):
+    """Nodes and relationships to create together in a single transaction.
+
+    Relationship endpoints are referenced by node name and resolved against
+    the nodes in the same plan, so node names must be unique within a plan.
+    """
+
+    nodes: dict[NodeType, list[dict[str, Any]]] = Field(
+        default_factory=dict, description="Node data keyed by node type"
+    )
+    relationships: dict[RelationshipType, list[tuple[str, str, dict[str, Any] | None]]] = Field(
+        default_factory=dict,
+        description="(source name, target name, properties) keyed by relationship type",
+    )
+
+    def node_ids_by_name(self) -> dict[str, str]:
+        """Map each node name in the plan to its ID.
+
+        Raises:
+            ValueError: If a node has no ID or a name appears more than once
+        """
+        ids: dict[str, str] = {}
+        for rows in self.nodes.values():
+            for row in rows:
+                name = row.get("name")
+                if name in ids:
+                    raise ValueError(f"Duplicate node name in bulk load plan: '{name}'")
+                if not row.get("id"):
+                    raise ValueError(f"Node '{name}' in bulk load plan has no id")
+                ids[name] = row["id"]
+        return ids
+
+    def resolve_relationships(
+        self, ids: dict[str, str]
+    ) -> dict[str, list[tuple[str, str, dict[str, Any]]]]:
+        """Replace relationship endpoint names with node IDs.
+
+        Args:
+            ids: Node IDs keyed by name (see ``node_ids_by_name``)
+
+        Returns:
+            (source ID, target ID, properties) keyed by relationship type value
+
+        Raises:
+            ValueError: If an endpoint name is not a node in the plan
+        """
+        resolved: dict[str, list[tuple[str, str, dict[str, Any]]]] = {}
+        for rel_type, edges in self.relationships.items():
+            for source, target, properties in edges:
+                for name in (source, target):
+                    if name not in ids:
+                        raise ValueError(f"Unknown node '{name}' in bulk load relationship")
+                resolved.setdefault(rel_type.value, []).append(
+                    (ids[source], ids[target], dict(properties or {}))
+                )
+        return resolved
+
+    def find_contains_cycle(self) -> tuple[str, str] | None:
+        """Find a CONTAINS relationship in the plan that closes a cycle.
+
+        All plan nodes are new, so any cycle must consist of plan relationships.
+
+        Returns:
+            (source name, target name) of an offending relationship, or None
+        """
+        children: dict[str, list[str]] = {}
+        for source, target, _ in self.relationships.get(RelationshipType.CONTAINS, []):
+            children.setdefault(source, []).append(target)
+
+        for source, target, _ in self.relationships.get(RelationshipType.CONTAINS, []):
+            # A cycle exists if the source is reachable from the target
+            stack, seen = [target], set()
+            while stack:
+                current = stack.pop()
+                if current == source:
+                    return source, target
+                if current not in seen:
+                    seen.add(current)
+                    stack.extend(children.get(current, []))
+        return None
 
 
 class ExecutionRequest(BaseModel):
@@ -1,8 +1,115 @@
 """Secret detection and sanitization for MCP Knowledge Graph Skills."""
 
 import re
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Any
 
+# Regex fragments that are plain identifiers and can be matched without re
+_LITERAL_RE = re.compile(r"[A-Za-z0-9_]+")
+
+_REDACTED = "<REDACTED>"
+
+
+@dataclass(slots=True, frozen=True)
+class SecretValues:
+    """Secret values compiled into one alternation for redaction.
+
+    Build one per execution and pass it to the sanitize methods in place of
+    the raw list, so a streamed output compiles the pattern only once. It is
+    deliberately not cached globally: the pattern embeds the secrets, which
+    should not outlive the execution that loaded them.
+    """
+
+    pattern: re.Pattern[str] | None = None
+    longest: int = 0
+
+    @classmethod
+    def from_values(cls, secrets: Iterable[str]) -> "SecretValues":
+        """Compile secret values, longest first.
+
+        Args:
+            secrets: Secret values to match; empty strings are ignored
+
+        Returns:
+            SecretValues whose pattern is None if there is nothing to match
+        """
+        values = sorted({secret for secret in secrets if secret}, key=len, reverse=True)
+        if not values:
+            return cls()
+        return cls(re.compile("|".join(map(re.escape, values))), len(values[0]))
+
+
+def _compiled(secrets: list[str] | SecretValues) -> SecretValues:
+    """Return secrets as SecretValues, compiling a plain list."""
+    return secrets if isinstance(secrets, SecretValues) else SecretValues.from_values(secrets)
+
+
+@dataclass(slots=True, frozen=True)
+class SecretMatcher:
+    """Secret name matcher split into literal prefixes, suffixes and a regex.
+
+    Most secret patterns are plain ``PREFIX_*`` / ``*_SUFFIX`` checks, which
+    ``str.startswith``/``str.endswith`` handle with a tuple in one call. Only
+    the patterns that really need a regex end up in ``regex``. Prefixes and
+    suffixes are stored upper-cased; matching is case-insensitive.
+    """
+
+    prefixes: tuple[str, ...] = ()
+    suffixes: tuple[str, ...] = ()
+    regex: re.Pattern[str] | None = None
+
+    @classmethod
+    def from_patterns(cls, patterns: list[str]) -> "SecretMatcher":
+        """Build a matcher from regex patterns searched against the name.
+
+        ``^LITERAL`` becomes a prefix, ``LITERAL$`` and ``^.*LITERAL$`` become
+        suffixes; everything else is folded into a single alternation regex.
+
+        Args:
+            patterns: Regex patterns to partition
+
+        Returns:
+            SecretMatcher equivalent to searching any of the patterns
+        """
+        prefixes: list[str] = []
+        suffixes: list[str] = []
+        remaining: list[str] = []
+
+        for pattern in patterns:
+            head = pattern.removeprefix("^.*").removeprefix("^")
+            if pattern.startswith("^") and not pattern.startswith("^.*"):
+                if _LITERAL_RE.fullmatch(head):
+                    prefixes.append(head.upper())
+                    continue
+            elif pattern.endswith("$") and _LITERAL_RE.fullmatch(head[:-1]):
+                suffixes.append(head[:-1].upper())
+                continue
+            remaining.append(pattern)
+
+        regex = (
+            re.compile("|".join(f"(?:{pattern})" for pattern in remaining), re.IGNORECASE)
+            if remaining
+            else None
+        )
+        return cls(tuple(dict.fromkeys(prefixes)), tuple(dict.fromkeys(suffixes)), regex)
+
+    def match(self, name: str) -> bool:
+        """Check if a variable name matches any secret pattern.
+
+        Args:
+            name: Variable name to check
+
+        Returns:
+            True if the name is a secret, False otherwise
+        """
+        upper = name.upper()
+        return (
+            upper.endswith(self.suffixes)
+            or upper.startswith(self.prefixes)
+            or (self.regex is not None and self.regex.search(name) is not None)
+        )
+
 
 class SecretDetector:
     """Detects and manages secret environment variables."""
@@ -22,15 +129,23 @@ class SecretDetector:
         r"^TOKEN",
     ]
 
-    def __init__(self, secret_patterns: list[str] | None = None):
+    def __init__(self, secret_patterns: list[str] | re.Pattern[str] | SecretMatcher | None = None):
         """Initialize secret detector.
 
         Args:
-            secret_patterns: List of regex patterns to match secret variable names.
+            secret_patterns: List of regex patterns to match secret variable names,
+                           a compiled regex, or a prebuilt SecretMatcher (e.g.
+                           ``SecurityConfig.secret_matcher``).
                            If None, uses DEFAULT_SECRET_PATTERNS.
         """
-        patterns = secret_patterns or self.DEFAULT_SECRET_PATTERNS
-        self.secret_regex = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        if isinstance(secret_patterns, SecretMatcher):
+            self.matcher = secret_patterns
+        elif isinstance(secret_patterns, re.Pattern):
+            self.matcher = SecretMatcher(regex=secret_patterns)
+        else:
+            self.matcher = SecretMatcher.from_patterns(
+                secret_patterns or self.DEFAULT_SECRET_PATTERNS
+            )
 
     def is_secret(self, key: str) -> bool:
         """Check if a variable name matches secret patterns.
@@ -52,10 +167,7 @@ class SecretDetector:
             >>> detector.is_secret("MY_API_KEY")
             True
         """
-        for regex in self.secret_regex:
-            if regex.search(key):
-                return True
-        return False
+        return self.matcher.match(key)
 
     def extract_secrets(
         self, variables: dict[str, str]
@@ -127,12 +239,12 @@ class SecretDetector:
                 result[key] = "<SECRET>"
         return result
 
-    def sanitize_output(self, text: str, secrets: list[str]) -> str:
+    def sanitize_output(self, text: str, secrets: list[str] | SecretValues) -> str:
         """Remove secret values from execution output.
 
         Args:
             text: Output text to sanitize
-            secrets: List of secret values to remove
+            secrets: List of secret values to remove, or SecretValues
 
         Returns:
             Text with all secret values replaced by "<REDACTED>"
@@ -144,19 +256,69 @@ class SecretDetector:
             >>> sanitized
             'Connected to DB with password: <REDACTED>'
         """
-        sanitized = text
-        for secret in secrets:
-            if secret and len(secret) > 0:
-                # Replace all occurrences of the secret value
-                sanitized = sanitized.replace(secret, "<REDACTED>")
-        return sanitized
-
-    def sanitize_dict(self, data: dict[str, Any], secrets: list[str]) -> dict[str, Any]:
+        pattern = _compiled(secrets).pattern
+        if pattern is None:
+            return text
+        # One pass over the text for all secrets
+        return pattern.sub(_REDACTED, text)
+
+    def sanitize_chunk(
+        self, text: str, secrets: list[str] | SecretValues, final: bool = False
+    ) -> tuple[str, str]:
+        """Sanitize one chunk of streamed output.
+
+        A secret may be split across chunks, so the tail that could still
+        be the start of one is held back. Prepend it to the next chunk, and
+        pass final=True with the last one to flush it.
+
+        Args:
+            text: Held-back tail from the previous call plus the new chunk
+            secrets: List of secret values to remove; pass SecretValues to
+                avoid compiling them again for every chunk
+            final: Whether this is the end of the stream
+
+        Returns:
+            Tuple of (sanitized output that is safe to emit, held-back tail)
+
+        Examples:
+            >>> detector = SecretDetector()
+            >>> out, tail = detector.sanitize_chunk("the key is sec", ["secret123"])
+            >>> out, tail
+            ('the ke', 'y is sec')
+            >>> detector.sanitize_chunk(tail + "ret123", ["secret123"], final=True)
+            ('y is <REDACTED>', '')
+        """
+        compiled = _compiled(secrets)
+        pattern, longest = compiled.pattern, compiled.longest
+        if pattern is None:
+            return text, ""
+        if final:
+            return pattern.sub(_REDACTED, text), ""
+
+        # Matches starting before the cut are complete: every secret fits
+        # in the text after them
+        cut = len(text) - longest + 1
+        parts = []
+        pos = 0
+        for match in pattern.finditer(text):
+            if match.start() >= cut:
+                break
+            parts.append(text[pos : match.start()])
+            parts.append(_REDACTED)
+            pos = match.end()
+
+        end = max(pos, cut)
+        parts.append(text[pos:end])
+        return "".join(parts), text[end:]
+
+    def sanitize_dict(
+        self, data: dict[str, Any], secrets: list[str] | SecretValues
+    ) -> dict[str, Any]:
         """Recursively sanitize dictionaries containing potential secrets.
 
         Args:
             data: Dictionary to sanitize
-            secrets: List of secret values to remove
+            secrets: List of secret values to remove, or SecretValues
 
         Returns:
             Sanitized dictionary with secrets replaced
@@ -177,6 +339,8 @@ class SecretDetector:
         if not isinstance(data, dict):
             return data
 
+        # Compile once for every string in the tree
+        secrets = _compiled(secrets)
         result = {}
         for key, value in data.items():
             if isinstance(value, str):
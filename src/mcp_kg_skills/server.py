@@ -6,7 +6,7 @@ from typing import Any
 
 from fastmcp import FastMCP
 
-from .config import AppConfig, get_default_config_path, load_config
+from .config import AppConfig, RuntimeConfig, get_default_config_path, load_config
 from .database.abstract import DatabaseInterface
 from .database.neo4j import Neo4jDatabase
 from .exceptions import MCPKGSkillsError
@@ -27,6 +27,7 @@ mcp = FastMCP("mcp-kg-skills")
 # Global state - initialized lazily
 _initialized = False
 _config: AppConfig | None = None
+_runtime: RuntimeConfig | None = None
 _db: DatabaseInterface | None = None
 _nodes_tool: NodesTool | None = None
 _relationships_tool: RelationshipsTool | None = None
@@ -40,6 +41,7 @@ async def _ensure_initialized() -> None:
     global \
         _initialized, \
         _config, \
+        _runtime, \
         _db, \
         _nodes_tool, \
         _relationships_tool, \
@@ -59,7 +61,7 @@ async def _ensure_initialized() -> None:
         _config.setup_logging()
 
         # Ensure directories exist
-        _config.ensure_directories()
+        await _config.ensure_directories_async()
 
         logger.info("MCP Knowledge Graph Skills server initializing...")
 
@@ -69,6 +71,14 @@ async def _ensure_initialized() -> None:
             username=_config.database.username,
             password=_config.database.password,
             database=_config.database.database,
+            max_connection_pool_size=_config.database.max_connection_pool_size,
+            connection_acquisition_timeout=_config.database.connection_acquisition_timeout,
+            max_connection_lifetime=_config.database.max_connection_lifetime,
+            connection_timeout=_config.database.connection_timeout,
+            cache_size=_config.database.cache_size,
+            cache_ttl=_config.database.cache_ttl,
+            cache_queries=_config.database.cache_queries,
+            warm_up=_config.database.warm_up,
         )
 
         await _db.connect()
@@ -78,15 +88,17 @@ async def _ensure_initialized() -> None:
         if not await _db.health_check():
             raise Exception("Database health check failed")
 
-        # Initialize components
-        env_manager = EnvFileManager(_config.execution.env_dir)
-        secret_detector = SecretDetector(_config.security.secret_patterns)
+        # Initialize components from the runtime snapshot
+        _runtime = _config.snapshot()
+        env_manager = EnvFileManager(_runtime.env_dir)
+        secret_detector = SecretDetector(_runtime.secret_matcher)
 
         script_runner = ScriptRunner(
             db=_db,
-            cache_dir=_config.execution.cache_dir,
-            env_dir=_config.execution.env_dir,
+            cache_dir=_runtime.cache_dir,
+            env_dir=_runtime.env_dir,
             secret_detector=secret_detector,
+            composite_cache_size=_config.execution.composite_cache_size,
         )
 
         # Initialize tools
@@ -121,7 +133,9 @@ async def nodes(
             node_type: Type of node (SKILL, KNOWLEDGE, SCRIPT, ENV)
             node_id: Node ID (for read, update, delete)
             data: Node data (for create, update) - can be dict or JSON string
-            filters: Filter criteria (for list) - can be dict or JSON string
+            filters: Filter criteria (for list) - can be dict or JSON string;
+                pass the previous page's next_cursor as "cursor" to page forward;
+                "name_prefix" is an exact, index-backed alternative to "name"
 
         Returns:
             Operation result
@@ -233,6 +247,7 @@ async def relationships(
     rel_id: str | None = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     """Manage relationships between nodes (CONTAINS, RELATE_TO).
 
@@ -248,6 +263,7 @@ async def relationships(
         rel_id: Relationship ID (for delete)
         limit: Maximum results (for list)
         offset: Offset for pagination (for list)
+        cursor: Pass the previous page's next_cursor to fetch the next page (for list)
 
     Returns:
         Operation result
@@ -299,6 +315,7 @@ async def relationships(
             rel_id=rel_id,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
     except MCPKGSkillsError:
         raise
@@ -509,7 +526,7 @@ async def execute(
             code=code,
             imports=parsed_imports,
             envs=parsed_envs,
-            timeout=min(timeout, _config.execution.max_timeout) if _config else timeout,
+            timeout=min(timeout, _runtime.max_timeout) if _runtime else timeout,
         )
     except MCPKGSkillsError:
         raise
@@ -169,7 +169,7 @@ class EnvTool:
             Dictionary with keys and their metadata (not values)
         """
         # Read ENV node
-        env_node = await self.db.read_node(env_id)
+        env_node = await self.db.read_node(env_id, "ENV")
 
         if not env_node:
             raise NodeNotFoundError(env_id, "ENV")
@@ -12,6 +12,7 @@ from ..exceptions import (
     ValidationError,
 )
 from ..models import (
+    BulkLoadPlan,
     EnvNode,
     KnowledgeNode,
     NodeFilter,
@@ -21,6 +22,7 @@ from ..models import (
 )
 from ..security.secrets import SecretDetector
 from ..utils.env_file import EnvFileManager
+from ..utils.pagination import encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -106,25 +108,202 @@ class NodesTool:
 
         raise ValidationError(f"Unhandled operation: {operation}")
 
+    async def create_nodes_bulk(
+        self, node_type: str, items: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Create many nodes of one type in a single database round-trip.
+
+        Each item is validated exactly like a single ``create`` operation;
+        ENV items get the same secret handling and .env file generation.
+
+        Args:
+            node_type: Type of node (SKILL, KNOWLEDGE, SCRIPT, ENV)
+            items: Node data for each node to create
+
+        Returns:
+            Operation result with the created nodes in input order and a
+            name to ID map for wiring up relationships
+
+        Raises:
+            ValidationError: If the node type or any item is invalid
+            NodeAlreadyExistsError: If any node name already exists
+        """
+        try:
+            node_type_enum = NodeType(node_type)
+        except ValueError:
+            raise ValidationError(
+                f"Invalid node type '{node_type}'. "
+                f"Must be one of: {', '.join([t.value for t in NodeType])}"
+            )
+
+        rows, env_files = self._prepare_bulk_rows(node_type_enum, items)
+        created_nodes = await self.db.create_nodes_bulk(node_type_enum.value, rows)
+
+        if node_type_enum == NodeType.ENV:
+            self._write_env_files(env_files)
+            created_nodes = [self._sanitize_env_node(node) for node in created_nodes]
+
+        logger.info(f"Created {len(created_nodes)} {node_type_enum.value} nodes")
+
+        return {
+            "success": True,
+            "nodes": created_nodes,
+            "ids": {node["name"]: node["id"] for node in created_nodes},
+            "count": len(created_nodes),
+            "message": f"{len(created_nodes)} {node_type_enum.value} node(s) created successfully",
+        }
+
+    async def upsert_nodes_bulk(
+        self, node_type: str, items: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Create or update many nodes of one type, matched by name.
+
+        Items are validated like ``create_nodes_bulk``. Nodes whose name
+        already exists keep their ID, so loading the same data twice is safe.
+
+        Args:
+            node_type: Type of node (SKILL, KNOWLEDGE, SCRIPT, ENV)
+            items: Node data for each node to create or update
+
+        Returns:
+            Operation result with the nodes in input order and a name to ID map
+
+        Raises:
+            ValidationError: If the node type or any item is invalid
+        """
+        try:
+            node_type_enum = NodeType(node_type)
+        except ValueError:
+            raise ValidationError(
+                f"Invalid node type '{node_type}'. "
+                f"Must be one of: {', '.join([t.value for t in NodeType])}"
+            )
+
+        rows, env_files = self._prepare_bulk_rows(node_type_enum, items)
+        nodes = await self.db.upsert_nodes_bulk(node_type_enum.value, rows)
+        ids = {node["name"]: node["id"] for node in nodes}
+
+        if node_type_enum == NodeType.ENV:
+            # Existing ENV nodes keep their ID, so write .env files under it
+            names = {row["id"]: row["name"] for row in rows}
+            self._write_env_files(
+                [(ids[names[env_id]], public, secret) for env_id, public, secret in env_files]
+            )
+            nodes = [self._sanitize_env_node(node) for node in nodes]
+
+        logger.info(f"Upserted {len(nodes)} {node_type_enum.value} nodes")
+
+        return {
+            "success": True,
+            "nodes": nodes,
+            "ids": ids,
+            "count": len(nodes),
+            "message": f"{len(nodes)} {node_type_enum.value} node(s) created or updated",
+        }
+
+    async def bulk_load(self, plan: BulkLoadPlan) -> dict[str, Any]:
+        """Create a whole graph of nodes and relationships in one transaction.
+
+        Node data is validated per type like ``create_nodes_bulk``; the
+        database commits everything at once or nothing at all.
+
+        Args:
+            plan: Nodes keyed by type and relationships referencing nodes by name
+
+        Returns:
+            Operation result with created node IDs keyed by name
+
+        Raises:
+            ValidationError: If any node data or the plan itself is invalid
+            NodeAlreadyExistsError: If any node name already exists
+            CircularDependencyError: If the plan's CONTAINS relationships form a cycle
+        """
+        prepared_nodes: dict[NodeType, list[dict[str, Any]]] = {}
+        env_files: list[tuple[str, dict[str, str], dict[str, str]]] = []
+
+        for node_type, items in plan.nodes.items():
+            rows, type_env_files = self._prepare_bulk_rows(node_type, items)
+            prepared_nodes[node_type] = rows
+            env_files.extend(type_env_files)
+
+        ids = await self.db.bulk_load(plan.model_copy(update={"nodes": prepared_nodes}))
+        self._write_env_files(env_files)
+
+        relationship_count = sum(len(edges) for edges in plan.relationships.values())
+        logger.info(f"Bulk loaded {len(ids)} nodes and {relationship_count} relationships")
+
+        return {
+            "success": True,
+            "ids": ids,
+            "node_count": len(ids),
+            "relationship_count": relationship_count,
+            "message": "Bulk load completed successfully",
+        }
+
+    def _prepare_bulk_rows(
+        self, node_type: NodeType, items: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], list[tuple[str, dict[str, str], dict[str, str]]]]:
+        """Validate bulk node data and split ENV secrets out of the stored rows.
+
+        Returns:
+            Tuple of (rows, env_files):
+            - rows: Validated node data ready for the database
+            - env_files: (env_id, public_vars, secret_values) for each ENV row
+        """
+        rows: list[dict[str, Any]] = []
+        env_files: list[tuple[str, dict[str, str], dict[str, str]]] = []
+
+        try:
+            for data in items:
+                if node_type == NodeType.ENV:
+                    public_vars, secret_keys, secret_values = self.secret_detector.extract_secrets(
+                        data.get("variables", {})
+                    )
+                    env_model = EnvNode(
+                        name=data.get("name"),
+                        description=data.get("description", ""),
+                        variables=public_vars,
+                        secret_keys=secret_keys,
+                    )
+                    row = env_model.model_dump(mode="json")
+                    env_files.append((row["id"], public_vars, secret_values))
+                else:
+                    row = self._build_node_data(node_type, data)
+                rows.append(row)
+
+        except PydanticValidationError as e:
+            raise ValidationError(f"Invalid node data: {e}")
+
+        return rows, env_files
+
+    def _write_env_files(self, env_files: list[tuple[str, dict[str, str], dict[str, str]]]) -> None:
+        """Write .env files for ENV nodes created in bulk."""
+        for env_id, public_vars, secret_values in env_files:
+            self.env_manager.write_env_file(env_id, public_vars, secret_values)
+
+    def _build_node_data(self, node_type: NodeType, data: dict[str, Any]) -> dict[str, Any]:
+        """Validate node data against its model and dump it for storage."""
+        if node_type == NodeType.SKILL:
+            node_model = SkillNode(**data)
+        elif node_type == NodeType.KNOWLEDGE:
+            node_model = KnowledgeNode(**data)
+        elif node_type == NodeType.SCRIPT:
+            node_model = ScriptNode(**data)
+        else:
+            raise ValidationError(f"Unknown node type: {node_type}")
+
+        # Use mode="json" to serialize datetime objects to ISO format strings
+        return node_model.model_dump(mode="json")
+
     async def _create(self, node_type: NodeType, data: dict[str, Any]) -> dict[str, Any]:
         """Create a new node."""
         try:
-            # Validate and create appropriate model
-            if node_type == NodeType.SKILL:
-                node_model = SkillNode(**data)
-            elif node_type == NodeType.KNOWLEDGE:
-                node_model = KnowledgeNode(**data)
-            elif node_type == NodeType.SCRIPT:
-                node_model = ScriptNode(**data)
-            elif node_type == NodeType.ENV:
+            if node_type == NodeType.ENV:
                 # Special handling for ENV nodes with secrets
                 return await self._create_env(data)
-            else:
-                raise ValidationError(f"Unknown node type: {node_type}")
 
-            # Convert to dict and create in database
-            # Use mode="json" to serialize datetime objects to ISO format strings
-            node_data = node_model.model_dump(mode="json")
+            # Validate, convert to dict and create in database
+            node_data = self._build_node_data(node_type, data)
             created_node = await self.db.create_node(node_type.value, node_data)
 
             logger.info(f"Created {node_type.value} node: {created_node['id']}")
@@ -188,7 +367,7 @@ class NodesTool:
 
     async def _read(self, node_type: NodeType, node_id: str) -> dict[str, Any]:
         """Read a node by ID."""
-        node = await self.db.read_node(node_id)
+        node = await self.db.read_node(node_id, node_type.value)
 
         if not node:
             raise NodeNotFoundError(node_id, node_type.value)
@@ -207,7 +386,7 @@ class NodesTool:
     ) -> dict[str, Any]:
         """Update an existing node."""
         # Check node exists
-        existing = await self.db.read_node(node_id)
+        existing = await self.db.read_node(node_id, node_type.value)
         if not existing:
             raise NodeNotFoundError(node_id, node_type.value)
 
@@ -216,7 +395,7 @@ class NodesTool:
             return await self._update_env(node_id, data)
 
         # Update node in database
-        updated_node = await self.db.update_node(node_id, data)
+        updated_node = await self.db.update_node(node_id, data, node_type.value)
 
         logger.info(f"Updated {node_type.value} node: {node_id}")
 
@@ -229,7 +408,7 @@ class NodesTool:
     async def _update_env(self, node_id: str, data: dict[str, Any]) -> dict[str, Any]:
         """Update an ENV node with secret handling."""
         # Get existing ENV node
-        existing = await self.db.read_node(node_id)
+        existing = await self.db.read_node(node_id, NodeType.ENV.value)
         if not existing:
             raise NodeNotFoundError(node_id, "ENV")
 
@@ -247,7 +426,7 @@ class NodesTool:
             data["secret_keys"] = secret_keys
 
             # Update database
-            updated_node = await self.db.update_node(node_id, data)
+            updated_node = await self.db.update_node(node_id, data, NodeType.ENV.value)
 
             # Regenerate .env file
             self.env_manager.write_env_file(node_id, public_vars, secret_values)
@@ -267,7 +446,7 @@ class NodesTool:
             }
         else:
             # No variables update, just update other fields
-            updated_node = await self.db.update_node(node_id, data)
+            updated_node = await self.db.update_node(node_id, data, NodeType.ENV.value)
             return {
                 "success": True,
                 "node": self._sanitize_env_node(updated_node),
@@ -283,7 +462,7 @@ class NodesTool:
         if node_type == NodeType.ENV:
             self.env_manager.delete_env_file(node_id)
 
-        deleted = await self.db.delete_node(node_id)
+        deleted = await self.db.delete_node(node_id, node_type.value)
 
         if deleted:
             logger.info(f"Deleted {node_type.value} node: {node_id}")
@@ -306,13 +485,14 @@ class NodesTool:
             filter_model = NodeFilter(**filters)
             filter_dict = filter_model.model_dump(exclude_none=True)
 
-            # Extract limit and offset
+            # Extract pagination parameters
             limit = filter_dict.pop("limit", 100)
             offset = filter_dict.pop("offset", 0)
+            cursor = filter_dict.pop("cursor", None)
 
             # Query database
             nodes = await self.db.list_nodes(
-                node_type.value, filter_dict, limit=limit, offset=offset
+                node_type.value, filter_dict, limit=limit, offset=offset, cursor=cursor
             )
 
             # Sanitize ENV nodes
@@ -325,6 +505,7 @@ class NodesTool:
                 "count": len(nodes),
                 "limit": limit,
                 "offset": offset,
+                "next_cursor": encode_cursor(nodes[-1]) if len(nodes) == limit else None,
             }
 
         except PydanticValidationError as e:
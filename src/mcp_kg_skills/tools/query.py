@@ -6,6 +6,7 @@ from typing import Any
 from ..database.abstract import DatabaseInterface
 from ..exceptions import InvalidQueryError, ValidationError
 from ..security.secrets import SecretDetector
+from ..utils.cypher import find_write_keyword
 
 logger = logging.getLogger(__name__)
 
@@ -104,23 +105,10 @@ class QueryTool:
             - is_readonly: True if query is read-only, False otherwise
             - violation_keyword: The write keyword found, or None if read-only
         """
-        cypher_upper = cypher.upper()
-
-        # List of write operations that are not allowed
-        write_keywords = [
-            "CREATE ",
-            "DELETE ",
-            "REMOVE ",
-            "SET ",
-            "MERGE ",
-            "DETACH ",
-            "DROP ",
-        ]
-
-        for keyword in write_keywords:
-            if keyword in cypher_upper:
-                logger.warning(f"Query contains write keyword: {keyword.strip()}")
-                return False, keyword.strip()
+        keyword = find_write_keyword(cypher)
+        if keyword:
+            logger.warning(f"Query contains write keyword: {keyword}")
+            return False, keyword
 
         return True, None
 
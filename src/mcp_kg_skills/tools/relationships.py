@@ -4,12 +4,9 @@ import logging
 from typing import Any
 
 from ..database.abstract import DatabaseInterface
-from ..exceptions import (
-    CircularDependencyError,
-    NodeNotFoundError,
-    ValidationError,
-)
+from ..exceptions import MCPKGSkillsError, ValidationError
 from ..models import RelationshipType
+from ..utils.pagination import encode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +32,7 @@ class RelationshipsTool:
         rel_id: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """Handle relationship operations.
 
@@ -47,6 +45,7 @@ class RelationshipsTool:
             rel_id: Relationship ID (for delete)
             limit: Maximum results (for list)
             offset: Offset for pagination (for list)
+            cursor: next_cursor of the previous page (for list)
 
         Returns:
             Operation result
@@ -70,7 +69,7 @@ class RelationshipsTool:
         elif operation == "delete":
             return await self._delete(rel_id, source_id, target_id, relationship_type)
         elif operation == "list":
-            return await self._list(source_id, target_id, relationship_type, limit, offset)
+            return await self._list(source_id, target_id, relationship_type, limit, offset, cursor)
 
         raise ValidationError(f"Unhandled operation: {operation}")
 
@@ -99,42 +98,22 @@ class RelationshipsTool:
                 f"Must be one of: {', '.join([t.value for t in RelationshipType])}"
             )
 
-        # Verify source and target nodes exist
-        source_node = await self.db.read_node(source_id)
-        if not source_node:
-            raise NodeNotFoundError(source_id)
+        # Create relationship; the database reports missing endpoints
+        # (NodeNotFoundError) and CONTAINS cycles (CircularDependencyError)
+        relationship = await self.db.create_relationship(
+            rel_type_enum.value,
+            source_id,
+            target_id,
+            properties or {},
+        )
 
-        target_node = await self.db.read_node(target_id)
-        if not target_node:
-            raise NodeNotFoundError(target_id)
+        logger.info(f"Created {rel_type_enum.value} relationship: {source_id} -> {target_id}")
 
-        # Check for circular dependencies if CONTAINS
-        if rel_type_enum == RelationshipType.CONTAINS:
-            if await self.db.check_circular_dependency(source_id, target_id):
-                raise CircularDependencyError(source_id, target_id)
-
-        # Create relationship
-        try:
-            relationship = await self.db.create_relationship(
-                rel_type_enum.value,
-                source_id,
-                target_id,
-                properties or {},
-            )
-
-            logger.info(f"Created {rel_type_enum.value} relationship: {source_id} -> {target_id}")
-
-            return {
-                "success": True,
-                "relationship": relationship,
-                "message": f"{rel_type_enum.value} relationship created successfully",
-            }
-
-        except CircularDependencyError:
-            raise
-        except Exception as e:
-            logger.error(f"Failed to create relationship: {e}")
-            raise
+        return {
+            "success": True,
+            "relationship": relationship,
+            "message": f"{rel_type_enum.value} relationship created successfully",
+        }
 
     async def _delete(
         self,
@@ -194,6 +173,7 @@ class RelationshipsTool:
         relationship_type: str | None,
         limit: int,
         offset: int,
+        cursor: str | None = None,
     ) -> dict[str, Any]:
         """List relationships with filtering."""
         try:
@@ -215,6 +195,7 @@ class RelationshipsTool:
                 rel_type=rel_type_enum.value if rel_type_enum else None,
                 limit=limit,
                 offset=offset,
+                cursor=cursor,
             )
 
             return {
@@ -223,9 +204,13 @@ class RelationshipsTool:
                 "count": len(relationships),
                 "limit": limit,
                 "offset": offset,
+                "next_cursor": (
+                    encode_cursor(relationships[-1]) if len(relationships) == limit else None
+                ),
             }
 
-        except ValidationError:
+        except MCPKGSkillsError:
+            # Already typed (e.g. DatabaseConnectionError); don't relabel it
             raise
         except Exception as e:
             logger.error(f"Failed to list relationships: {e}")
@@ -0,0 +1,81 @@
+"""Helpers for inspecting user-supplied Cypher."""
+
+import re
+
+# String literals, quoted identifiers and comments are matched (and skipped)
+# in the same pass as the write clauses, so text like RETURN "CREATE" or
+# n.created_at is not mistaken for a write.
+_WRITE_SCAN_RE = re.compile(
+    r"""
+    '(?:[^'\\]|\\.)*'
+    | "(?:[^"\\]|\\.)*"
+    | `[^`]*`
+    | //[^\n]*
+    | /\*.*?\*/
+    | \b(CREATE|DELETE|REMOVE|SET|MERGE|DETACH|DROP)\b
+    """,
+    re.IGNORECASE | re.DOTALL | re.VERBOSE,
+)
+
+
+def find_write_keyword(cypher: str) -> str | None:
+    """Find the first write clause in a Cypher query.
+
+    Args:
+        cypher: Cypher query string
+
+    Returns:
+        The write keyword in upper case, or None if the query is read-only
+
+    Examples:
+        >>> find_write_keyword("MATCH (n) DETACH DELETE n")
+        'DETACH'
+        >>> find_write_keyword("MATCH (n) RETURN n.created_at, 'SET' AS label")
+    """
+    for match in _WRITE_SCAN_RE.finditer(cypher):
+        if match.group(1):
+            return match.group(1).upper()
+    return None
+
+
+# Calls whose result can change between two runs of the same query: clock
+# and random functions, APOC and procedure calls (CALL also covers
+# subqueries, which may call procedures themselves). Literals and comments
+# are skipped as in _WRITE_SCAN_RE.
+_VOLATILE_SCAN_RE = re.compile(
+    r"""
+    '(?:[^'\\]|\\.)*'
+    | "(?:[^"\\]|\\.)*"
+    | `[^`]*`
+    | //[^\n]*
+    | /\*.*?\*/
+    | \b(
+        (?:rand|randomUUID|timestamp)\s*\(
+        | (?:date|datetime|localdatetime|localtime|time)(?:\.\w+)?\s*\(
+        | apoc\.[\w.]+
+        | CALL\b
+    )
+    """,
+    re.IGNORECASE | re.DOTALL | re.VERBOSE,
+)
+
+
+def find_volatile_call(cypher: str) -> str | None:
+    """Find the first call that makes a query's result non-deterministic.
+
+    Args:
+        cypher: Cypher query string
+
+    Returns:
+        The matched call (e.g. ``"rand("``), or None if repeating the query
+        against unchanged data gives the same result
+
+    Examples:
+        >>> find_volatile_call("MATCH (n) RETURN n, timestamp() AS t")
+        'timestamp('
+        >>> find_volatile_call("MATCH (n) RETURN n.date, 'rand()' AS label")
+    """
+    for match in _VOLATILE_SCAN_RE.finditer(cypher):
+        if match.group(1):
+            return match.group(1)
+    return None
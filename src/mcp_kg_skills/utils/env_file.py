@@ -2,7 +2,9 @@
 
 import logging
 import os
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 from ..exceptions import EnvFileError
 
@@ -21,6 +23,9 @@ class EnvFileManager:
         self.env_dir = Path(env_dir)
         self.env_dir.mkdir(parents=True, exist_ok=True)
 
+        # env_id -> ((mtime_ns, size, inode), parsed variables)
+        self._read_cache: dict[str, tuple[tuple[int, int, int], Mapping[str, str]]] = {}
+
     def get_env_path(self, env_id: str) -> Path:
         """Get path to .env file for a given ENV node ID.
 
@@ -119,6 +124,37 @@ class EnvFileManager:
         except Exception as e:
             raise EnvFileError(f"Failed to read .env file: {e}", env_id)
 
+    def read_env_file_cached(self, env_id: str) -> Mapping[str, str] | None:
+        """Read environment variables, reusing the last parse if unchanged.
+
+        The file is only parsed again when its mtime, size or inode
+        changes, so repeated executions cost a single stat.
+
+        Args:
+            env_id: ENV node identifier
+
+        Returns:
+            Read-only mapping of environment variables, or None if the
+            .env file doesn't exist
+
+        Raises:
+            EnvFileError: If file read fails
+        """
+        try:
+            stat = self.get_env_path(env_id).stat()
+        except FileNotFoundError:
+            self._read_cache.pop(env_id, None)
+            return None
+
+        version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = self._read_cache.get(env_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        variables = MappingProxyType(self.read_env_file(env_id))
+        self._read_cache[env_id] = (version, variables)
+        return variables
+
     def delete_env_file(self, env_id: str) -> bool:
         """Delete .env file for an ENV node.
 
@@ -132,6 +168,7 @@ class EnvFileManager:
             EnvFileError: If deletion fails
         """
         env_path = self.get_env_path(env_id)
+        self._read_cache.pop(env_id, None)
 
         if not env_path.exists():
             return False
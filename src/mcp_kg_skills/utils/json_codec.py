@@ -0,0 +1,46 @@
+"""JSON encoding helpers with an optional orjson fast path.
+
+orjson is used when installed (``pip install mcp-kg-skills[fast]``);
+otherwise the standard library ``json`` module is used. Both produce
+plain ``str`` output and raise ``json.JSONDecodeError`` subclasses on
+invalid input, so callers don't need to care which one is active.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(value: Any) -> str:
+    """Serialize a value to a JSON string.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def loads(text: str | bytes) -> Any:
+    """Parse a JSON string.
+
+    Args:
+        text: JSON text
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
@@ -0,0 +1,55 @@
+"""Keyset pagination cursors for node and relationship listings.
+
+Listings are ordered by ``(created_at, id)`` newest first. A cursor carries
+that pair for the last item of a page, so the next page can continue
+after it even if the item itself has been deleted in the meantime.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from ..exceptions import ValidationError
+
+_SEPARATOR = "|"
+
+
+def encode_cursor(item: dict[str, Any]) -> str:
+    """Build the cursor that continues a listing after an item.
+
+    Args:
+        item: Last node or relationship of a page; needs ``created_at`` and ``id``
+
+    Returns:
+        Opaque cursor token
+
+    Examples:
+        >>> encode_cursor({"id": "abc", "created_at": "2025-01-01T00:00:00+00:00"})
+        '2025-01-01T00:00:00+00:00|abc'
+    """
+    return f"{item['created_at']}{_SEPARATOR}{item['id']}"
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """Split a cursor into the ``created_at`` and ID it continues after.
+
+    Args:
+        cursor: Token from ``encode_cursor``
+
+    Returns:
+        Tuple of (created_at as stored, ID)
+
+    Raises:
+        ValidationError: If the cursor is malformed
+
+    Examples:
+        >>> decode_cursor("2025-01-01T00:00:00+00:00|abc")
+        ('2025-01-01T00:00:00+00:00', 'abc')
+    """
+    created_at, separator, item_id = cursor.partition(_SEPARATOR)
+    try:
+        datetime.fromisoformat(created_at)
+    except ValueError:
+        separator = ""
+    if not separator or not item_id:
+        raise ValidationError(f"Invalid pagination cursor: '{cursor}'")
+    return created_at, item_id
@@ -10,7 +10,10 @@ from mcp_kg_skills.exceptions import (
     InvalidQueryError,
     NodeAlreadyExistsError,
     NodeNotFoundError,
+    ValidationError,
 )
+from mcp_kg_skills.models import BulkLoadPlan
+from mcp_kg_skills.utils.pagination import encode_cursor
 
 # Check if we're using Neo4j or SQLite
 IS_NEO4J = os.getenv("TEST_DB") == "neo4j"
@@ -39,6 +42,15 @@ class TestDatabaseBasicOperations:
         with pytest.raises(NodeAlreadyExistsError):
             await clean_db.create_node("SKILL", sample_skill_data)
 
+    async def test_create_duplicate_knowledge_raises_error(
+        self, clean_db: DatabaseInterface, sample_knowledge_data
+    ):
+        """Test that KNOWLEDGE names are unique like the other node types."""
+        await clean_db.create_node("KNOWLEDGE", sample_knowledge_data)
+
+        with pytest.raises(NodeAlreadyExistsError):
+            await clean_db.create_node("KNOWLEDGE", {**sample_knowledge_data, "id": "other-id"})
+
     async def test_read_node(self, clean_db: DatabaseInterface, sample_skill_data):
         """Test reading a node by ID."""
         created = await clean_db.create_node("SKILL", sample_skill_data)
@@ -50,6 +62,15 @@ class TestDatabaseBasicOperations:
         assert node["id"] == node_id
         assert node["name"] == sample_skill_data["name"]
 
+    async def test_read_node_with_type(self, clean_db: DatabaseInterface, sample_skill_data):
+        """Test that a typed lookup only matches nodes of that type."""
+        created = await clean_db.create_node("SKILL", sample_skill_data)
+
+        assert (await clean_db.read_node(created["id"], "SKILL"))["id"] == created["id"]
+        assert await clean_db.read_node(created["id"], "SCRIPT") is None
+        assert not await clean_db.delete_node(created["id"], "SCRIPT")
+        assert await clean_db.delete_node(created["id"], "SKILL")
+
     async def test_read_nonexistent_node(self, clean_db: DatabaseInterface):
         """Test reading a node that doesn't exist."""
         node = await clean_db.read_node("nonexistent-id")
@@ -64,6 +85,20 @@ class TestDatabaseBasicOperations:
         assert node is not None
         assert node["name"] == sample_skill_data["name"]
 
+    async def test_read_nodes_by_names(self, clean_db: DatabaseInterface, sample_skill_data):
+        """Test reading several nodes by name in one call."""
+        skill1 = await clean_db.create_node("SKILL", {**sample_skill_data, "name": "skill1"})
+        skill2 = await clean_db.create_node("SKILL", {**sample_skill_data, "name": "skill2"})
+
+        found = await clean_db.read_nodes_by_names("SKILL", ["skill1", "skill2", "missing"])
+
+        assert set(found) == {"skill1", "skill2"}
+        assert found["skill1"]["id"] == skill1["id"]
+
+        by_id = await clean_db.read_nodes_by_ids([skill1["id"], skill2["id"], "missing"])
+        assert set(by_id) == {skill1["id"], skill2["id"]}
+        assert by_id[skill2["id"]]["name"] == "skill2"
+
     async def test_update_node(self, clean_db: DatabaseInterface, sample_skill_data):
         """Test updating a node."""
         created = await clean_db.create_node("SKILL", sample_skill_data)
@@ -91,6 +126,24 @@ class TestDatabaseBasicOperations:
         node = await clean_db.read_node(node_id)
         assert node is None
 
+    async def test_delete_node_removes_relationships(
+        self, clean_db: DatabaseInterface, sample_skill_data
+    ):
+        """Test that deleting a node removes its relationships and the paths through it."""
+        skills = [
+            await clean_db.create_node("SKILL", {**sample_skill_data, "name": f"skill{i}"})
+            for i in range(1, 4)
+        ]
+        s1, s2, s3 = (skill["id"] for skill in skills)
+        await clean_db.create_relationship("CONTAINS", s1, s2)
+        await clean_db.create_relationship("CONTAINS", s2, s3)
+
+        assert await clean_db.delete_node(s2, "SCRIPT") is False
+        assert await clean_db.delete_node(s2, "SKILL") is True
+
+        assert await clean_db.list_relationships() == []
+        assert not await clean_db.check_circular_dependency(s3, s1)
+
     async def test_delete_nonexistent_node(self, clean_db: DatabaseInterface):
         """Test deleting a node that doesn't exist."""
         deleted = await clean_db.delete_node("nonexistent-id")
@@ -136,6 +189,18 @@ class TestDatabaseBasicOperations:
         assert len(nodes) == 2
         assert all("data" in node["name"] for node in nodes)
 
+    async def test_list_nodes_with_name_prefix(self, clean_db: DatabaseInterface):
+        """Test listing nodes with an exact name prefix."""
+        for name in ["data-pipeline", "web-data", "Data-loader"]:
+            await clean_db.create_node(
+                "SKILL",
+                {"name": name, "description": "Test", "body": "Test"},
+            )
+
+        nodes = await clean_db.list_nodes("SKILL", filters={"name_prefix": "data"})
+
+        assert [node["name"] for node in nodes] == ["data-pipeline"]
+
     async def test_list_nodes_pagination(self, clean_db: DatabaseInterface):
         """Test listing nodes with pagination."""
         # Create multiple nodes
@@ -158,6 +223,121 @@ class TestDatabaseBasicOperations:
         page2_ids = {n["id"] for n in page2}
         assert page1_ids.isdisjoint(page2_ids)
 
+    async def test_list_nodes_cursor_pagination(self, clean_db: DatabaseInterface):
+        """Test paging through nodes with a keyset cursor."""
+        for i in range(5):
+            await clean_db.create_node(
+                "SKILL",
+                {"name": f"skill-{i}", "description": "Test", "body": "Test"},
+            )
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = await clean_db.list_nodes("SKILL", limit=2, cursor=cursor)
+            seen.extend(n["id"] for n in page)
+            if len(page) < 2:
+                break
+            cursor = encode_cursor(page[-1])
+
+        all_ids = [n["id"] for n in await clean_db.list_nodes("SKILL")]
+        assert seen == all_ids
+        assert len(seen) == 5
+
+    async def test_list_nodes_cursor_survives_deleted_anchor(self, clean_db: DatabaseInterface):
+        """Test that deleting the cursor's node does not end pagination."""
+        for i in range(5):
+            await clean_db.create_node(
+                "SKILL",
+                {"name": f"skill-{i}", "description": "Test", "body": "Test"},
+            )
+
+        page = await clean_db.list_nodes("SKILL", limit=2)
+        await clean_db.delete_node(page[-1]["id"])
+
+        rest = await clean_db.list_nodes("SKILL", cursor=encode_cursor(page[-1]))
+        assert len(rest) == 3
+
+    async def test_list_cursor_rejects_malformed(self, clean_db: DatabaseInterface):
+        """Test that malformed cursors raise ValidationError."""
+        with pytest.raises(ValidationError):
+            await clean_db.list_nodes("SKILL", cursor="not-a-cursor")
+        with pytest.raises(ValidationError):
+            await clean_db.list_relationships(cursor="2025-01-01T00:00:00+00:00|abc")
+
+    async def test_list_nodes_columnar(self, clean_db: DatabaseInterface):
+        """Test exporting selected node fields as columns."""
+        first = await clean_db.create_node(
+            "ENV", {"name": "env1", "description": "First", "variables": {"A": "1"}}
+        )
+        second = await clean_db.create_node(
+            "ENV", {"name": "env2", "description": "Second", "variables": {}}
+        )
+
+        columns = await clean_db.list_nodes_columnar("ENV", ["id", "name", "variables", "missing"])
+
+        # Newest first, as in list_nodes
+        assert columns["id"] == [second["id"], first["id"]]
+        assert columns["name"] == ["env2", "env1"]
+        assert columns["variables"] == [{}, {"A": "1"}]
+        assert columns["missing"] == [None, None]
+
+        assert await clean_db.list_nodes_columnar("SKILL", ["id", "name"]) == {
+            "id": [],
+            "name": [],
+        }
+
+    async def test_create_nodes_bulk(self, clean_db: DatabaseInterface):
+        """Test creating several nodes in one call."""
+        rows = [
+            {"id": f"bulk-{i}", "name": f"skill-{i}", "description": "Test", "body": "Test"}
+            for i in range(3)
+        ]
+
+        nodes = await clean_db.create_nodes_bulk("SKILL", rows)
+
+        assert [n["name"] for n in nodes] == ["skill-0", "skill-1", "skill-2"]
+        assert all(n["created_at"] is not None for n in nodes)
+
+        node = await clean_db.read_node_by_name("SKILL", "skill-1")
+        assert node is not None
+        assert node["id"] == "bulk-1"
+
+    async def test_create_nodes_bulk_duplicate_is_atomic(
+        self, clean_db: DatabaseInterface, sample_skill_data
+    ):
+        """Test that a name collision in a bulk create creates no nodes."""
+        await clean_db.create_node("SKILL", sample_skill_data)
+
+        with pytest.raises(NodeAlreadyExistsError):
+            await clean_db.create_nodes_bulk(
+                "SKILL",
+                [
+                    {"id": "new-1", "name": "new-skill", "description": "Test", "body": "Test"},
+                    {"id": "dup-1", **sample_skill_data},
+                ],
+            )
+
+        assert await clean_db.read_node_by_name("SKILL", "new-skill") is None
+
+    async def test_upsert_nodes_bulk(self, clean_db: DatabaseInterface, sample_skill_data):
+        """Test that upserting by name updates existing nodes and creates new ones."""
+        existing = await clean_db.create_node("SKILL", sample_skill_data)
+
+        nodes = await clean_db.upsert_nodes_bulk(
+            "SKILL",
+            [
+                {"id": "ignored", **sample_skill_data, "description": "Updated"},
+                {"id": "new-1", "name": "new-skill", "description": "New", "body": "Test"},
+            ],
+        )
+
+        assert [n["id"] for n in nodes] == [existing["id"], "new-1"]
+        node = await clean_db.read_node_by_name("SKILL", sample_skill_data["name"])
+        assert node["id"] == existing["id"]
+        assert node["description"] == "Updated"
+        assert await clean_db.read_node_by_name("SKILL", "new-skill") is not None
+
 
 @pytest.mark.asyncio
 class TestRelationships:
@@ -210,6 +390,32 @@ class TestRelationships:
         with pytest.raises(CircularDependencyError):
             await clean_db.create_relationship("CONTAINS", skill3["id"], skill1["id"])
 
+    async def test_cycle_check_after_relationship_delete(
+        self, clean_db: DatabaseInterface, sample_skill_data
+    ):
+        """Test that removing a CONTAINS edge only drops paths that ran through it."""
+        # Diamond: skill1 -> skill2 -> skill4 and skill1 -> skill3 -> skill4
+        skills = [
+            await clean_db.create_node("SKILL", {**sample_skill_data, "name": f"skill{i}"})
+            for i in range(1, 5)
+        ]
+        s1, s2, s3, s4 = (skill["id"] for skill in skills)
+
+        await clean_db.create_relationship("CONTAINS", s1, s2)
+        await clean_db.create_relationship("CONTAINS", s1, s3)
+        rel_24 = await clean_db.create_relationship("CONTAINS", s2, s4)
+        rel_34 = await clean_db.create_relationship("CONTAINS", s3, s4)
+
+        # skill1 still reaches skill4 through skill3
+        await clean_db.delete_relationship(rel_24["id"])
+        assert await clean_db.check_circular_dependency(s4, s1)
+        assert not await clean_db.check_circular_dependency(s4, s2)
+
+        # With the last path gone the reverse edge is allowed
+        await clean_db.delete_relationship(rel_34["id"])
+        assert not await clean_db.check_circular_dependency(s4, s1)
+        assert await clean_db.create_relationship("CONTAINS", s4, s1) is not None
+
     async def test_relate_to_allows_cycles(self, clean_db: DatabaseInterface, sample_skill_data):
         """Test that RELATE_TO relationships can form cycles."""
         skill1 = await clean_db.create_node("SKILL", {**sample_skill_data, "name": "skill1"})
@@ -222,6 +428,65 @@ class TestRelationships:
         assert rel1 is not None
         assert rel2 is not None
 
+    async def test_create_relationships_bulk(
+        self, clean_db: DatabaseInterface, sample_skill_data, sample_script_data
+    ):
+        """Test creating several relationships in one call."""
+        skill = await clean_db.create_node("SKILL", sample_skill_data)
+        script1 = await clean_db.create_node("SCRIPT", {**sample_script_data, "name": "script1"})
+        script2 = await clean_db.create_node("SCRIPT", {**sample_script_data, "name": "script2"})
+
+        created = await clean_db.create_relationships_bulk(
+            "CONTAINS",
+            [(skill["id"], script1["id"], None), (skill["id"], script2["id"], {"order": 2})],
+        )
+
+        assert created == 2
+        connected = await clean_db.get_connected_nodes(
+            skill["id"], rel_type="CONTAINS", direction="outgoing"
+        )
+        assert {n["name"] for n in connected} == {"script1", "script2"}
+
+    async def test_create_relationships_bulk_merge(
+        self, clean_db: DatabaseInterface, sample_skill_data, sample_script_data
+    ):
+        """Test that merging skips relationships that already exist."""
+        skill = await clean_db.create_node("SKILL", sample_skill_data)
+        script = await clean_db.create_node("SCRIPT", sample_script_data)
+        edges = [(skill["id"], script["id"], None)]
+
+        await clean_db.create_relationships_bulk("CONTAINS", edges, merge=True)
+        await clean_db.create_relationships_bulk("CONTAINS", edges, merge=True)
+
+        relationships = await clean_db.list_relationships(source_id=skill["id"])
+        assert len(relationships) == 1
+
+    async def test_create_relationships_bulk_cycle_is_atomic(
+        self, clean_db: DatabaseInterface, sample_skill_data, sample_script_data
+    ):
+        """Test that a cycle through existing and new edges creates nothing."""
+        skill = await clean_db.create_node("SKILL", sample_skill_data)
+        script1 = await clean_db.create_node("SCRIPT", {**sample_script_data, "name": "script1"})
+        script2 = await clean_db.create_node("SCRIPT", {**sample_script_data, "name": "script2"})
+        await clean_db.create_relationship("CONTAINS", skill["id"], script1["id"])
+
+        with pytest.raises(CircularDependencyError):
+            await clean_db.create_relationships_bulk(
+                "CONTAINS",
+                [(script1["id"], script2["id"], None), (script2["id"], skill["id"], None)],
+            )
+
+        assert await clean_db.get_connected_nodes(script1["id"], direction="outgoing") == []
+
+    async def test_create_relationships_bulk_nonexistent_node(
+        self, clean_db: DatabaseInterface, sample_skill_data
+    ):
+        """Test that a missing endpoint raises NodeNotFoundError."""
+        skill = await clean_db.create_node("SKILL", sample_skill_data)
+
+        with pytest.raises(NodeNotFoundError):
+            await clean_db.create_relationships_bulk("CONTAINS", [(skill["id"], "missing", None)])
+
     async def test_list_relationships(
         self, clean_db: DatabaseInterface, sample_skill_data, sample_script_data
     ):
@@ -287,6 +552,131 @@ class TestRelationships:
         assert len(connected) == 2
         assert all(n["name"] in ["script1", "script2"] for n in connected)
 
+        limited = await clean_db.get_connected_nodes(
+            skill["id"], rel_type="CONTAINS", direction="outgoing", limit=1
+        )
+        assert len(limited) == 1
+
+    async def test_get_connected_nodes_both_directions(
+        self, clean_db: DatabaseInterface, sample_skill_data, sample_script_data
+    ):
+        """Test that both directions return each neighbour once."""
+        skill1 = await clean_db.create_node("SKILL", {**sample_skill_data, "name": "skill1"})
+        skill2 = await clean_db.create_node("SKILL", {**sample_skill_data, "name": "skill2"})
+        script = await clean_db.create_node("SCRIPT", sample_script_data)
+
+        await clean_db.create_relationship("CONTAINS", skill1["id"], script["id"])
+        await clean_db.create_relationship("RELATE_TO", skill1["id"], skill2["id"])
+        await clean_db.create_relationship("RELATE_TO", skill2["id"], skill1["id"])
+
+        connected = await clean_db.get_connected_nodes(skill1["id"], direction="both")
+        assert sorted(n["id"] for n in connected) == sorted([skill2["id"], script["id"]])
+
+        related = await clean_db.get_connected_nodes(
+            skill1["id"], rel_type="RELATE_TO", direction="both"
+        )
+        assert [n["id"] for n in related] == [skill2["id"]]
+
+    async def test_repeated_reads_see_writes(
+        self, clean_db: DatabaseInterface, sample_skill_data, sample_script_data
+    ):
+        """Test that repeated reads reflect node and relationship writes in between."""
+        skill = await clean_db.create_node("SKILL", sample_skill_data)
+        script = await clean_db.create_node("SCRIPT", sample_script_data)
+        rel = await clean_db.create_relationship("CONTAINS", skill["id"], script["id"])
+
+        assert len(await clean_db.get_connected_nodes(skill["id"])) == 1
+        await clean_db.read_node(script["id"])
+
+        await clean_db.update_node(script["id"], {"description": "Changed"})
+        assert (await clean_db.read_node(script["id"]))["description"] == "Changed"
+        connected = await clean_db.get_connected_nodes(skill["id"])
+        assert connected[0]["description"] == "Changed"
+
+        await clean_db.delete_relationship(rel["id"])
+        assert await clean_db.get_connected_nodes(skill["id"]) == []
+
+        await clean_db.delete_node(script["id"])
+        assert await clean_db.read_node(script["id"]) is None
+
+    async def test_reads_return_independent_copies(self, clean_db: DatabaseInterface):
+        """Test that mutating a returned node leaves later reads untouched."""
+        env = await clean_db.create_node(
+            "ENV", {"name": "test-env", "variables": {"HOST": "localhost"}, "secret_keys": []}
+        )
+        skill = await clean_db.create_node("SKILL", {"name": "s", "description": "d", "body": "b"})
+        await clean_db.create_relationship("CONTAINS", skill["id"], env["id"])
+
+        (await clean_db.read_node(env["id"]))["variables"]["HOST"] = "changed"
+        (await clean_db.get_connected_nodes(skill["id"]))[0]["secret_keys"].append("HOST")
+
+        assert (await clean_db.read_node(env["id"]))["variables"] == {"HOST": "localhost"}
+        assert (await clean_db.get_connected_nodes(skill["id"]))[0]["secret_keys"] == []
+
+
+@pytest.mark.asyncio
+class TestBulkLoad:
+    """Test single-transaction bulk loading."""
+
+    @staticmethod
+    def _plan(contains: list[tuple[str, str, dict | None]]) -> BulkLoadPlan:
+        return BulkLoadPlan(
+            nodes={
+                "SKILL": [
+                    {"id": "skill-1", "name": "skill1", "description": "Test", "body": "Test"},
+                ],
+                "SCRIPT": [
+                    {
+                        "id": "script-1",
+                        "name": "script1",
+                        "description": "Test",
+                        "function_signature": "f() -> None",
+                        "body": "def f(): pass",
+                    },
+                ],
+            },
+            relationships={"CONTAINS": contains},
+        )
+
+    async def test_bulk_load(self, clean_db: DatabaseInterface):
+        """Test that nodes and relationships are created together."""
+        ids = await clean_db.bulk_load(self._plan([("skill1", "script1", None)]))
+
+        assert ids == {"skill1": "skill-1", "script1": "script-1"}
+        assert (await clean_db.read_node_by_name("SCRIPT", "script1"))["id"] == "script-1"
+
+        connected = await clean_db.get_connected_nodes(
+            "skill-1", rel_type="CONTAINS", direction="outgoing"
+        )
+        assert [n["name"] for n in connected] == ["script1"]
+
+    async def test_bulk_load_cycle_raises_error(self, clean_db: DatabaseInterface):
+        """Test that a CONTAINS cycle within the plan is rejected."""
+        plan = self._plan([("skill1", "script1", None), ("script1", "skill1", None)])
+
+        with pytest.raises(CircularDependencyError):
+            await clean_db.bulk_load(plan)
+
+        assert await clean_db.read_node_by_name("SKILL", "skill1") is None
+
+    async def test_bulk_load_unknown_name_raises_error(self, clean_db: DatabaseInterface):
+        """Test that relationships must reference nodes in the plan."""
+        with pytest.raises(ValidationError):
+            await clean_db.bulk_load(self._plan([("skill1", "missing", None)]))
+
+    async def test_bulk_load_duplicate_is_atomic(
+        self, clean_db: DatabaseInterface, sample_script_data
+    ):
+        """Test that a name collision with an existing node creates nothing."""
+        await clean_db.create_node("SCRIPT", {**sample_script_data, "name": "script1"})
+
+        with pytest.raises(NodeAlreadyExistsError) as exc_info:
+            await clean_db.bulk_load(self._plan([("skill1", "script1", None)]))
+
+        assert exc_info.value.name == "script1"
+        assert exc_info.value.node_type == "SCRIPT"
+        assert await clean_db.read_node_by_name("SKILL", "skill1") is None
+
 
 @pytest.mark.asyncio
 class TestQueryExecution:
@@ -5,6 +5,7 @@ import os
 import pytest
 
 from mcp_kg_skills.database.abstract import DatabaseInterface
+from mcp_kg_skills.exceptions import ScriptExecutionError
 from mcp_kg_skills.execution.runner import ScriptRunner
 from mcp_kg_skills.security.secrets import SecretDetector
 from mcp_kg_skills.tools.env import EnvTool
@@ -450,6 +451,47 @@ def raise_error():
         assert result["return_code"] != 0
         assert "ValueError" in result["stderr"] or "ValueError" in result["stdout"]
 
+    async def test_composite_script_reused_until_script_changes(
+        self, clean_db: DatabaseInterface, script_runner: ScriptRunner
+    ):
+        """Test repeated runs reuse the composite script and edits invalidate it."""
+        script = await clean_db.create_node(
+            "SCRIPT",
+            {
+                "name": "answer",
+                "description": "Return the answer",
+                "function_signature": "answer() -> int",
+                "body": "def answer() -> int:\n    return 42\n",
+            },
+        )
+
+        for _ in range(2):
+            result = await script_runner.execute(code="print(answer())", imports=["answer"])
+            assert result["stdout"].strip() == "42"
+        assert len(list(script_runner.cache_dir.glob("composite_*.py"))) == 1
+
+        await clean_db.update_node(script["id"], {"body": "def answer() -> int:\n    return 43\n"})
+        result = await script_runner.execute(code="print(answer())", imports=["answer"])
+
+        assert result["stdout"].strip() == "43"
+        assert len(list(script_runner.cache_dir.glob("composite_*.py"))) == 2
+
+    async def test_composite_cache_evicts_least_recently_used(
+        self, clean_db: DatabaseInterface, script_runner: ScriptRunner
+    ):
+        """Test the composite cache keeps at most composite_cache_size scripts."""
+        script_runner.composite_cache_size = 2
+
+        for code in ("print(1)", "print(2)", "print(1)", "print(3)"):
+            result = await script_runner.execute(code=code)
+            assert result["success"] is True
+
+        cached = {
+            path.read_text().split("# User Code\n")[1].strip()
+            for path in script_runner.cache_dir.glob("composite_*.py")
+        }
+        assert cached == {"print(1)", "print(3)"}
+
     async def test_timeout_handling(self, clean_db: DatabaseInterface, script_runner: ScriptRunner):
         """Test that script execution respects timeout."""
         script_data = {
@@ -480,6 +522,17 @@ def slow_func():
                 timeout=2,  # Short timeout
             )
 
+    async def test_venv_build_timeout_is_not_remembered(
+        self, clean_db: DatabaseInterface, script_runner: ScriptRunner, sample_script_with_deps_data
+    ):
+        """Test that running out of time while building a venv is not a build failure."""
+        await clean_db.create_node("SCRIPT", sample_script_with_deps_data)
+
+        with pytest.raises(ScriptExecutionError, match="timed out"):
+            await script_runner.execute(code="pass", imports=["fetch_data"], timeout=0.01)
+
+        assert script_runner._venv_failures == {}
+
 
 @pytest.mark.asyncio
 class TestComplexWorkflows:
@@ -0,0 +1,53 @@
+"""Unit tests for Cypher inspection helpers."""
+
+from mcp_kg_skills.utils.cypher import find_volatile_call, find_write_keyword
+
+
+class TestFindWriteKeyword:
+    """Tests for find_write_keyword."""
+
+    def test_detects_write_clauses(self):
+        """Test that write clauses are reported."""
+        assert find_write_keyword("CREATE (n:TEST) RETURN n") == "CREATE"
+        assert find_write_keyword("MATCH (n) detach delete n") == "DETACH"
+        assert find_write_keyword("MATCH (n)\nSET n.prop = 'value'") == "SET"
+
+    def test_allows_read_queries(self):
+        """Test that plain read queries pass."""
+        assert find_write_keyword("MATCH (n:SKILL) RETURN n.name LIMIT 10") is None
+
+    def test_ignores_keywords_inside_identifiers(self):
+        """Test that properties like created_at and clauses like OFFSET pass."""
+        query = "MATCH (n) RETURN n ORDER BY n.created_at DESC SKIP 5"
+        assert find_write_keyword(query) is None
+        assert find_write_keyword("MATCH (n) RETURN n.reset_count") is None
+
+    def test_ignores_literals_and_comments(self):
+        """Test that keywords inside strings and comments are not writes."""
+        assert find_write_keyword("RETURN 'CREATE' AS a, \"DELETE\" AS b") is None
+        assert find_write_keyword("MATCH (n) // SET n.x = 1\nRETURN n") is None
+        assert find_write_keyword("MATCH (n) /* MERGE */ RETURN n.`set`") is None
+        assert find_write_keyword("RETURN 'it\\'s' AS a, 1 AS b; DROP INDEX x") == "DROP"
+
+
+class TestFindVolatileCall:
+    """Tests for find_volatile_call."""
+
+    def test_detects_clock_and_random_functions(self):
+        """Test that clock and random functions are reported."""
+        assert find_volatile_call("RETURN timestamp() AS t") == "timestamp("
+        assert find_volatile_call("MATCH (n) RETURN n, rand() AS r") == "rand("
+        assert find_volatile_call("RETURN randomUUID()") == "randomUUID("
+        assert find_volatile_call("RETURN datetime.realtime() AS now") == "datetime.realtime("
+
+    def test_detects_procedures(self):
+        """Test that APOC functions and procedure calls are reported."""
+        assert find_volatile_call("RETURN apoc.create.uuid() AS id") == "apoc.create.uuid"
+        assert find_volatile_call("CALL db.labels() YIELD label RETURN label") == "CALL"
+        assert find_volatile_call("MATCH (n) CALL { RETURN 1 AS x } RETURN n, x") == "CALL"
+
+    def test_allows_deterministic_queries(self):
+        """Test that plain reads and lookalike properties and literals pass."""
+        assert find_volatile_call("MATCH (n:SKILL) RETURN n.name LIMIT 10") is None
+        assert find_volatile_call("MATCH (n) RETURN n.timestamp, n.created_at") is None
+        assert find_volatile_call("RETURN 'rand()' AS a // timestamp()") is None
@@ -1,9 +1,11 @@
 """Unit tests for PEP 723 dependency parser."""
 
+import tomllib
+
 import pytest
 
 from mcp_kg_skills.exceptions import DependencyParseError
-from mcp_kg_skills.execution.dependency import PEP723Parser
+from mcp_kg_skills.execution.dependency import PEP723Parser, _parse_simple_metadata
 
 
 class TestPEP723Parser:
@@ -29,6 +31,14 @@ def hello():
 """
         assert not PEP723Parser.has_metadata(script)
 
+    def test_has_metadata_requires_own_line(self):
+        """Test that the block marker only counts on a line of its own."""
+        script = """MARKER = "# /// script"
+END = "# ///"
+"""
+        assert not PEP723Parser.has_metadata(script)
+        assert PEP723Parser.parse_metadata(script) is None
+
     def test_parse_metadata(self):
         """Test parsing valid metadata block."""
         script = """# /// script
@@ -62,6 +72,18 @@ import requests
         with pytest.raises(DependencyParseError):
             PEP723Parser.parse_metadata(script)
 
+    def test_parse_metadata_results_are_independent(self):
+        """Test that repeated parses of one script don't share mutable results."""
+        script = """# /// script
+# dependencies = ["requests>=2.31.0"]
+# ///
+"""
+        PEP723Parser.parse_metadata(script)["dependencies"].append("pandas")
+        PEP723Parser.extract_dependencies(script).append("numpy")
+
+        assert PEP723Parser.parse_metadata(script) == {"dependencies": ["requests>=2.31.0"]}
+        assert PEP723Parser.extract_dependencies(script) == ["requests>=2.31.0"]
+
     def test_extract_dependencies(self):
         """Test extracting dependency list."""
         script = """# /// script
@@ -201,6 +223,33 @@ def hello():
         assert "# ///" not in result
         assert "def hello():" in result
 
+    def test_simple_metadata_matches_tomllib(self):
+        """Test the common-case parser agrees with tomllib or defers to it."""
+        simple = 'requires-python = ">=3.12"\ndependencies = [\n  "requests",\n  "rich>=13",\n]\n'
+        assert _parse_simple_metadata(simple) == tomllib.loads(simple)
+
+        for block in (
+            'dependencies = ["a"]\n[tool.uv]\nexclude-newer = "2024-01-01"\n',
+            'dependencies = [\n  "a",  # pinned\n]\n',
+            'dependencies = ["a"]\ndependencies = ["b"]\n',
+            'requires-python = ["3.12"]\n',
+        ):
+            assert _parse_simple_metadata(block) is None
+
+    def test_split_metadata(self):
+        """Test splitting a script into its code and metadata."""
+        script = """# /// script
+# dependencies = ["requests"]
+# ///
+
+import requests
+"""
+        code, metadata = PEP723Parser.split_metadata(script)
+
+        assert metadata == {"dependencies": ["requests"]}
+        assert code == PEP723Parser._remove_metadata_block(script)
+        assert PEP723Parser.split_metadata(code) == (code, None)
+
     def test_parse_multiline_dependencies(self):
         """Test parsing dependencies with different formatting."""
         script = """# /// script
@@ -0,0 +1,28 @@
+"""Unit tests for environment file management."""
+
+from mcp_kg_skills.utils.env_file import EnvFileManager
+
+
+class TestReadEnvFileCached:
+    """Tests for cached .env reads."""
+
+    def test_missing_file(self, env_manager: EnvFileManager):
+        """Test that a missing .env file reads as None."""
+        assert env_manager.read_env_file_cached("missing") is None
+
+    def test_reuses_parse_until_file_changes(self, env_manager: EnvFileManager):
+        """Test that unchanged files are not parsed again and edits are seen."""
+        env_manager.write_env_file("env-1", {"HOST": "localhost"})
+
+        first = env_manager.read_env_file_cached("env-1")
+        assert first == {"HOST": "localhost"}
+        assert env_manager.read_env_file_cached("env-1") is first
+
+        env_manager.write_env_file("env-1", {"HOST": "db.example.com", "PORT": "5432"})
+        assert env_manager.read_env_file_cached("env-1") == {
+            "HOST": "db.example.com",
+            "PORT": "5432",
+        }
+
+        env_manager.delete_env_file("env-1")
+        assert env_manager.read_env_file_cached("env-1") is None
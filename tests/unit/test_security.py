@@ -2,7 +2,13 @@
 
 import pytest
 
-from mcp_kg_skills.security.secrets import SecretDetector, extract_secrets, is_secret
+from mcp_kg_skills.config import SecurityConfig
+from mcp_kg_skills.security.secrets import (
+    SecretDetector,
+    SecretValues,
+    extract_secrets,
+    is_secret,
+)
 
 
 class TestSecretDetector:
@@ -35,6 +41,36 @@ class TestSecretDetector:
         assert detector.is_secret("MY_PRIVATE")
         assert not detector.is_secret("NORMAL_VALUE")
 
+    def test_config_patterns(self):
+        """Test secret detection with the glob patterns from SecurityConfig."""
+        config = SecurityConfig()
+        detector = SecretDetector(config.secret_matcher)
+
+        assert detector.is_secret("SECRET_VALUE")
+        assert detector.is_secret("MY_SECRET")
+        assert detector.is_secret("db_password")
+        assert detector.is_secret("API_KEY")
+        assert detector.is_secret("AUTH_TOKEN")
+        assert not detector.is_secret("DATABASE_HOST")
+        assert not detector.is_secret("MY_SECRET_HOST")
+
+        assert config.match("GITHUB_TOKEN")
+        assert not config.match("LOG_LEVEL")
+
+    def test_config_matcher_uses_literal_affixes(self):
+        """Test that plain glob patterns become prefix/suffix checks."""
+        config = SecurityConfig()
+        matcher = config.secret_matcher
+
+        assert "_KEY" in matcher.suffixes
+        assert "SECRET_" in matcher.prefixes
+        assert matcher.regex is None
+
+        detector = SecretDetector(matcher)
+        assert detector.is_secret("my_api_key")
+        assert detector.is_secret("PRIVATE_KEY_PATH")
+        assert not detector.is_secret("KEYBOARD_LAYOUT")
+
     def test_extract_secrets(self):
         """Test separating public and secret variables."""
         detector = SecretDetector()
@@ -109,6 +145,35 @@ class TestSecretDetector:
         sanitized = detector.sanitize_output(output.replace("output", "actual_secret"), secrets)
         assert "<REDACTED>" in sanitized
 
+    def test_sanitize_chunk_across_boundaries(self):
+        """Test streamed sanitization matches sanitizing the whole output."""
+        detector = SecretDetector()
+        secrets = ["secret123", "api-key-xyz"]
+        output = "pw=secret123 key=api-key-xyz again secret123!" * 3
+
+        for size in (1, 4, 9, 50):
+            parts = []
+            tail = ""
+            for i in range(0, len(output), size):
+                sanitized, tail = detector.sanitize_chunk(tail + output[i : i + size], secrets)
+                parts.append(sanitized)
+            parts.append(detector.sanitize_chunk(tail, secrets, final=True)[0])
+
+            assert "".join(parts) == detector.sanitize_output(output, secrets)
+
+    def test_sanitize_with_compiled_secrets(self):
+        """Test that precompiled SecretValues sanitize like the raw list."""
+        detector = SecretDetector()
+        compiled = SecretValues.from_values(["secret123", "", "api-key-xyz"])
+
+        assert compiled.longest == len("api-key-xyz")
+        assert detector.sanitize_output("pw=secret123", compiled) == "pw=<REDACTED>"
+        assert detector.sanitize_chunk("key=api-key-xyz", compiled, final=True) == (
+            "key=<REDACTED>",
+            "",
+        )
+        assert SecretValues.from_values([""]).pattern is None
+
     def test_sanitize_dict(self):
         """Test recursively sanitizing dictionaries."""
         detector = SecretDetector()